@@ -1,6 +1,8 @@
 from django.contrib import admin
 from django.db.models import Prefetch
 
+from adjfeedback.aggregates import update_feedback_aggregates_from_sources
+from draw.admin import DrawCacheVersionAdminMixin
 from draw.models import DebateTeam
 from utils.admin import ModelAdmin
 
@@ -10,10 +12,16 @@ from .models import (AdjudicatorAdjudicatorConflict, AdjudicatorInstitutionConfl
 
 
 @admin.register(DebateAdjudicator)
-class DebateAdjudicatorAdmin(ModelAdmin):
+class DebateAdjudicatorAdmin(DrawCacheVersionAdminMixin, ModelAdmin):
     list_display = ('debate', 'adjudicator', 'type')
     search_fields = ('adjudicator__name', 'type')
     raw_id_fields = ('debate',)
+    round_lookup = 'debate__debateadjudicator'
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if change and 'type' in form.changed_data:
+            update_feedback_aggregates_from_sources([obj])
 
     def get_queryset(self, request):
         # can't use list_select_related class attribute, because DebateAdjudicatorManager
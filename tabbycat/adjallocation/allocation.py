@@ -196,10 +196,24 @@ class AdjudicatorAllocation:
         self.trainees = []
 
     def save(self):
-        self.container.related_adjudicator_set.exclude(adjudicator__in=self.all()).delete()
+        related_adjudicators = self.container.related_adjudicator_set
+        related_adjudicators.exclude(adjudicator__in=self.all()).delete()
+        existing = {da.adjudicator_id: da for da in related_adjudicators.all()}
+
+        retyped = []
         for adj, t in self.with_debateadj_types():
             if not adj:
                 continue
-            _, created = self.container.related_adjudicator_set.update_or_create(
-                    adjudicator=adj, defaults={'type': t})
-            logger.debug("%s: %s, %s, %s", "Created" if created else "Updated", self.container, adj, t)
+            debateadj = existing.get(adj.id)
+            if debateadj is None:
+                related_adjudicators.create(adjudicator=adj, type=t)
+                logger.debug("Created: %s, %s, %s", self.container, adj, t)
+            elif debateadj.type != t:
+                debateadj.type = t
+                debateadj.save()
+                retyped.append(debateadj)
+                logger.debug("Updated: %s, %s, %s", self.container, adj, t)
+
+        if retyped and related_adjudicators.model is DebateAdjudicator:
+            from adjfeedback.aggregates import update_feedback_aggregates_from_sources
+            update_feedback_aggregates_from_sources(retyped)
@@ -5,6 +5,15 @@ from math import exp
 from django.utils.translation import gettext as _, ngettext
 from munkres import Munkres
 
+from participants.prefetch import populate_feedback_scores
+
+try:
+    import numpy as np
+    from scipy.optimize import linear_sum_assignment
+except ImportError:
+    np = None
+    linear_sum_assignment = None
+
 from .base import AdjudicatorAllocationError, BaseAdjudicatorAllocator, register
 from ..allocation import AdjudicatorAllocation
 
@@ -27,6 +36,11 @@ class BaseHungarianAllocator(BaseAdjudicatorAllocator):
         self.feedback_weight = self.round.feedback_weight
         self.user_warnings = []  # Surfaced to users for non-error disclosures
 
+        self.assignment_method = t.pref('adj_assignment_method')
+        if self.assignment_method == 'lsa' and linear_sum_assignment is None:
+            logger.warning("SciPy isn't installed, falling back to Hungarian algorithm")
+            self.assignment_method = 'hungarian'
+
         self.munkres = Munkres()
 
     def allocate(self):
@@ -37,6 +51,7 @@ class BaseHungarianAllocator(BaseAdjudicatorAllocator):
         score_min = self.min_score
         score_range = self.max_score - score_min
 
+        populate_feedback_scores(adjudicators)
         for adj in adjudicators:
             adj._weighted_score = adj.weighted_score(self.feedback_weight)  # used in min_voting_score filter
             try:
@@ -85,19 +100,61 @@ class BaseHungarianAllocator(BaseAdjudicatorAllocator):
 
         return cost
 
+    def calc_cost_array(self, positions, adjs):
+        """Vectorised equivalent of `calc_cost()`. `positions` is a list of
+        `(debate, adjustment, chair)` tuples. Returns a NumPy array with one row
+        per position and one column per adjudicator."""
+
+        columns = {adj.id: j for j, adj in enumerate(adjs)}
+        scores = np.array([adj._normalized_score for adj in adjs], dtype=float)
+        impts = np.array([debate.importance + 3 + adjustment for debate, adjustment, chair in positions], dtype=float)
+
+        diff = 5 + impts[:, np.newaxis] - scores
+        costs = np.where(diff > 0.25, 1000 * np.exp(diff - 0.25), 0.0)
+        costs += self.max_score - scores
+
+        def penalise(i, adj_ids, penalty):
+            cols = [columns[adj_id] for adj_id in adj_ids if adj_id in columns]
+            costs[i, cols] += penalty
+
+        for i, (debate, adjustment, chair) in enumerate(positions):
+            for team in debate.teams:
+                penalise(i, self.conflicts.conflicting_adjs_team(team), self.conflict_penalty)
+                penalise(i, self.history.seen_adjs_team(team), self.history_penalty)
+            if chair:
+                penalise(i, self.conflicts.conflicting_adjs_adj(chair), self.conflict_penalty)
+                penalise(i, self.history.seen_adjs_adj(chair), self.history_penalty)
+
+        return costs
+
+    def build_cost_matrix(self, positions, adjs):
+        """Returns the cost matrix for assigning `adjs` to `positions`, a list
+        of `(debate, adjustment, chair)` tuples. With the linear sum assignment
+        method, this is a NumPy array; otherwise, it is a list of lists."""
+        if self.assignment_method == 'lsa':
+            return self.calc_cost_array(positions, adjs)
+        return [[self.calc_cost(debate, adj, adjustment, chair) for adj in adjs]
+                for debate, adjustment, chair in positions]
+
+    def solve_assignment(self, cost_matrix):
+        """Solves the assignment problem presented by `cost_matrix`. Returns a
+        list of indices (row, col) describing the optimal assignment, sorted
+        by row."""
+        if self.assignment_method == 'lsa':
+            rows, cols = linear_sum_assignment(cost_matrix)
+            return [(int(i), int(j)) for i, j in zip(rows, cols)]
+        return self.munkres.compute(cost_matrix)
+
     def allocate_trainees(self, trainees, allocation, debates):
         if len(trainees) > 0 and len(debates) > 0:
             allocation_by_debate = {aa.container: aa for aa in allocation}
 
             logger.info("costing trainees")
-            cost_matrix = []
-            for debate in debates:
-                chair = allocation_by_debate[debate].chair
-                row = [self.calc_cost(debate, adj, adjustment=-2.0, chair=chair) for adj in trainees]
-                cost_matrix.append(row)
+            positions = [(debate, -2.0, allocation_by_debate[debate].chair) for debate in debates]
+            cost_matrix = self.build_cost_matrix(positions, trainees)
 
             logger.info("optimizing trainees (matrix size: %d positions by %d trainees)", len(cost_matrix), len(cost_matrix[0]))
-            indices = self.munkres.compute(cost_matrix)
+            indices = self.solve_assignment(cost_matrix)
             total_cost = sum(cost_matrix[i][j] for i, j in indices)
             logger.info('total cost for %d trainees: %f', len(indices), total_cost)
 
@@ -180,13 +237,11 @@ class VotingHungarianAllocator(BaseHungarianAllocator):
 
         if len(solos) > 0 and len(solo_debates) > 0:
             logger.info("costing solos")
-            cost_matrix = []
-            for debate in solo_debates:
-                row = [self.calc_cost(debate, adj) for adj in solos]
-                cost_matrix.append(row)
+            positions = [(debate, 0, None) for debate in solo_debates]
+            cost_matrix = self.build_cost_matrix(positions, solos)
 
             logger.info("optimizing solos (matrix size: %d positions by %d adjudicators)", len(cost_matrix), len(cost_matrix[0]))
-            indices = self.munkres.compute(cost_matrix)
+            indices = self.solve_assignment(cost_matrix)
             total_cost = sum(cost_matrix[i][j] for i, j in indices)
             logger.info('total cost for %d solo debates: %f', len(solos), total_cost)
 
@@ -202,17 +257,17 @@ class VotingHungarianAllocator(BaseHungarianAllocator):
         # Allocate panellists
         if len(panellists) > 0 and len(panel_debates) > 0:
             logger.info("costing panellists")
-            cost_matrix = []
+            positions = []
             for i, debate in enumerate(panel_debates):
                 for j in range(3):
                     # for the top half of these debates, the final panellist
                     # can be of lower quality than the other 2
                     adjustment = -1.0 if i < len(panel_debates)/2 and j == 2 else 0.0
-                    row = [self.calc_cost(debate, adj, adjustment) for adj in panellists]
-                    cost_matrix.append(row)
+                    positions.append((debate, adjustment, None))
+            cost_matrix = self.build_cost_matrix(positions, panellists)
 
             logger.info("optimizing panellists (matrix size: %d positions by %d adjudicators)", len(cost_matrix), len(cost_matrix[0]))
-            indices = self.munkres.compute(cost_matrix)
+            indices = self.solve_assignment(cost_matrix)
             total_cost = sum(cost_matrix[i][j] for i, j in indices)
             logger.info('total cost for %d panel debates: %f', len(panel_debates), total_cost)
 
@@ -289,15 +344,13 @@ class ConsensusHungarianAllocator(BaseHungarianAllocator):
 
         # Allocate voting
         logger.info("costing voting adjudicators")
-        cost_matrix = []
-        for debate, njudges in zip(debates_sorted, judges_per_room):
-            for i in range(njudges):
-                row = [self.calc_cost(debate, adj, adjustment=-i) for adj in voting]
-                cost_matrix.append(row)
+        positions = [(debate, -i, None) for debate, njudges in zip(debates_sorted, judges_per_room)
+                     for i in range(njudges)]
+        cost_matrix = self.build_cost_matrix(positions, voting)
 
         logger.info("optimizing voting adjudicators (matrix size: %d positions by %d adjudicators)",
                 len(cost_matrix), len(cost_matrix[0]))
-        indices = self.munkres.compute(cost_matrix)
+        indices = self.solve_assignment(cost_matrix)
         indices.sort()
         total_cost = sum(cost_matrix[i][j] for i, j in indices)
         logger.info('total cost for %d debates: %f', n_debates, total_cost)
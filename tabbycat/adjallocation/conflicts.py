@@ -1,13 +1,18 @@
 """Utilities for querying and listing conflicts and history between
 participants."""
+import hashlib
 import logging
 from itertools import combinations, product
 from typing import Dict, List, Tuple, TypedDict
 
+from django.conf import settings
+from django.core.cache import cache
+
 from adjallocation.models import (AdjudicatorAdjudicatorConflict, AdjudicatorInstitutionConflict,
-                     AdjudicatorTeamConflict, TeamInstitutionConflict)
-from draw.models import Debate
+                     AdjudicatorTeamConflict, DebateAdjudicator, TeamInstitutionConflict)
+from draw.models import DebateTeam
 from participants.models import Adjudicator, Team
+from tournaments.utils import get_cache_version
 
 logger = logging.getLogger(__name__)
 
@@ -37,16 +42,37 @@ class ConflictsInfo:
     All queries must relate to teams and adjudicators that were in the QuerySets
     or other iterables that were provided to the constructor.
 
+    The fetched conflicts are cached, keyed on the teams and adjudicators
+    covered, so that repeated allocations and page loads don't fetch them
+    again until any conflict changes (see `adjallocation.signals`).
+
     Although the attributes `self.adjteamconflicts`, `self.adjadjconflicts`,
     etc. aren't marked as such, they should be treated a private implementation
     detail that is subject to change. Callers should rely exclusively on
     methods of the class to access conflict information.
     """
 
+    cached_attributes = ('adjudicator_ids', 'team_ids', 'adjteamconflicts', 'adjadjconflicts',
+        'teaminstconflicts', 'adjinstconflicts', '_conflicting_adjs_by_team', '_conflicting_adjs_by_adj')
+
     def __init__(self, teams=None, adjudicators=None):
         self.teams = teams or Team.objects.none()
         self.adjudicators = adjudicators or Adjudicator.objects.none()
-        self._fetch_conflicts_from_db()
+
+        key = self._get_cache_key()
+        cached = cache.get(key)
+        if cached is None:
+            self._fetch_conflicts_from_db()
+            cache.set(key, {attr: getattr(self, attr) for attr in self.cached_attributes},
+                settings.TAB_PAGES_CACHE_TIMEOUT)
+        else:
+            self.__dict__.update(cached)
+
+    def _get_cache_key(self):
+        team_ids = sorted(team.id for team in self.teams)
+        adjudicator_ids = sorted(adj.id for adj in self.adjudicators)
+        digest = hashlib.sha1(repr((team_ids, adjudicator_ids)).encode()).hexdigest()
+        return "conflictsinfo_%d_%s" % (get_cache_version(None, 'conflicts'), digest)
 
     def _fetch_conflicts_from_db(self):
         """Fetches relevant conflicts from the database, based on `self.teams`
@@ -107,6 +133,30 @@ class ConflictsInfo:
                 logger.warning("Couldnt add conflict for adjudicator ID %s to \
                                 institution %s" % (conflict.adjudicator_id, conflict.institution))
 
+        # Reverse indices, mapping primary keys of teams/adjudicators to sets of
+        # primary keys of the adjudicators they conflict with. These let callers
+        # that need whole rows of conflicts (e.g. vectorised allocators) avoid
+        # checking every adjudicator-team pair in turn.
+
+        adjs_by_institution = {}
+        for adj_id, institutions in self.adjinstconflicts.items():
+            for institution in institutions:
+                adjs_by_institution.setdefault(institution.id, set()).add(adj_id)
+
+        self._conflicting_adjs_by_team = {team_id: set() for team_id in self.team_ids}
+        for adj_id, team_id in self.adjteamconflicts:
+            self._conflicting_adjs_by_team[team_id].add(adj_id)
+        for team_id, institutions in self.teaminstconflicts.items():
+            for institution in institutions:
+                self._conflicting_adjs_by_team[team_id] |= adjs_by_institution.get(institution.id, set())
+
+        self._conflicting_adjs_by_adj = {adj_id: set() for adj_id in self.adjudicator_ids}
+        for adj1_id, adj2_id in self.adjadjconflicts:
+            self._conflicting_adjs_by_adj[adj2_id].add(adj1_id)
+        for adj_id, institutions in self.adjinstconflicts.items():
+            for institution in institutions:
+                self._conflicting_adjs_by_adj[adj_id] |= adjs_by_institution[institution.id]
+
     def personal_conflict_adj_team(self, adj, team):
         """Returns True if the adjudicator and team personally conflict."""
         assert adj.id in self.adjudicator_ids, "adjudicator not covered"
@@ -145,6 +195,18 @@ class ConflictsInfo:
         return (self.personal_conflict_adj_adj(adj1, adj2) or
                 self.institutional_conflict_adj_adj(adj1, adj2))
 
+    def conflicting_adjs_team(self, team):
+        """Returns a set of primary keys of adjudicators that conflict
+        (personally or institutionally) with the team."""
+        assert team.id in self.team_ids, "team not covered"
+        return self._conflicting_adjs_by_team[team.id]
+
+    def conflicting_adjs_adj(self, adj):
+        """Returns a set of primary keys of adjudicators that conflict
+        (personally or institutionally) with the adjudicator."""
+        assert adj.id in self.adjudicator_ids, "adjudicator not covered"
+        return self._conflicting_adjs_by_adj[adj.id]
+
     def serialized_by_participant(self):
         """Returns a tuple of two dicts, mapping primary keys of teams and
         adjudicators respectively to a three-key dict
@@ -185,32 +247,49 @@ class HistoryInfo:
     efficiently whether particular participants have seen each other, without a
     need for further SQL queries or excessive data processing.
 
+    The fetched history is cached for each round, until the draw of an
+    earlier round changes (see `tournaments.utils.bump_draw_cache_version()`),
+    so edits to the allocation for this round don't throw it away.
+
     Although the attributes `self.adjteamhistories` and  `self.adjadjhistories`
     aren't marked as such, they should be treated a private implementation
     detail that is subject to change. Callers should rely exclusively on
     methods of the class to access history information.
     """
 
+    cached_attributes = ('adjteamhistories', 'adjadjhistories', '_seen_adjs_by_team', '_seen_adjs_by_adj')
+
     def __init__(self, round, teams=None, adjudicators=None):
         self.round = round
         self.tournament = round.tournament
-        self._fetch_histories_from_db()
+
+        key = "historyinfo_%d_%d" % (round.id, get_cache_version(round, 'history'))
+        cached = cache.get(key)
+        if cached is None:
+            self._fetch_histories_from_db()
+            cache.set(key, {attr: getattr(self, attr) for attr in self.cached_attributes},
+                settings.TAB_PAGES_CACHE_TIMEOUT)
+        else:
+            self.__dict__.update(cached)
 
     def _fetch_histories_from_db(self):
         """Fetches history information from the database, based on `self.teams`
         and `self.adjudicators`."""
 
-        # The prefetches don't need `.select_related('adjudicator')` and
-        # `.select_related('team')`, because we only deal with the primary keys
-        # of adjudicators and teams.
+        # Only primary keys are needed, so these are fetched as flat rows rather
+        # than as model instances; this matters late in large tournaments, when
+        # there are many thousands of past debate adjudicators and teams.
+
+        previous = {'debate__round__tournament': self.tournament, 'debate__round__seq__lt': self.round.seq}
 
-        debates = Debate.objects.filter(
-            round__tournament=self.tournament,
-            round__seq__lt=self.round.seq,
-        ).prefetch_related(
-            'debateadjudicator_set',
-            'debateteam_set',
-        ).select_related('round')
+        teams_by_debate = {}
+        for debate_id, team_id in DebateTeam.objects.filter(**previous).values_list('debate_id', 'team_id'):
+            teams_by_debate.setdefault(debate_id, []).append(team_id)
+
+        adjs_by_debate = {}
+        for debate_id, adj_id, r in DebateAdjudicator.objects.filter(**previous).order_by('id').values_list(
+                'debate_id', 'adjudicator_id', 'debate__round__seq'):
+            adjs_by_debate.setdefault(debate_id, (r, []))[1].append(adj_id)
 
         # Histories are stored in a dict, where keys are (adj.id, team.id) or
         # (adj1.id, adj2.id) tuples, and values are lists of `seq` integers
@@ -227,17 +306,26 @@ class HistoryInfo:
         self.adjteamhistories = {}
         self.adjadjhistories = {}
 
-        for debate in debates:
-            r = debate.round.seq
+        for debate_id, (r, adj_ids) in adjs_by_debate.items():
 
-            for da, dt in product(debate.debateadjudicator_set.all(), debate.debateteam_set.all()):
-                pair = (da.adjudicator_id, dt.team_id)
+            for pair in product(adj_ids, teams_by_debate.get(debate_id, [])):
                 self.adjteamhistories.setdefault(pair, []).append(r)
 
-            for da1, da2 in combinations(debate.debateadjudicator_set.all(), 2):
-                pair = (da1.adjudicator_id, da2.adjudicator_id)
+            for pair in combinations(adj_ids, 2):
                 self.adjadjhistories.setdefault(pair, []).append(r)
 
+        # Reverse indices, mapping primary keys of teams/adjudicators to sets of
+        # primary keys of adjudicators for which `seen_adj_team(adj, team)` or
+        # `seen_adj_adj(adj, adj2)` respectively would return True.
+
+        self._seen_adjs_by_team = {}
+        for adj_id, team_id in self.adjteamhistories:
+            self._seen_adjs_by_team.setdefault(team_id, set()).add(adj_id)
+
+        self._seen_adjs_by_adj = {}
+        for adj1_id, adj2_id in self.adjadjhistories:
+            self._seen_adjs_by_adj.setdefault(adj2_id, set()).add(adj1_id)
+
     def seen_adj_team(self, adj, team):
         """Returns True if the adjudicator has seen this team in the history
         covered by this object."""
@@ -248,6 +336,16 @@ class HistoryInfo:
         covered by this object."""
         return (adj1.id, adj2.id) in self.adjadjhistories
 
+    def seen_adjs_team(self, team):
+        """Returns a set of primary keys of adjudicators that have seen this
+        team in the history covered by this object."""
+        return self._seen_adjs_by_team.get(team.id, set())
+
+    def seen_adjs_adj(self, adj):
+        """Returns a set of primary keys of adjudicators `adj1` for which
+        `seen_adj_adj(adj1, adj)` is True."""
+        return self._seen_adjs_by_adj.get(adj.id, set())
+
     def serialized_by_participant(self) -> Tuple[Dict[int, TeamConflicts], Dict[int, AdjudicatorConflicts]]:
         """Returns a tuple of two dicts, mapping primary keys of teams and
         adjudicators respectively to a two-key dict
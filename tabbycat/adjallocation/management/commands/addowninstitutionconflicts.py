@@ -1,5 +1,6 @@
 from django.db.models import F
 
+from tournaments.utils import bump_cache_version
 from utils.management.base import TournamentCommand
 
 
@@ -31,6 +32,7 @@ class Command(TournamentCommand):
         conflict_model.objects.bulk_create([
             conflict_model(**{field: obj, "institution": obj.institution}) for obj in qs
         ])
+        bump_cache_version(None, 'conflicts')  # bulk_create() doesn't send signals
         self.stdout.write("Done, created {missing} previously-missing {model} own-institution conflicts.".format(
             missing=missing, model=qs.model._meta.verbose_name))
         self.stdout.write("{existing} {models} already had own-institution conflicts defined.".format(
@@ -0,0 +1,30 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from participants.models import Institution
+from tournaments.utils import bump_cache_version
+
+from .models import (AdjudicatorAdjudicatorConflict, AdjudicatorInstitutionConflict,
+                     AdjudicatorTeamConflict, TeamInstitutionConflict)
+
+CONFLICT_MODELS = (AdjudicatorTeamConflict, AdjudicatorAdjudicatorConflict,
+                   AdjudicatorInstitutionConflict, TeamInstitutionConflict)
+
+
+# Conflicts are cached by `ConflictsInfo` under a site-wide version, since
+# institutions (and so institutional conflicts) aren't specific to a tournament.
+# Cached conflicts also hold institution instances, so changes to those count.
+
+@receiver(post_save, sender=Institution)
+@receiver(post_delete, sender=Institution)
+def update_conflicts_cache_version(sender, **kwargs):
+    bump_cache_version(None, 'conflicts')
+
+
+for model in CONFLICT_MODELS:
+    post_save.connect(update_conflicts_cache_version, sender=model)
+    post_delete.connect(update_conflicts_cache_version, sender=model)
+
+    # `.set()`, `.add()` etc. on the many-to-many fields that use these models
+    # as through models send `m2m_changed` instead of `post_save`
+    m2m_changed.connect(update_conflicts_cache_version, sender=model)
@@ -0,0 +1,50 @@
+from django.contrib import admin
+from django.core.cache import cache
+from django.test import TestCase
+
+from draw.models import Debate
+from results.models import BallotSubmission
+from utils.tests import CompletedTournamentTestMixin
+
+from ..admin import DebateAdjudicatorAdmin
+from ..conflicts import HistoryInfo
+from ..models import DebateAdjudicator
+
+
+class HistoryInfoCacheTests(CompletedTournamentTestMixin, TestCase):
+    """Checks that cached history is refetched when the draw of an earlier round
+    changes, but not otherwise."""
+
+    round_seq = 4
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_cached(self):
+        HistoryInfo(self.round)
+        with self.assertNumQueries(0):
+            HistoryInfo(self.round)
+
+    def test_refetched_after_allocation_change(self):
+        debate = Debate.objects.filter(round__tournament=self.tournament, round__seq=1).first()
+        adj = DebateAdjudicator.objects.filter(debate=debate).first().adjudicator
+        team = debate.teams[0]
+        self.assertTrue(HistoryInfo(self.round).seen_adj_team(adj, team))
+
+        model_admin = DebateAdjudicatorAdmin(DebateAdjudicator, admin.site)
+        with self.captureOnCommitCallbacks(execute=True):
+            model_admin.delete_queryset(None, DebateAdjudicator.objects.filter(adjudicator=adj,
+                debate__debateteam__team=team, debate__round__seq__lt=self.round.seq))
+        self.assertFalse(HistoryInfo(self.round).seen_adj_team(adj, team))
+
+    def test_kept_after_current_round_changes(self):
+        HistoryInfo(self.round)
+
+        model_admin = DebateAdjudicatorAdmin(DebateAdjudicator, admin.site)
+        with self.captureOnCommitCallbacks(execute=True):
+            model_admin.delete_model(None, DebateAdjudicator.objects.filter(debate__round=self.round).first())
+            BallotSubmission.objects.filter(debate__round__seq__lt=self.round.seq).first().save()
+
+        with self.assertNumQueries(0):
+            HistoryInfo(self.round)
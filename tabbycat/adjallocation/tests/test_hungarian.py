@@ -0,0 +1,63 @@
+from unittest import skipIf
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from participants.models import Adjudicator
+from utils.tests import CompletedTournamentTestMixin
+
+from ..allocators.hungarian import np, VotingHungarianAllocator
+from ..models import AdjudicatorAdjudicatorConflict, AdjudicatorTeamConflict
+
+
+@skipIf(np is None, "NumPy not installed")
+class TestCostArray(CompletedTournamentTestMixin, TestCase):
+    """Tests that the vectorised cost array used by the "lsa" assignment method
+    matches the costs used by the Hungarian algorithm."""
+
+    round_seq = 4
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()  # conflicts are cached under versions that aren't bumped in test transactions
+
+        # Leave some adjudicators out, as if unavailable, so that conflicts and
+        # history refer to adjudicators that aren't being allocated
+        adjudicators = list(Adjudicator.objects.filter(tournament=self.tournament).order_by('id'))
+        self.available = adjudicators[:-3]
+        self.debates = list(self.round.debate_set.order_by('id'))
+        self.chairs = self.available[:len(self.debates)]
+        self.adjs = self.available[len(self.debates):]
+
+        for debate, chair, adj in zip(self.debates, self.chairs, self.adjs):
+            AdjudicatorTeamConflict.objects.get_or_create(adjudicator=adj, team=debate.teams[0])
+            AdjudicatorAdjudicatorConflict.objects.get_or_create(adjudicator1=chair, adjudicator2=adj)
+        AdjudicatorTeamConflict.objects.get_or_create(adjudicator=adjudicators[-1], team=self.debates[0].teams[0])
+
+        self.allocator = VotingHungarianAllocator(self.debates, self.available, self.round)
+        self.allocator.populate_adj_scores(self.available)
+
+    def test_matches_calc_cost(self):
+        positions = []
+        for debate, chair in zip(self.debates, self.chairs):
+            positions.append((debate, 0.0, None))     # solo or chair
+            positions.append((debate, -1.0, None))    # panellist
+            positions.append((debate, -2.0, chair))   # trainee
+
+        array = self.allocator.calc_cost_array(positions, self.adjs)
+        self.assertEqual(array.shape, (len(positions), len(self.adjs)))
+
+        for i, (debate, adjustment, chair) in enumerate(positions):
+            for j, adj in enumerate(self.adjs):
+                with self.subTest(position=i, adj=adj.name):
+                    self.assertAlmostEqual(array[i, j], self.allocator.calc_cost(debate, adj, adjustment, chair))
+
+    def test_penalties_included(self):
+        # Check the test data actually exercises conflicts and history
+        conflicts = self.allocator.conflicts
+        history = self.allocator.history
+        self.assertTrue(any(conflicts.conflict_adj_team(adj, team)
+            for adj in self.adjs for debate in self.debates for team in debate.teams))
+        self.assertTrue(any(conflicts.conflict_adj_adj(adj, chair) for adj in self.adjs for chair in self.chairs))
+        self.assertTrue(any(history.seen_adj_team(adj, team)
+            for adj in self.adjs for debate in self.debates for team in debate.teams))
@@ -10,6 +10,7 @@ from draw.models import DebateTeam
 from registration.models import Answer
 from utils.admin import custom_titled_filter, ModelAdmin
 
+from .aggregates import update_feedback_aggregates
 from .models import AdjudicatorBaseScoreHistory, AdjudicatorFeedback, AdjudicatorFeedbackQuestion
 
 
@@ -161,7 +162,10 @@ class AdjudicatorFeedbackAdmin(ModelAdmin):
             self.message_user(request, message, level=messages.WARNING)
 
     def mark_as_unconfirmed(self, request, queryset):
+        # update() doesn't send signals, so update aggregates explicitly
+        adjudicator_ids = set(queryset.values_list('adjudicator_id', flat=True))
         count = queryset.update(confirmed=False)
+        update_feedback_aggregates(adjudicator_ids)
         for fb in queryset:
             self.log_change(request, fb, [{"changed": {"fields": ["confirmed"]}}])
         message = ngettext(
@@ -172,7 +176,9 @@ class AdjudicatorFeedbackAdmin(ModelAdmin):
         self.message_user(request, message)
 
     def ignore_feedback(self, request, queryset):
+        adjudicator_ids = set(queryset.values_list('adjudicator_id', flat=True))
         count = queryset.update(ignored=True)
+        update_feedback_aggregates(adjudicator_ids)
         for fb in queryset:
             self.log_change(request, fb, [{"changed": {"fields": ["ignored"]}}])
 
@@ -184,7 +190,9 @@ class AdjudicatorFeedbackAdmin(ModelAdmin):
         self.message_user(request, message)
 
     def recognize_feedback(self, request, queryset):
+        adjudicator_ids = set(queryset.values_list('adjudicator_id', flat=True))
         count = queryset.update(ignored=False)
+        update_feedback_aggregates(adjudicator_ids)
         for fb in queryset:
             self.log_change(request, fb, [{"changed": {"fields": ["ignored"]}}])
 
@@ -0,0 +1,100 @@
+"""Functions that maintain `AdjudicatorFeedbackAggregate` objects.
+
+Aggregates are recomputed from the feedback, rather than adjusted by each
+change, so that they can't drift. Feedback signals (in `adjfeedback.signals`)
+call `update_feedback_aggregates()` for the adjudicators whose feedback
+changed. Code that bypasses those signals, like `bulk_create()`, should call
+`rebuild_feedback_aggregates()` afterwards. Feedback from trainees doesn't
+count, so code that changes the types of debate adjudicators should call
+`update_feedback_aggregates_from_sources()`.
+
+Changes to aggregates bump the "feedback" cache version of the tournaments
+they relate to (see `tournaments.utils.get_cache_version()`)."""
+
+import logging
+
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Coalesce
+
+from adjallocation.models import DebateAdjudicator
+from tournaments.models import Tournament
+from tournaments.utils import bump_cache_version
+
+from .models import AdjudicatorFeedback, AdjudicatorFeedbackAggregate
+
+logger = logging.getLogger(__name__)
+
+
+def counted_feedback():
+    """Returns the feedback that counts towards adjudicators' feedback scores."""
+    return AdjudicatorFeedback.objects.filter(confirmed=True, ignored=False).exclude(
+        source_adjudicator__type=DebateAdjudicator.TYPE_TRAINEE)
+
+
+def update_feedback_aggregates(adjudicator_ids, create=True):
+    """Recomputes the aggregates of the adjudicators in `adjudicator_ids`.
+
+    If `create` is False, aggregates are only updated or deleted, never
+    created; this is for feedback deletions, which might be cascading from the
+    deletion of the adjudicator or round the aggregate would refer to."""
+    adjudicator_ids = set(adjudicator_ids)
+    if not adjudicator_ids:
+        return
+
+    rows = counted_feedback().filter(adjudicator_id__in=adjudicator_ids).annotate(
+        feedback_round_id=Coalesce('source_adjudicator__debate__round_id', 'source_team__debate__round_id'),
+    ).values('adjudicator_id', 'feedback_round_id').annotate(
+        n=Count('id'), s=Sum('score'), ss=Sum(F('score') * F('score')),
+    ).order_by()
+    values = {(row['adjudicator_id'], row['feedback_round_id']): (row['n'], row['s'], row['ss']) for row in rows}
+
+    round_ids = {round_id for _, round_id in values.keys() if round_id is not None}
+
+    with transaction.atomic():
+        to_update = []
+        to_delete = []
+        for aggregate in AdjudicatorFeedbackAggregate.objects.filter(adjudicator_id__in=adjudicator_ids):
+            key = (aggregate.adjudicator_id, aggregate.round_id)
+            round_ids.add(aggregate.round_id)
+            if key not in values:
+                to_delete.append(aggregate.id)
+                continue
+            aggregate.count, aggregate.total, aggregate.total_squares = values.pop(key)
+            to_update.append(aggregate)
+
+        AdjudicatorFeedbackAggregate.objects.filter(id__in=to_delete).delete()
+        AdjudicatorFeedbackAggregate.objects.bulk_update(to_update, ['count', 'total', 'total_squares'])
+        if create:
+            AdjudicatorFeedbackAggregate.objects.bulk_create([
+                AdjudicatorFeedbackAggregate(adjudicator_id=adj_id, round_id=round_id,
+                    count=count, total=total, total_squares=total_squares)
+                for (adj_id, round_id), (count, total, total_squares) in values.items()
+                if round_id is not None
+            ])
+
+        for tournament in Tournament.objects.filter(round__in=round_ids).distinct():
+            bump_cache_version(tournament, 'feedback')
+
+
+def update_feedback_aggregates_from_sources(debateadjudicators):
+    """Recomputes the aggregates of adjudicators who received feedback from
+    `debateadjudicators` (a queryset or list of `DebateAdjudicator`s), whose
+    types might have changed."""
+    update_feedback_aggregates(AdjudicatorFeedback.objects.filter(
+        source_adjudicator__in=debateadjudicators).values_list('adjudicator_id', flat=True))
+
+
+def rebuild_feedback_aggregates(tournament):
+    """Recomputes the aggregates of every adjudicator with feedback (or an
+    aggregate) in `tournament`."""
+    feedback_ids = AdjudicatorFeedback.objects.filter(
+        Q(source_adjudicator__debate__round__tournament=tournament) |
+        Q(source_team__debate__round__tournament=tournament),
+    ).values_list('adjudicator_id', flat=True)
+    aggregate_ids = AdjudicatorFeedbackAggregate.objects.filter(
+        round__tournament=tournament).values_list('adjudicator_id', flat=True)
+
+    adjudicator_ids = set(feedback_ids) | set(aggregate_ids)
+    update_feedback_aggregates(adjudicator_ids)
+    logger.info("Rebuilt feedback aggregates for %d adjudicators in %s", len(adjudicator_ids), tournament.short_name)
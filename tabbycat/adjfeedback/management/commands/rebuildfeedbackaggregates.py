@@ -0,0 +1,11 @@
+from adjfeedback.aggregates import rebuild_feedback_aggregates
+from utils.management.base import TournamentCommand
+
+
+class Command(TournamentCommand):
+
+    help = "Recomputes the feedback aggregates used for adjudicators' feedback scores, " \
+           "e.g. after feedback was changed without sending signals"
+
+    def handle_tournament(self, tournament, **options):
+        rebuild_feedback_aggregates(tournament)
@@ -0,0 +1,56 @@
+import django.db.models.deletion
+import utils.models
+from django.db import migrations, models
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Coalesce
+
+
+def populate_aggregates(apps, schema_editor):
+    AdjudicatorFeedback = apps.get_model('adjfeedback', 'AdjudicatorFeedback')
+    AdjudicatorFeedbackAggregate = apps.get_model('adjfeedback', 'AdjudicatorFeedbackAggregate')
+
+    rows = AdjudicatorFeedback.objects.filter(confirmed=True, ignored=False).exclude(
+        source_adjudicator__type='T',  # DebateAdjudicator.TYPE_TRAINEE
+    ).annotate(
+        feedback_round_id=Coalesce('source_adjudicator__debate__round_id', 'source_team__debate__round_id'),
+    ).values('adjudicator_id', 'feedback_round_id').annotate(
+        n=Count('id'), s=Sum('score'), ss=Sum(F('score') * F('score')),
+    ).order_by()
+
+    AdjudicatorFeedbackAggregate.objects.bulk_create([
+        AdjudicatorFeedbackAggregate(adjudicator_id=row['adjudicator_id'], round_id=row['feedback_round_id'],
+            count=row['n'], total=row['s'], total_squares=row['ss'])
+        for row in rows if row['feedback_round_id'] is not None
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('adjfeedback', '0019_merge_20241106_0903'),
+        ('participants', '0027_alter_tournamentinstitution_adjudicators_allocated_and_more'),
+        ('tournaments', '0013_scheduleevent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AdjudicatorFeedbackAggregate',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name='count')),
+                ('total', models.FloatField(default=0, verbose_name='total')),
+                ('total_squares', models.FloatField(default=0, verbose_name='total of squares')),
+                ('adjudicator', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='participants.adjudicator', verbose_name='adjudicator')),
+                ('round', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='tournaments.round', verbose_name='round')),
+            ],
+            options={
+                'verbose_name': 'adjudicator feedback aggregate',
+                'verbose_name_plural': 'adjudicator feedback aggregates',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='adjudicatorfeedbackaggregate',
+            constraint=utils.models.UniqueConstraint(fields=('adjudicator', 'round'), name='adjfeed_adjudicatorfeedbackaggregate_adjudicator__round_uniq'),
+        ),
+        migrations.RunPython(populate_aggregates, migrations.RunPython.noop),
+    ]
@@ -145,3 +145,31 @@ class AdjudicatorFeedback(Submission):
         if self.adjudicator not in self.debate.adjudicators:
             raise ValidationError(gettext("Adjudicator did not see this debate."))
         return super(AdjudicatorFeedback, self).clean()
+
+
+class AdjudicatorFeedbackAggregate(models.Model):
+    """The confirmed, non-ignored feedback on an adjudicator from a round, not
+    counting feedback from trainees. These are kept up to date when feedback
+    is saved or deleted (see `adjfeedback.aggregates`), so that scores and
+    their variances can be read without aggregating all the feedback."""
+
+    adjudicator = models.ForeignKey('participants.Adjudicator', models.CASCADE,
+        verbose_name=_("adjudicator"))
+    round = models.ForeignKey('tournaments.Round', models.CASCADE,
+        verbose_name=_("round"))
+    count = models.PositiveIntegerField(default=0,
+        verbose_name=_("count"))
+    total = models.FloatField(default=0,
+        verbose_name=_("total"))
+    total_squares = models.FloatField(default=0,
+        verbose_name=_("total of squares"))
+
+    class Meta:
+        constraints = [
+            UniqueConstraint(fields=['adjudicator', 'round']),
+        ]
+        verbose_name = _("adjudicator feedback aggregate")
+        verbose_name_plural = _("adjudicator feedback aggregates")
+
+    def __str__(self):
+        return "{.name:s} in {!s}: {:d} feedback".format(self.adjudicator, self.round, self.count)
@@ -0,0 +1,35 @@
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .aggregates import update_feedback_aggregates
+from .models import AdjudicatorFeedback
+
+# Changing a debate adjudicator's type (e.g. to trainee) changes whether their
+# feedback counts, but debate adjudicators are saved too often to watch here.
+# Code that changes types calls `update_feedback_aggregates_from_sources()`
+# instead: `AdjudicatorAllocation.save()`, the allocation editing consumer and
+# the admin site.
+
+
+@receiver(post_save, sender=AdjudicatorFeedback)
+def update_aggregates_on_save(sender, instance, raw=False, **kwargs):
+    if raw:  # loading fixtures, other objects might not be loaded yet
+        return
+
+    adjudicator_ids = {instance.adjudicator_id}
+
+    # Confirming feedback unconfirms other versions from the same source, which
+    # might be on another adjudicator (see AdjudicatorFeedback._unique_unconfirm_args())
+    if instance.confirmed:
+        adjudicator_ids.update(AdjudicatorFeedback.objects.filter(
+            Q(source_adjudicator_id=instance.source_adjudicator_id) if instance.source_adjudicator_id else
+            Q(source_team_id=instance.source_team_id),
+        ).values_list('adjudicator_id', flat=True))
+
+    update_feedback_aggregates(adjudicator_ids)
+
+
+@receiver(post_delete, sender=AdjudicatorFeedback)
+def update_aggregates_on_delete(sender, instance, **kwargs):
+    update_feedback_aggregates({instance.adjudicator_id}, create=False)
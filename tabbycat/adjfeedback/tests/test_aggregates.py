@@ -0,0 +1,155 @@
+from statistics import stdev
+from unittest import mock
+
+from django.contrib import admin
+from django.core.cache import cache
+from django.db.models import Avg, Q
+from django.test import TestCase
+
+from adjallocation.admin import DebateAdjudicatorAdmin
+from adjallocation.models import DebateAdjudicator
+from adjfeedback import utils
+from adjfeedback.admin import AdjudicatorFeedbackAdmin
+from adjfeedback.models import AdjudicatorFeedback
+from adjfeedback.utils import get_feedback_overview, get_feedback_overview_table
+from participants.models import Adjudicator
+from participants.prefetch import populate_feedback_scores
+from utils.tests import CompletedTournamentTestMixin
+
+
+class FeedbackAggregateTests(CompletedTournamentTestMixin, TestCase):
+
+    def expected_score(self, adj):
+        return AdjudicatorFeedback.objects.filter(adjudicator=adj, confirmed=True, ignored=False).exclude(
+            source_adjudicator__type=DebateAdjudicator.TYPE_TRAINEE).aggregate(avg=Avg('score'))['avg']
+
+    def test_scores_match_feedback(self):
+        adjs = list(Adjudicator.objects.filter(tournament=self.tournament))
+        populate_feedback_scores(adjs)
+        for adj in adjs:
+            expected = self.expected_score(adj)
+            if expected is None:
+                self.assertIsNone(adj._feedback_score())
+            else:
+                self.assertAlmostEqual(adj._feedback_score(), expected)
+
+    def assertScoreMatchesFeedback(self, adj_id):  # noqa: N802
+        adj = Adjudicator.objects.get(pk=adj_id)
+        expected = self.expected_score(adj)
+        if expected is None:
+            self.assertIsNone(adj._feedback_score())
+        else:
+            self.assertAlmostEqual(adj._feedback_score(), expected)
+
+    def test_ignoring_feedback_updates_score(self):
+        feedback = AdjudicatorFeedback.objects.filter(confirmed=True, ignored=False,
+            adjudicator__tournament=self.tournament).first()
+        feedback.ignored = True
+        feedback.save()
+        self.assertScoreMatchesFeedback(feedback.adjudicator_id)
+
+    def test_admin_actions_update_scores(self):
+        model_admin = AdjudicatorFeedbackAdmin(AdjudicatorFeedback, admin.site)
+        model_admin.log_change = lambda *args: None
+        model_admin.message_user = lambda *args: None
+
+        feedback = AdjudicatorFeedback.objects.filter(confirmed=True, ignored=False,
+            adjudicator__tournament=self.tournament).first()
+        original = self.expected_score(feedback.adjudicator)
+        queryset = AdjudicatorFeedback.objects.filter(adjudicator=feedback.adjudicator_id, confirmed=True)
+
+        for action in ['ignore_feedback', 'recognize_feedback', 'mark_as_unconfirmed']:
+            with self.subTest(action=action):
+                getattr(model_admin, action)(None, AdjudicatorFeedback.objects.filter(pk__in=list(queryset)))
+                self.assertScoreMatchesFeedback(feedback.adjudicator_id)
+                if action == 'recognize_feedback':
+                    self.assertAlmostEqual(Adjudicator.objects.get(pk=feedback.adjudicator_id)._feedback_score(),
+                                           original)
+                else:
+                    self.assertIsNone(Adjudicator.objects.get(pk=feedback.adjudicator_id)._feedback_score())
+
+    def test_retyping_source_updates_score(self):
+        feedback = AdjudicatorFeedback.objects.filter(confirmed=True, ignored=False,
+            adjudicator__tournament=self.tournament, source_adjudicator__type=DebateAdjudicator.TYPE_PANEL).first()
+        debate = feedback.source_adjudicator.debate
+        source = feedback.source_adjudicator.adjudicator
+
+        allocation = debate.adjudicators
+        allocation.panellists.remove(source)
+        allocation.trainees.append(source)
+        allocation.save()
+        self.assertScoreMatchesFeedback(feedback.adjudicator_id)
+
+
+class FeedbackOverviewTests(CompletedTournamentTestMixin, TestCase):
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()  # cache versions aren't bumped in test transactions
+
+    def test_overview_matches_feedback(self):
+        adjs = get_feedback_overview(self.tournament, list(Adjudicator.objects.filter(tournament=self.tournament)))
+        rounds = list(self.tournament.prelim_rounds(until=self.tournament.current_round))
+        for adj in adjs:
+            feedbacks = AdjudicatorFeedback.objects.filter(adjudicator=adj, confirmed=True, ignored=False).filter(
+                Q(source_adjudicator__debate__round__in=rounds) | Q(source_team__debate__round__in=rounds),
+            ).exclude(source_adjudicator__type=DebateAdjudicator.TYPE_TRAINEE)
+            scores = [fb.score for fb in feedbacks]
+            self.assertEqual(adj.feedback_count, len(scores))
+            if scores:
+                self.assertAlmostEqual(adj.feedback_variance, stdev(scores + [adj.base_score]))
+            else:
+                self.assertIsNone(adj.feedback_variance)
+
+    def assertOverviewCached(self, cached=True):  # noqa: N802
+        with mock.patch('adjfeedback.utils._calculate_feedback_overview_table',
+                        wraps=utils._calculate_feedback_overview_table) as calculate:
+            get_feedback_overview_table(self.tournament)
+        self.assertEqual(calculate.called, not cached)
+
+    def test_overview_cached(self):
+        get_feedback_overview_table(self.tournament)
+        self.assertOverviewCached()
+
+    def test_overview_kept_after_current_draw_edit(self):
+        get_feedback_overview_table(self.tournament)
+        da = DebateAdjudicator.objects.filter(debate__round=self.tournament.current_round).first()
+        with self.captureOnCommitCallbacks(execute=True):
+            DebateAdjudicatorAdmin(DebateAdjudicator, admin.site).delete_model(None, da)
+        self.assertOverviewCached()
+
+    def test_overview_rebuilt_after_earlier_draw_edit(self):
+        get_feedback_overview_table(self.tournament)
+        da = DebateAdjudicator.objects.filter(debate__round__tournament=self.tournament,
+            debate__round__seq__lt=self.tournament.current_round.seq).first()
+        with self.captureOnCommitCallbacks(execute=True):
+            DebateAdjudicatorAdmin(DebateAdjudicator, admin.site).delete_model(None, da)
+        self.assertOverviewCached(False)
+
+    def get_feedback_count(self, adj_id):
+        debates, rounds = get_feedback_overview_table(self.tournament).get(adj_id, (0, []))
+        return sum(count for _, _, count, _, _ in rounds)
+
+    def test_overview_rebuilt_after_admin_actions(self):
+        model_admin = AdjudicatorFeedbackAdmin(AdjudicatorFeedback, admin.site)
+        model_admin.log_change = lambda *args: None
+        model_admin.message_user = lambda *args: None
+
+        for action in ['ignore_feedback', 'mark_as_unconfirmed']:
+            with self.subTest(action=action):
+                feedback = AdjudicatorFeedback.objects.filter(confirmed=True, ignored=False,
+                    adjudicator__tournament=self.tournament,
+                    source_team__debate__round__seq__lte=self.tournament.current_round.seq).first()
+                count = self.get_feedback_count(feedback.adjudicator_id)
+
+                with self.captureOnCommitCallbacks(execute=True):
+                    getattr(model_admin, action)(None, AdjudicatorFeedback.objects.filter(pk=feedback.pk))
+                self.assertEqual(self.get_feedback_count(feedback.adjudicator_id), count - 1)
+
+    def test_overview_rebuilt_after_draw_edit(self):
+        da = DebateAdjudicator.objects.filter(debate__round__tournament=self.tournament).first()
+        debates, _ = get_feedback_overview_table(self.tournament)[da.adjudicator_id]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            DebateAdjudicatorAdmin(DebateAdjudicator, admin.site).delete_model(None, da)
+        self.assertEqual(get_feedback_overview_table(self.tournament).get(da.adjudicator_id, (0, []))[0], debates - 1)
@@ -1,12 +1,15 @@
 import logging
-from statistics import mean, stdev
+from math import sqrt
 
-from django.db.models import Count, Prefetch, Q
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
 
 from adjallocation.allocation import AdjudicatorAllocation
 from adjallocation.models import DebateAdjudicator
-from adjfeedback.models import AdjudicatorFeedback
+from adjfeedback.models import AdjudicatorFeedbackAggregate
 from options.preferences import FeedbackPaths
+from tournaments.utils import get_cache_version
 
 logger = logging.getLogger(__name__)
 
@@ -73,81 +76,123 @@ def expected_feedback_targets(debateadj, feedback_paths=None, debate=None):
     return targets
 
 
+def get_feedback_overview_table(t):
+    """Returns a compact table of the feedback statistics shown in the
+    feedback overview, for the preliminary rounds up to the current round.
+
+    The table is a dict mapping adjudicator IDs to 2-tuples `(debates, rounds)`,
+    where `debates` is the number of debates the adjudicator has adjudicated,
+    and `rounds` is a list of tuples `(seq, type, count, total, total_squares)`
+    for each round in which the adjudicator both adjudicated and received
+    feedback that counts towards their score. `type` is a
+    `DebateAdjudicator.TYPE_*` constant, and `count`, `total` and
+    `total_squares` are the number, sum and sum of squares of the feedback
+    scores from that round, taken from `AdjudicatorFeedbackAggregate`s.
+
+    Adjudicators without any debates are not in the table. The statistics for
+    rounds before the current round are cached until feedback is confirmed (or
+    otherwise changed) or the draw of one of those rounds changes. Debate
+    counts and positions in the current round change whenever the current
+    draw is edited, so they're looked up on every call."""
+
+    current_round = t.current_round
+    key = "feedbackoverview_%d_%d_%d" % (current_round.id, get_cache_version(t, 'feedback'),
+                                         get_cache_version(current_round, 'history'))
+    cached = cache.get(key)
+    if cached is None:
+        cached = _calculate_feedback_overview_table(t, current_round)
+        cache.set(key, cached, settings.TAB_PAGES_CACHE_TIMEOUT)
+    previous, current_aggregates = cached
+
+    debates = DebateAdjudicator.objects.filter(debate__round__tournament=t).values_list(
+        'adjudicator_id').annotate(n=Count('id')).order_by()
+    table = {adj_id: (n, list(previous.get(adj_id, []))) for adj_id, n in debates}
+
+    if current_aggregates:
+        positions = DebateAdjudicator.objects.filter(debate__round=current_round).values_list(
+            'adjudicator_id', 'type')
+        for adj_id, type in positions:
+            if adj_id in current_aggregates:
+                table[adj_id][1].append((current_round.seq, type, *current_aggregates[adj_id]))
+
+    return table
+
+
+def _calculate_feedback_overview_table(t, current_round):
+    """Returns a 2-tuple `(previous, current_aggregates)`. `previous` maps
+    adjudicator IDs to lists of round tuples (as in
+    `get_feedback_overview_table()`) for preliminary rounds before the current
+    round. `current_aggregates` maps adjudicator IDs to `(count, total,
+    total_squares)` for the current round, if it's a preliminary round."""
+    rounds = {r.id: r.seq for r in t.prelim_rounds(until=current_round)}
+
+    aggregates = AdjudicatorFeedbackAggregate.objects.filter(round_id__in=rounds.keys(), count__gt=0).values_list(
+        'adjudicator_id', 'round_id', 'count', 'total', 'total_squares')
+    aggregates = {(adj_id, round_id): values for adj_id, round_id, *values in aggregates}
+
+    previous = {}
+    positions = DebateAdjudicator.objects.filter(
+        debate__round_id__in=rounds.keys(), debate__round__seq__lt=current_round.seq,
+    ).values_list('adjudicator_id', 'debate__round_id', 'type').order_by('debate__round__seq')
+    for adj_id, round_id, type in positions:
+        if (adj_id, round_id) in aggregates:
+            previous.setdefault(adj_id, []).append((rounds[round_id], type, *aggregates[(adj_id, round_id)]))
+
+    current_aggregates = {adj_id: values for (adj_id, round_id), values in aggregates.items()
+                          if round_id == current_round.id}
+
+    logger.debug("Calculated feedback overview for %d adjudicators in %s", len(previous), t.short_name)
+    return previous, current_aggregates
+
+
 def get_feedback_overview(t, adjudicators):
-    """Collates feedback statistics for the feedback overview."""
-
-    rounds = list(t.prelim_rounds(until=t.current_round))  # force to list for performance in next querysets
-
-    annotated_adjs = adjudicators.filter(id__in=[adj.id for adj in adjudicators]).prefetch_related(
-        Prefetch('adjudicatorfeedback_set', to_attr='adjfeedback_for_rounds',
-            queryset=AdjudicatorFeedback.objects.filter(
-                Q(source_adjudicator__debate__round__in=rounds) | Q(source_team__debate__round__in=rounds),
-                confirmed=True,
-                ignored=False,
-            ).exclude(
-                source_adjudicator__type=DebateAdjudicator.TYPE_TRAINEE,
-            ).select_related('source_adjudicator__debate__round', 'source_team__debate__round'),
-        ),
-        Prefetch('debateadjudicator_set', to_attr='debateadjs_for_rounds',
-            queryset=DebateAdjudicator.objects.filter(
-                debate__round__in=rounds).select_related('debate__round')),
-    ).annotate(debates=Count('debateadjudicator'))
-    annotated_adjs_by_id = {adj.id: adj for adj in annotated_adjs}
+    """Collates feedback statistics for the feedback overview, from
+    `get_feedback_overview_table()`. Operates in-place, and returns
+    `adjudicators`."""
+
+    table = get_feedback_overview_table(t)
 
     for adj in adjudicators:
-        annotated_adj = annotated_adjs_by_id[adj.id]
-        adj.debates = annotated_adj.debates
-        adj.feedback_data = feedback_stats(annotated_adj, rounds)
-        adj.feedback_count = feedback_count(annotated_adj)
-        adj.feedback_variance = feedback_variance(annotated_adj, rounds)
+        adj.debates, rounds = table.get(adj.id, (0, []))
+        adj.feedback_data = feedback_stats(adj, rounds)
+        adj.feedback_count = sum(count for _, _, count, _, _ in rounds)
+        adj.feedback_variance = feedback_variance(adj, rounds)
 
     return adjudicators
 
 
 def feedback_variance(adj, rounds):
-    feedback_scores = [fb.score for fb in adj.adjfeedback_for_rounds]
-    feedback_scores.append(adj.base_score)
-    if len(feedback_scores) > 1:
-        return stdev(feedback_scores)
-    else:
+    """Returns the standard deviation of the adjudicator's feedback scores in
+    `rounds` (as in `get_feedback_overview_table()`), together with their base
+    score, or None if there's no feedback."""
+    count = 1 + sum(count for _, _, count, _, _ in rounds)
+    if count < 2:
         return None
-
-
-def feedback_count(adj):
-    return len(adj.adjfeedback_for_rounds)
+    total = adj.base_score + sum(total for _, _, _, total, _ in rounds)
+    total_squares = adj.base_score ** 2 + sum(total_squares for _, _, _, _, total_squares in rounds)
+    return sqrt(max(total_squares - total * total / count, 0) / (count - 1))
 
 
 def feedback_stats(adj, rounds):
-    """Collates the feedback statistics for an adjudicator. Assumes
-    adj.adjfeedback_for_rounds and adj.debateadj_for_rounds are populated as in
-    get_feedback_overview()."""
+    """Collates the feedback statistics for an adjudicator, for the feedback
+    graph. `rounds` is as in `get_feedback_overview_table()`."""
 
     adj_classes = {  # Do not translate
         DebateAdjudicator.TYPE_CHAIR: "chair",
         DebateAdjudicator.TYPE_PANEL: "panellist",
         DebateAdjudicator.TYPE_TRAINEE: "trainee",
     }
+    type_names = dict(DebateAdjudicator.TYPE_CHOICES)
 
     # Start with base score
     feedback_data = [{'x': 0, 'y': adj.base_score, 'position': "Base Score"}]
 
-    # Sort into rounds
-    feedback_by_round = {r: [] for r in rounds}
-    for fb in adj.adjfeedback_for_rounds:
-        feedback_by_round[fb.round].append(fb)
-
-    debateadjs_by_round = dict.fromkeys(rounds, None)
-    for da in adj.debateadjs_for_rounds:
-        debateadjs_by_round[da.debate.round] = da
-
-    for r in rounds:
-        scores = [fb.score for fb in feedback_by_round[r]]
-        if scores and debateadjs_by_round[r]:
-            feedback_data.append({
-                'x': r.seq,
-                'y': round(mean(scores), 2),  # average score
-                'position_class': adj_classes[debateadjs_by_round[r].type],
-                'position': debateadjs_by_round[r].get_type_display(),
-            })
+    for seq, type, count, total, _ in rounds:
+        feedback_data.append({
+            'x': seq,
+            'y': round(total / count, 2),  # average score
+            'position_class': adj_classes[type],
+            'position': type_names[type],
+        })
 
     return feedback_data
@@ -206,6 +206,7 @@ class RoundSerializer(serializers.ModelSerializer):
             lookup_field='seq', lookup_url_kwarg='round_seq')
         availabilities = fields.TournamentHyperlinkedIdentityField(view_name='api-availability-list', lookup_field='seq', lookup_url_kwarg='round_seq')
         preformed_panels = fields.TournamentHyperlinkedIdentityField(view_name='api-preformedpanel-list', lookup_field='seq', lookup_url_kwarg='round_seq')
+        liveness = fields.TournamentHyperlinkedIdentityField(view_name='api-round-liveness', lookup_field='seq', lookup_url_kwarg='round_seq')
 
     class TimeOrDateTimeField(serializers.DateTimeField):
         def to_internal_value(self, value):
@@ -499,6 +500,17 @@ class PartialBreakingTeamSerializer(BreakingTeamSerializer):
         return bt
 
 
+class BreakCategoryLivenessSerializer(serializers.ModelSerializer):
+    url = fields.TournamentHyperlinkedIdentityField(
+        view_name='api-breakcategory-detail')
+    safe = serializers.IntegerField(read_only=True, allow_null=True)
+    dead = serializers.IntegerField(read_only=True, allow_null=True)
+
+    class Meta:
+        model = BreakCategory
+        fields = ('url', 'id', 'slug', 'safe', 'dead')
+
+
 class SpeakerSerializer(serializers.ModelSerializer):
 
     class SpeakerLinksSerializer(serializers.Serializer):
@@ -1149,6 +1161,7 @@ class DrawGenerationSerializer(serializers.Serializer):
         pullup_debates_penalty = serializers.IntegerField(required=False)
         side_penalty = serializers.IntegerField(required=False)
         pairing_penalty = serializers.IntegerField(required=False)
+        pairing_candidates = serializers.IntegerField(required=False)
         side_allocations = serializers.ChoiceField(choices=DrawSideAllocations.choices, required=False, help_text=DrawSideAllocations.help_text)
         avoid_conflicts = serializers.ChoiceField(choices=DrawAvoidConflicts.choices, required=False, help_text=DrawAvoidConflicts.help_text)
         odd_bracket = serializers.ChoiceField(choices=DrawOddBracket.choices, required=False, help_text=DrawOddBracket.help_text)
@@ -26,6 +26,7 @@ from adjallocation.models import PreformedPanel
 from adjallocation.preformed.anticipated import calculate_anticipated_draw
 from availability.models import RoundAvailability
 from breakqual.models import BreakCategory
+from breakqual.utils import get_live_thresholds
 from breakqual.views import GenerateBreakMixin
 from checkins.consumers import CheckInEventConsumer
 from checkins.models import Event
@@ -38,6 +39,7 @@ from standings.speakers import SpeakerStandingsGenerator
 from standings.teams import TeamStandingsGenerator
 from tournaments.mixins import TournamentFromUrlMixin
 from tournaments.models import Round, Tournament
+from tournaments.utils import bump_cache_version, bump_draw_cache_version
 from users.permissions import get_permissions, Permission
 from venues.models import Venue, VenueCategory
 
@@ -340,6 +342,28 @@ class BreakingTeamsView(TournamentAPIMixin, TournamentPublicAPIMixin, GenerateBr
         return self.create(request, *args, **kwargs)
 
 
+@extend_schema(tags=['break-categories'], parameters=round_parameters)
+class RoundLivenessView(RoundAPIMixin, AdministratorAPIMixin, GenericAPIView):
+    serializer_class = serializers.BreakCategoryLivenessSerializer
+    tournament_field = 'tournament'
+    pagination_class = None
+
+    list_permission = Permission.VIEW_BREAK_CATEGORIES
+
+    def get_queryset(self):
+        return self.tournament.breakcategory_set.select_related('tournament')
+
+    @extend_schema(summary="Get break liveness thresholds for round",
+        responses=serializers.BreakCategoryLivenessSerializer(many=True))
+    def get(self, request, *args, **kwargs):
+        thresholds = get_live_thresholds(self.round)
+        categories = list(self.get_queryset())
+        for bc in categories:
+            bc.safe, bc.dead = thresholds.get(bc.id, (None, None))
+        serializer = self.get_serializer(categories, many=True)
+        return Response(serializer.data)
+
+
 @extend_schema(tags=['institutions'], parameters=[tournament_parameter])
 @extend_schema_view(
     list=extend_schema(summary="List institutions in tournament", parameters=[
@@ -1008,9 +1032,26 @@ class PairingViewSet(RoundAPIMixin, ModelViewSet):
             'debateadjudicator_set', 'debateadjudicator_set__adjudicator', 'debateadjudicator_set__adjudicator__tournament',
         )
 
+    # Pairings aren't watched by signal receivers (see draw.signals)
+
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        bump_draw_cache_version(self.round)
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        bump_draw_cache_version(self.round)
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        bump_draw_cache_version(self.round)
+        bump_cache_version(self.tournament, 'results')
+
     @extend_schema(summary="Delete all pairings in the round")
     def delete_all(self, request, *args, **kwargs):
         self.get_queryset().delete()
+        bump_draw_cache_version(self.round)
+        bump_cache_version(self.tournament, 'results')
         self.log_action(ActionLogEntry.ActionType.DRAW_REGENERATE)
         return Response(status=204)  # No content
 
@@ -2,6 +2,7 @@
 # Contributed by Thevesh Theva and his work on the debatebreaker.blogspot.com.au
 # blog and app.
 
+from functools import lru_cache
 from itertools import accumulate
 from math import ceil, comb, floor
 
@@ -11,11 +12,16 @@ def get_bp_coefficients(nrounds):
     triangle (similar to Pascal's triangle). Only calculate half the row and mirror.
 
     See: https://oeis.org/A008287"""
+    return list(_bp_coefficients(nrounds))
+
+
+@lru_cache(maxsize=None)
+def _bp_coefficients(nrounds):
 
     def get_coefficient(m, k):
         return sum(comb(m, i) * comb(m, k - 2 * i) for i in range(k // 2 + 1))
 
-    half_row = [get_coefficient(nrounds, k) for k in range(ceil((3 * nrounds + 1) / 2))]
+    half_row = tuple(get_coefficient(nrounds, k) for k in range(ceil((3 * nrounds + 1) / 2)))
 
     if nrounds == 0:
         return half_row
@@ -26,17 +32,28 @@ def get_bp_coefficients(nrounds):
     return half_row + half_row[-2::-1]
 
 
+@lru_cache(maxsize=None)
+def _cumulative_team_bounds(nteams, total_teams, total_rounds):
+    """Returns `(sum_u, sum_d)`, the most and fewest teams that can have lost
+    `i` or fewer points after all rounds, for a format with `nteams` teams per
+    debate. These depend only on the tournament's size, so they're memoised."""
+    if nteams == 4:
+        coefficients = _bp_coefficients(total_rounds)
+    else:
+        coefficients = [comb(total_rounds, i) for i in range(total_rounds+1)]
+
+    originals = [total_teams / (nteams**total_rounds) * coeff for coeff in coefficients]
+    sum_u = tuple(accumulate(ceil(x) for x in originals))   # most teams that can be on i wins
+    sum_d = tuple(accumulate(floor(x) for x in originals))  # fewest teams that can be on i wins
+    return sum_u, sum_d
+
+
 def liveness_twoteam(is_general, current_round, break_size, total_teams, total_rounds, team_scores=[]):
 
     if total_teams < break_size or (not is_general and len(team_scores) <= break_size):
         return 0, -1  # special case, everyone is safe
 
-    coefficients = [comb(total_rounds, i) for i in range(total_rounds+1)]
-    originals = [total_teams / (2**total_rounds) * coeff for coeff in coefficients]
-    ceilings = [ceil(x) for x in originals]
-    floors = [floor(x) for x in originals]
-    sum_u = list(accumulate(ceilings))  # most teams that can be on i wins
-    sum_d = list(accumulate(floors))    # fewest teams that can be on i wins
+    sum_u, sum_d = _cumulative_team_bounds(2, total_teams, total_rounds)
 
     rounds_to_go = total_rounds - current_round + 1
 
@@ -69,11 +86,7 @@ def liveness_bp(is_general, current_round, break_size, total_teams, total_rounds
     if total_teams < break_size or (not is_general and len(team_scores) <= break_size):
         return -1, -1  # special case, everyone is safe
 
-    originals = [total_teams / (4**total_rounds) * coeff for coeff in get_bp_coefficients(total_rounds)]
-    ceilings = [ceil(x) for x in originals]
-    floors = [floor(x) for x in originals]
-    sum_u = list(accumulate(ceilings))  # most teams that can be on i wins
-    sum_d = list(accumulate(floors))    # fewest teams that can be on i wins
+    sum_u, sum_d = _cumulative_team_bounds(4, total_teams, total_rounds)
 
     max_points = total_rounds * 3
     points_to_go = (total_rounds - current_round + 1) * 3
@@ -0,0 +1,25 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from participants.models import Team
+from tournaments.utils import bump_cache_version
+
+from .models import BreakCategory
+
+# The breaks cache version (see `tournaments.utils.get_cache_version()`) keys
+# live break thresholds, which depend on the number of teams and which teams
+# are eligible for each break category.
+
+
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+@receiver(post_save, sender=BreakCategory)
+@receiver(post_delete, sender=BreakCategory)
+def update_breaks_cache_version(sender, instance, **kwargs):
+    bump_cache_version(instance.tournament, 'breaks')
+
+
+@receiver(m2m_changed, sender=Team.break_categories.through)
+def update_breaks_cache_version_for_eligibility(sender, instance, action, **kwargs):
+    if action.startswith('post_'):
+        update_breaks_cache_version(type(instance), instance)
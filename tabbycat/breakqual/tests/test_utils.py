@@ -0,0 +1,78 @@
+from django.core.cache import cache
+from django.db.models import Sum
+from django.test import TestCase
+
+from participants.models import Institution, Team
+from tournaments.utils import get_cache_version
+from utils.tests import CompletedTournamentTestMixin
+
+from ..liveness import liveness_bp, liveness_twoteam
+from ..models import BreakCategory
+from ..utils import calculate_live_thresholds, get_live_thresholds
+
+
+def calculate_live_thresholds_separately(bc, tournament, round):
+    """The original per-category calculation, which `get_live_thresholds()`
+    replaces with one that computes all categories from the same queries."""
+    total_teams = tournament.team_set.count()
+    total_rounds = tournament.prelim_rounds().count()
+
+    if not bc.is_general:
+        team_scores = bc.team_set.filter(
+            debateteam__debate__round__seq__lt=round.seq,
+            debateteam__teamscore__ballot_submission__confirmed=True,
+            debateteam__teamscore__points__isnull=False,
+        ).annotate(score=Sum('debateteam__teamscore__points')).order_by('-score').values_list('score', flat=True)
+        team_scores = list(team_scores)
+        team_scores += [0] * (bc.team_set.count() - len(team_scores))
+    else:
+        team_scores = []
+
+    if bc.break_size <= 1 or total_teams == 0:
+        return None, None
+    elif tournament.pref('teams_in_debate') == 4:
+        return liveness_bp(bc.is_general, round.seq, bc.break_size, total_teams, total_rounds, team_scores)
+    else:
+        return liveness_twoteam(bc.is_general, round.seq, bc.break_size, total_teams, total_rounds, team_scores)
+
+
+class TestLiveThresholds(CompletedTournamentTestMixin, TestCase):
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.categories = list(self.tournament.breakcategory_set.all())
+        self.esl = BreakCategory.objects.get(tournament=self.tournament, slug='esl')
+
+    def assertThresholdsMatch(self, round):  # noqa: N802
+        thresholds = get_live_thresholds(round)
+        for bc in self.categories:
+            with self.subTest(round=round.seq, category=bc.name):
+                expected = calculate_live_thresholds_separately(bc, self.tournament, round)
+                self.assertEqual(thresholds[bc.id], tuple(expected))
+                self.assertEqual(calculate_live_thresholds(bc, self.tournament, round), thresholds[bc.id])
+
+    def test_matches_separate_calculation(self):
+        for round in self.tournament.round_set.filter(seq__lte=5):
+            self.assertThresholdsMatch(round)
+
+    def test_recalculated_after_eligibility_change(self):
+        round = self.tournament.round_set.get(seq=4)
+        self.assertThresholdsMatch(round)
+
+        version = get_cache_version(self.tournament, 'breaks')
+        teams = Team.objects.filter(tournament=self.tournament).exclude(break_categories=self.esl)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.esl.team_set.add(*teams[:4])
+        self.assertNotEqual(get_cache_version(self.tournament, 'breaks'), version)
+        self.assertThresholdsMatch(round)
+
+    def test_recalculated_after_team_added(self):
+        round = self.tournament.round_set.get(seq=4)
+        self.assertThresholdsMatch(round)
+
+        institution = Institution.objects.first()
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(8):
+                Team.objects.create(tournament=self.tournament, institution=institution, reference="New %d" % i)
+        self.assertThresholdsMatch(round)
@@ -1,11 +1,16 @@
 import itertools
 import logging
 
+from django.conf import settings
+from django.core.cache import cache
 from django.db.models import Count, Max, Q, Sum
 from django.utils.translation import gettext_lazy as _
 
+from participants.models import Team
+from results.models import TeamScore
 from standings.teams import TeamStandingsGenerator
 from tournaments.models import Round
+from tournaments.utils import get_cache_version
 
 from .liveness import liveness_bp, liveness_twoteam
 
@@ -97,32 +102,71 @@ def determine_liveness(thresholds, points):
 
 
 def calculate_live_thresholds(bc, tournament, round):
+    """Returns `(safe, dead)` for the break category `bc` in `round`. Callers
+    that need more than one category should use `get_live_thresholds()`."""
+    return get_live_thresholds(round).get(bc.id, (None, None))
+
+
+def get_live_thresholds(round):
+    """Returns a dict mapping break category IDs to `(safe, dead)` thresholds
+    for `round`, computing all categories together from the same queries. The
+    result is cached until results in the tournament, the teams, break
+    eligibility or break category settings change."""
+    tournament = round.tournament
+    categories = list(tournament.breakcategory_set.all())
+    key = "live_thresholds_%d_%d_%d_%d" % (round.id, get_cache_version(tournament, 'results'),
+        get_cache_version(tournament, 'breaks'),
+        hash(tuple((bc.id, bc.break_size, bc.is_general) for bc in categories)))
+    thresholds = cache.get(key)
+    if thresholds is None:
+        thresholds = _calculate_all_live_thresholds(tournament, round, categories)
+        cache.set(key, thresholds, settings.TAB_PAGES_CACHE_TIMEOUT)
+    return thresholds
+
+
+def _calculate_all_live_thresholds(tournament, round, categories):
     total_teams = tournament.team_set.count()
     total_rounds = tournament.prelim_rounds().count()
+    four_teams = tournament.pref('teams_in_debate') == 4
+
+    # Scores are only needed for limited-eligibility categories
+    limited = [bc for bc in categories if not bc.is_general]
+    team_ids_by_category = {bc.id: [] for bc in limited}
+    points_by_team = {}
+    if limited:
+        for category_id, team_id in Team.break_categories.through.objects.filter(
+                breakcategory__in=limited).values_list('breakcategory_id', 'team_id'):
+            team_ids_by_category[category_id].append(team_id)
+
+        points_by_team = dict(TeamScore.objects.filter(
+            debate_team__team__tournament=tournament,
+            debate_team__debate__round__seq__lt=round.seq,
+            ballot_submission__confirmed=True,
+            points__isnull=False,
+        ).values_list('debate_team__team_id').annotate(score=Sum('points')).values_list('debate_team__team_id', 'score'))
+
+    thresholds = {}
+    for bc in categories:
+        if bc.is_general:
+            team_scores = []
+        else:
+            team_scores = sorted((points_by_team.get(team_id, 0) for team_id in team_ids_by_category[bc.id]), reverse=True)
+
+        if bc.break_size <= 1 or total_teams == 0:
+            thresholds[bc.id] = (None, None)  # Bad input
+            continue
+        elif four_teams:
+            safe, dead = liveness_bp(bc.is_general, round.seq, bc.break_size,
+                                total_teams, total_rounds, team_scores)
+        else:
+            safe, dead = liveness_twoteam(bc.is_general, round.seq, bc.break_size,
+                                  total_teams, total_rounds, team_scores)
 
-    if not bc.is_general:
-        team_scores = bc.team_set.filter(
-            debateteam__debate__round__seq__lt=round.seq,
-            debateteam__teamscore__ballot_submission__confirmed=True,
-            debateteam__teamscore__points__isnull=False,
-        ).annotate(score=Sum('debateteam__teamscore__points')).order_by('-score').values_list('score', flat=True)
-        team_scores = list(team_scores)
-        team_scores += [0] * (bc.team_set.count() - len(team_scores))
-    else:
-        team_scores = []
-
-    if bc.break_size <= 1 or total_teams == 0:
-        return None, None # Bad input
-    elif tournament.pref('teams_in_debate') == 4:
-        safe, dead = liveness_bp(bc.is_general, round.seq, bc.break_size,
-                            total_teams, total_rounds, team_scores)
-    else:
-        safe, dead = liveness_twoteam(bc.is_general, round.seq, bc.break_size,
-                              total_teams, total_rounds, team_scores)
+        logger.info("Liveness in %s R%d/%d with break size %d, %d teams: safe at %d, dead at %d",
+            tournament.short_name, round.seq, total_rounds, bc.break_size, total_teams, safe, dead)
+        thresholds[bc.id] = (safe, dead)
 
-    logger.info("Liveness in %s R%d/%d with break size %d, %d teams: safe at %d, dead at %d",
-        tournament.short_name, round.seq, total_rounds, bc.break_size, total_teams, safe, dead)
-    return safe, dead
+    return thresholds
 
 
 BREAK_ROUND_NAMES = [
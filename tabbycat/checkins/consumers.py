@@ -1,13 +1,12 @@
 from asgiref.sync import async_to_sync
 from channels.generic.websocket import JsonWebsocketConsumer
-from django.core.exceptions import ObjectDoesNotExist
 from django.utils.translation import gettext_lazy as _
 
 from options.utils import use_team_code_names_data_entry
 from tournaments.mixins import TournamentWebsocketMixin
 from users.permissions import has_permission, Permission
 
-from .models import Event, Identifier
+from .models import DebateIdentifier, Event, PersonIdentifier, VenueIdentifier
 from .utils import get_unexpired_checkins
 
 
@@ -17,69 +16,88 @@ class CheckInEventConsumer(TournamentWebsocketMixin, JsonWebsocketConsumer):
 
     edit_permission = Permission.EDIT_PARTICIPANT_CHECKIN
 
+    # Related objects needed to describe each kind of identifier's owner
+    IDENTIFIER_OWNER_RELATIONS = {
+        PersonIdentifier: (['person'], []),
+        VenueIdentifier: (['venue'], []),
+        DebateIdentifier: (['debate__round__tournament'], ['debate__debateteam_set__team']),
+    }
+
     def receive_json(self, content):
         # Because the public can receive but not send checkins we need to
         # re-authenticate here:
         if not has_permission(self.scope["user"], self.edit_permission, self.tournament):
             return
 
+        # Process the checkins here, once, rather than in every consumer in the
+        # group, then send the result to the group
+        barcodes = [b for b in content['barcodes'] if b is not None]
+        identifiers = self.get_identifiers(barcodes)
+
+        # Only raise an error for single check-ins as for multi-check-in
+        # events via the status page its clear what has failed or not
+        if len(barcodes) == 1 and not identifiers:
+            msg = _("Sent checkin identifier doesn't exist")
+            self.send_error(_("Checkins"), msg, content)
+            return
+
+        if content['status'] is True:
+            checkins = self.create_checkins(identifiers)
+        else:
+            checkins = self.revoke_checkins(identifiers, content['type'])
+
+        if len(checkins) == 0 and content['status'] is not False:
+            msg = _("No checkin identifiers exist for sent barcodes")
+            self.send_error(_("Checkins"), msg, content)
+            return
+
         # Send message to room group about the new checkin
         async_to_sync(self.channel_layer.group_send)(
             self.group_name(), {
                 'type': 'broadcast_checkin',
-                'content': content,
+                'content': {'created': content['status'], 'checkins': checkins,
+                            'component_id': content['component_id']},
             },
         )
 
-    # Issue the relevant checkins
-    def broadcast_checkin(self, event):
-        content = event['content']
-        barcode_ids = [b for b in content['barcodes'] if b is not None]
-        return_content = {'created': content['status'], 'checkins': [],
-                          'component_id': content['component_id']}
-
+    def get_identifiers(self, barcodes):
+        """Returns a list of identifiers with the given barcodes, with their
+        owners already fetched."""
+        identifiers = []
+        for model, (select, prefetch) in self.IDENTIFIER_OWNER_RELATIONS.items():
+            queryset = model.objects.non_polymorphic().filter(barcode__in=barcodes)
+            identifiers.extend(queryset.select_related(*select).prefetch_related(*prefetch))
+        return identifiers
+
+    def create_checkins(self, identifiers):
+        events = Event.objects.bulk_create([Event(identifier=identifier, tournament=self.tournament)
+                                            for identifier in identifiers])
         use_team_code_names = use_team_code_names_data_entry(self.tournament, True)
 
-        for barcode in barcode_ids:
-            try:
-                identifier = Identifier.objects.get(barcode=barcode)
-                if content['status'] is True:
-                    # If checking-in someone
-                    checkin = Event.objects.create(identifier=identifier,
-                                                   tournament=self.tournament)
-                    checkin_dict = checkin.serialize()
-
-                    if hasattr(identifier.owner, 'matchup'):
-                        if use_team_code_names:
-                            checkin_dict['owner_name'] = identifier.owner.matchup_codes
-                        else:
-                            checkin_dict['owner_name'] = identifier.owner.matchup
-                    else:
-                        checkin_dict['owner_name'] = identifier.owner.name
-
-                    return_content['checkins'].append(checkin_dict)
+        checkins = []
+        for checkin in events:
+            checkin_dict = checkin.serialize()
+            owner = checkin.identifier.owner
+            if hasattr(owner, 'matchup'):
+                if use_team_code_names:
+                    checkin_dict['owner_name'] = owner.matchup_codes
                 else:
-                    # If undoing/revoking a check-in
-                    if content['type'] == 'people':
-                        window = 'checkin_window_people'
-                    else:
-                        window = 'checkin_window_venues'
-
-                    checkins = get_unexpired_checkins(self.tournament, window)
-                    checkins.filter(identifier=identifier).delete()
-                    return_content['checkins'].append({'identifier': barcode})
-
-            except ObjectDoesNotExist:
-                # Only raise an error for single check-ins as for multi-check-in
-                # events via the status page its clear what has failed or not
-                if len(barcode_ids) == 1:
-                    msg = _("Sent checkin identifier doesn't exist")
-                    self.send_error(_("Checkins"), msg, content)
-                    return
-
-        if len(return_content['checkins']) == 0 and content['status'] is not False:
-            msg = _("No checkin identifiers exist for sent barcodes")
-            self.send_error(_("Checkins"), msg, content)
-            return
+                    checkin_dict['owner_name'] = owner.matchup
+            else:
+                checkin_dict['owner_name'] = owner.name
+            checkins.append(checkin_dict)
+        return checkins
+
+    def revoke_checkins(self, identifiers, type):
+        if type == 'people':
+            window = 'checkin_window_people'
+        else:
+            window = 'checkin_window_venues'
+
+        checkins = get_unexpired_checkins(self.tournament, window)
+        checkins.filter(identifier__in=identifiers).delete()
+        return [{'identifier': identifier.barcode} for identifier in identifiers]
 
-        self.send_json(return_content)
+    # Issue the relevant checkins
+    def broadcast_checkin(self, event):
+        self.send_json(event['content'])
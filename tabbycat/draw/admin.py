@@ -3,20 +3,40 @@ from django.db.models import Prefetch
 from django.utils.translation import gettext_lazy as _, ngettext
 
 from adjallocation.models import DebateAdjudicator
-from utils.admin import ModelAdmin, TabbycatModelAdminFieldsMixin
+from adjfeedback.aggregates import update_feedback_aggregates_from_sources
+from tournaments.models import Round
+from tournaments.utils import bump_draw_cache_version
+from utils.admin import CacheVersionsAdminMixin, ModelAdmin, TabbycatModelAdminFieldsMixin
 
 from .models import Debate, DebateTeam
 
 
+class DrawCacheVersionAdminMixin(CacheVersionsAdminMixin):
+    """Also bumps the draw cache version for the rounds affected by edits
+    (see `draw.signals`). `round_lookup` is the lookup from `Round` to the
+    model."""
+
+    round_lookup = None
+
+    def bump_cache_versions(self, objects):
+        super().bump_cache_versions(objects)
+        rounds = Round.objects.filter(**{self.round_lookup + '__in': objects}).select_related('tournament')
+        for round in rounds.distinct():
+            bump_draw_cache_version(round)
+
+
 # ==============================================================================
 # DebateTeam
 # ==============================================================================
 
 @admin.register(DebateTeam)
-class DebateTeamAdmin(TabbycatModelAdminFieldsMixin, ModelAdmin):
+class DebateTeamAdmin(DrawCacheVersionAdminMixin, TabbycatModelAdminFieldsMixin, ModelAdmin):
     list_display = ('team', 'side', 'debate', 'get_tournament', 'get_round')
     search_fields = ('team__long_name', 'team__short_name', 'team__institution__name', 'team__institution__code', 'flags')
     raw_id_fields = ('debate', 'team')
+    cache_versions = ('results',)
+    tournament_lookup = 'round__debate__debateteam'
+    round_lookup = 'debate__debateteam'
 
     def get_queryset(self, request):
         return super().get_queryset(request).select_related(
@@ -43,13 +63,16 @@ class DebateAdjudicatorInline(admin.TabularInline):
 
 
 @admin.register(Debate)
-class DebateAdmin(ModelAdmin):
+class DebateAdmin(DrawCacheVersionAdminMixin, ModelAdmin):
     list_display = ('id', 'round', 'bracket', 'matchup', 'result_status', 'sides_confirmed')
     list_filter = ('round__tournament', 'round')
     list_editable = ('result_status', 'sides_confirmed')
     inlines = (DebateTeamInline, DebateAdjudicatorInline)
     raw_id_fields = ('venue',)
     actions = ('mark_as_sides_confirmed', 'mark_as_sides_not_confirmed')
+    cache_versions = ('results',)
+    tournament_lookup = 'round__debate'
+    round_lookup = 'debate'
 
     def get_queryset(self, request):
         return super().get_queryset(request).select_related(
@@ -59,8 +82,14 @@ class DebateAdmin(ModelAdmin):
             'venue__venuecategory_set',
         )
 
+    def save_formset(self, request, form, formset, change):
+        super().save_formset(request, form, formset, change)
+        if formset.model is DebateAdjudicator:
+            update_feedback_aggregates_from_sources([obj for obj, fields in formset.changed_objects if 'type' in fields])
+
     def mark_as_sides_confirmed(self, request, queryset):
         updated = queryset.update(sides_confirmed=True)
+        self.bump_cache_versions(queryset)
         for obj in queryset:
             self.log_change(request, obj, [{"changed": {"fields": ["sides_confirmed"]}}])
         message = ngettext(
@@ -73,6 +102,7 @@ class DebateAdmin(ModelAdmin):
     @admin.display(description=_("Mark sides as not confirmed"))
     def mark_as_sides_not_confirmed(self, request, queryset):
         updated = queryset.update(sides_confirmed=False)
+        self.bump_cache_versions(queryset)
         for obj in queryset:
             self.log_change(request, obj, [{"changed": {"fields": ["sides_confirmed"]}}])
         message = ngettext(
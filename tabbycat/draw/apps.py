@@ -5,3 +5,6 @@ from django.utils.translation import gettext_lazy as _
 class DrawConfig(AppConfig):
     name = 'draw'
     verbose_name = _("Draw")
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -6,8 +6,11 @@ from channels.generic.websocket import JsonWebsocketConsumer
 from channels.layers import get_channel_layer
 
 from actionlog.models import ActionLogEntry
+from adjallocation.models import DebateAdjudicator
 from adjallocation.serializers import SimpleDebateAllocationSerializer, SimpleDebateImportanceSerializer
+from adjfeedback.aggregates import update_feedback_aggregates_from_sources
 from tournaments.mixins import RoundWebsocketMixin
+from tournaments.utils import bump_draw_cache_version
 from users.permissions import Permission
 from utils.mixins import SuperuserRequiredWebsocketMixin
 from venues.serializers import SimpleDebateVenueSerializer
@@ -103,6 +106,7 @@ class BaseAdjudicatorContainerConsumer(SuperuserRequiredWebsocketMixin, RoundWeb
 
     def return_attributes(self, original_content, serialized_content):
         """ Return the original JSON but with the generic debatesOrPanels key """
+        bump_draw_cache_version(self.round)
         original_content['debatesOrPanels'] = serialized_content.data
         async_to_sync(get_channel_layer().group_send)(
             self.group_name(), {
@@ -161,6 +165,13 @@ class DebateEditConsumer(BaseAdjudicatorContainerConsumer):
 
         debate._populate_teams()
 
+    def receive_adjudicators(self, content):
+        # Feedback from trainees doesn't count, so changing adjudicators'
+        # types might change the feedback scores of those they gave it to
+        super().receive_adjudicators(content)
+        debate_ids = [int(c['id']) for c in content['adjudicators']]
+        update_feedback_aggregates_from_sources(DebateAdjudicator.objects.filter(debate_id__in=debate_ids))
+
     def receive_teams(self, content):
         changes = {int(c['id']): c for c in content['teams']}
         debates = self.get_debates_or_panels(changes)
@@ -194,6 +205,8 @@ class EditDebateOrPanelWorkerMixin(SyncConsumer):
     actions to edit and re-serialise debates/panels """
 
     def log_action(self, extra, round, type):
+        # Every worker action edits the draw (or panels), and logs itself once done
+        bump_draw_cache_version(round)
         ActionLogEntry.objects.log(type=type, user_id=extra['user_id'],
                 round=round, tournament=round.tournament, content_object=round)
 
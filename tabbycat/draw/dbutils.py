@@ -1,4 +1,5 @@
 from tournaments.models import Round
+from tournaments.utils import bump_draw_cache_version
 
 from .models import Debate
 
@@ -7,3 +8,4 @@ def delete_round_draw(round, **options):
     Debate.objects.filter(round=round).delete()
     round.draw_status = Round.Status.NONE
     round.save()
+    bump_draw_cache_version(round)
@@ -8,6 +8,13 @@ from statistics import pvariance
 import munkres
 from django.utils.translation import gettext as _
 
+try:
+    import numpy as np
+    from scipy.optimize import linear_sum_assignment
+except ImportError:
+    np = None
+    linear_sum_assignment = None
+
 from .common import BaseBPDrawGenerator, DrawUserError
 from .pairing import PolyPairing
 
@@ -64,6 +71,13 @@ class BPHungarianDrawGenerator(BaseBPDrawGenerator):
             "hungarian_preshuffled" - Hungarian algorithm, with the rows and
                                       columns of the cost matrix permuted
                                       randomly beforehand.
+
+            "lsa"                   - As for "hungarian_preshuffled", but the
+                                      cost matrix is built as a NumPy array and
+                                      solved using SciPy's linear_sum_assignment,
+                                      which is much faster for large draws.
+                                      Falls back to "hungarian_preshuffled" if
+                                      SciPy isn't installed.
     """
 
     requires_even_teams = True
@@ -217,6 +231,81 @@ class BPHungarianDrawGenerator(BaseBPDrawGenerator):
             return (2 - log2(sum([p ** α for p in probs])) / (1 - α)) * n
         return _position_cost_renyi_entropy
 
+    # Vectorised position costs, used to build the cost matrix as a NumPy array.
+    # These take an array of position histories (one row per team), and return
+    # an array of costs with one column per position.
+
+    POSITION_COST_ARRAY_FUNCTIONS = {
+        "simple"  : "_position_cost_array_simple",
+        "variance": "_position_cost_array_variance",
+    }
+
+    @staticmethod
+    def get_entropy_position_cost_array_function(α):  # noqa: N803
+        if α == 1.0:
+            return BPHungarianDrawGenerator._position_cost_array_shannon_entropy
+        elif α == 0.0:
+            return BPHungarianDrawGenerator._position_cost_array_min_entropy
+        elif α > 0.0:
+            return BPHungarianDrawGenerator._get_position_cost_array_renyi_entropy_function(α)
+        else:
+            raise DrawUserError(_("The Rényi order can't be negative, and it's currently set "
+                "to %(alpha)f.") % {'alpha': α})
+
+    def get_position_cost_array_function(self):
+        if self.options["position_cost"] == "entropy":
+            return self.get_entropy_position_cost_array_function(self.options["renyi_order"])
+        else:
+            return self.get_option_function("position_cost", self.POSITION_COST_ARRAY_FUNCTIONS)
+
+    @staticmethod
+    def _update_history_array(history):
+        # updated[i, pos] is the history of team i after being put in position pos
+        return history[:, np.newaxis, :] + np.eye(4)
+
+    @staticmethod
+    def _position_cost_array_simple(history):
+        return history
+
+    @staticmethod
+    def _position_cost_array_variance(history):
+        return BPHungarianDrawGenerator._update_history_array(history).var(axis=-1)
+
+    @staticmethod
+    def _position_cost_array_shannon_entropy(history):
+        history = BPHungarianDrawGenerator._update_history_array(history)
+        n = history.sum(axis=-1)
+        probs = history / n[..., np.newaxis]
+        selfinfo = np.where(probs > 0, -probs * np.log2(np.where(probs > 0, probs, 1)), 0)
+        return (2 - selfinfo.sum(axis=-1)) * n
+
+    @staticmethod
+    def _position_cost_array_min_entropy(history):
+        history = BPHungarianDrawGenerator._update_history_array(history)
+        return (2 - np.log2((history > 0).sum(axis=-1))) * history.sum(axis=-1)
+
+    @staticmethod
+    def _get_position_cost_array_renyi_entropy_function(α):  # noqa: N803
+        def _position_cost_array_renyi_entropy(history):
+            history = BPHungarianDrawGenerator._update_history_array(history)
+            n = history.sum(axis=-1)
+            probs = history / n[..., np.newaxis]
+            return (2 - np.log2((probs ** α).sum(axis=-1)) / (1 - α)) * n
+        return _position_cost_array_renyi_entropy
+
+    def generate_cost_array(self, rooms):
+        """Equivalent to `generate_cost_matrix()`, but returns a NumPy array,
+        with disallowed positions having infinite cost. Position costs don't
+        depend on the room, so they're computed once per team and tiled."""
+        cost = self.get_position_cost_array_function()
+        history = np.array([team.side_history for team in self.teams], dtype=float)
+        team_costs = cost(history) ** self.options["exponent"]
+        points = np.array([team.points for team in self.teams])
+        allowed = np.column_stack([np.isin(points, list(allowed)) for level, allowed in rooms])
+        costs = np.where(np.repeat(allowed, 4, axis=1), np.tile(team_costs, (1, len(rooms))), np.inf)
+        assert costs.shape == (len(self.teams), len(self.teams))
+        return costs
+
     def generate_cost_matrix(self, rooms):
         """Returns a cost matrix for the tournament.
         Rows (inner lists) are teams, in the same order as in `self.teams`.
@@ -227,7 +316,12 @@ class BPHungarianDrawGenerator(BaseBPDrawGenerator):
            DISALLOWED.
          - otherwise, for each position, use the position cost for that position
            (for a team with that position history).
+        If the "lsa" assignment method is used, returns a NumPy array instead.
         """
+        if (self.options["assignment_method"] == "lsa" and linear_sum_assignment is not None and
+                not callable(self.options["position_cost"])):
+            return self.generate_cost_array(rooms)
+
         nteams = len(self.teams)
         cost = self.get_position_cost_function()
         exponent = self.options["exponent"]
@@ -251,6 +345,7 @@ class BPHungarianDrawGenerator(BaseBPDrawGenerator):
     ASSIGNMENT_ALGORITHM_FUNCTIONS = {
         "hungarian"            : "_assign_hungarian",
         "hungarian_preshuffled": "_assign_hungarian_preshuffled",
+        "lsa"                  : "_assign_lsa",
     }
 
     def solve_assignment(self, costs):
@@ -263,7 +358,8 @@ class BPHungarianDrawGenerator(BaseBPDrawGenerator):
         indices = function(costs)
         total_cost = sum(costs[i][j] for i, j in indices)
         elapsed = time.perf_counter() - start
-        logger.info("Assignment took %.2f seconds, total cost: %f", elapsed, total_cost)
+        logger.info("Assignment (%s) took %.2f seconds, total cost: %f",
+            self.options["assignment_method"], elapsed, total_cost)
         return indices
 
     def _assign_hungarian(self, costs):
@@ -277,6 +373,18 @@ class BPHungarianDrawGenerator(BaseBPDrawGenerator):
         indices = self.munkres.compute(C)
         return [(K[i], J[j]) for i, j in indices]
 
+    def _assign_lsa(self, costs):
+        if linear_sum_assignment is None:
+            logger.warning("SciPy isn't installed, falling back to Hungarian algorithm with preshuffling")
+            return self._assign_hungarian_preshuffled(costs)
+        if not isinstance(costs, np.ndarray):  # e.g. with a custom position cost function
+            costs = np.array([[np.inf if cost is munkres.DISALLOWED else cost for cost in row] for row in costs])
+        n = len(costs)
+        K = np.random.permutation(n)               # noqa: N806
+        J = np.random.permutation(n)               # noqa: N806
+        rows, cols = linear_sum_assignment(costs[np.ix_(K, J)])
+        return [(int(K[i]), int(J[j])) for i, j in zip(rows, cols)]
+
     # Make pairings
 
     def make_pairings(self, rooms, indices):
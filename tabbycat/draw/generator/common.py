@@ -158,6 +158,9 @@ class BasePairDrawGenerator(BaseDrawGenerator):
         "avoid_institution" - if True, draw tries to avoid pairing teams that
             are from the same institution.
         "side_penalty" - A penalty to apply when optimizing with side balance
+        "pairing_candidates" - For minimum cost matching, if positive, the
+            number of lowest-cost opponents considered for each team before
+            falling back to all opponents. 0 means always consider all.
         """
 
     BASE_DEFAULT_OPTIONS = {
@@ -170,6 +173,7 @@ class BasePairDrawGenerator(BaseDrawGenerator):
         "pullup_debates_penalty": 0,
         "pairing_penalty"       : 0,
         "avoid_conflicts"       : "off",
+        "pairing_candidates"    : 0,
     }
 
     TEAMS_IN_DEBATE = 2
@@ -1,4 +1,6 @@
+import logging
 from collections import OrderedDict
+from itertools import combinations
 from typing import TYPE_CHECKING
 
 import munkres
@@ -9,6 +11,8 @@ from ..types import DebateSide
 if TYPE_CHECKING:
     from participants.models import Team
 
+logger = logging.getLogger(__name__)
+
 
 def sign(n: int) -> int:
     """Sign function for integers, -1, 0, or 1"""
@@ -62,20 +66,59 @@ class GraphGeneratorMixin:
         i = 0
         for j, (points, teams) in enumerate(brackets.items()):
             pairings[points] = []
-            graph = nx.Graph()
             n_teams = self.get_n_teams(teams)
-            for t1 in teams:
-                for t2 in teams:
-                    penalty = self.assignment_cost(t1, t2, n_teams, j)
-                    if penalty is not None:
-                        graph.add_edge(t1, t2, weight=penalty)
+            costs = {}
+            for t1, t2 in combinations(teams, 2):
+                penalty = self.assignment_cost(t1, t2, n_teams, j)
+                if penalty is not None:
+                    costs[(t1, t2)] = penalty
 
-            for pairing in nx.min_weight_matching(graph):
+            for pairing in self.min_weight_matching(teams, costs):
                 i += 1
                 pairings[points].append(Pairing(teams=pairing, bracket=points, room_rank=i))
 
         return pairings
 
+    def min_weight_matching(self, teams, costs):
+        """Returns a minimum weight matching of `teams`, where `costs` maps
+        pairs of teams to the cost of pairing them.
+
+        If the "pairing_candidates" option is positive, the matching is first
+        sought in a sparse graph, in which each team is only joined to that
+        many of its lowest-cost opponents (ties broken by closeness in rank).
+        If that graph has no perfect matching, the number of candidates is
+        doubled until it does, up to the complete graph."""
+
+        n_candidates = self.options["pairing_candidates"]
+        if 0 < n_candidates < len(teams) - 1:
+            ranks = {team: k for k, team in enumerate(teams)}
+            opponents = {team: [] for team in teams}
+            for (t1, t2), cost in costs.items():
+                distance = abs(ranks[t1] - ranks[t2])
+                opponents[t1].append((cost, distance, ranks[t2], t2))
+                opponents[t2].append((cost, distance, ranks[t1], t1))
+            for candidates in opponents.values():
+                candidates.sort(key=lambda x: x[:3])
+
+            while n_candidates < len(teams) - 1:
+                graph = nx.Graph()
+                for team, candidates in opponents.items():
+                    for cost, _, _, opponent in candidates[:n_candidates]:
+                        graph.add_edge(team, opponent, weight=cost)
+
+                matching = nx.min_weight_matching(graph)
+                if len(matching) == len(teams) // 2:
+                    return matching
+
+                logger.info("No perfect matching with %d candidates for %d teams, widening",
+                    n_candidates, len(teams))
+                n_candidates *= 2
+
+        graph = nx.Graph()
+        for (t1, t2), cost in costs.items():
+            graph.add_edge(t1, t2, weight=cost)
+        return nx.min_weight_matching(graph)
+
 
 class GraphAllocatedSidesMixin(GraphGeneratorMixin):
     """Use Hungarian algorithm rather than Bloom.
@@ -3,13 +3,16 @@ import random
 from operator import add
 from typing import List, Tuple, TYPE_CHECKING
 
+from django.db import connection, transaction
 from django.utils.translation import gettext as _
 
 from draw.generator.powerpair import BasePowerPairedDrawGenerator
+from participants.prefetch import populate_history
 from participants.utils import get_side_history
 from results.models import BallotSubmission, TeamScore
 from standings.teams import TeamStandingsGenerator
 from tournaments.models import Round
+from tournaments.utils import bump_cache_version, bump_draw_cache_version
 
 from .generator import BPEliminationResultPairing, DrawGenerator, DrawUserError, ResultPairing
 from .generator.utils import ispow2
@@ -30,6 +33,7 @@ OPTIONS_TO_CONFIG_MAPPING = {
     "pullup_debates_penalty": "draw_rules__pullup_debates_penalty",
     "side_penalty"          : "draw_rules__side_penalty",
     "pairing_penalty"       : "draw_rules__pairing_penalty",
+    "pairing_candidates"    : "draw_rules__pairing_candidates",
     "side_allocations"      : "draw_rules__draw_side_allocations",
     "avoid_conflicts"       : "draw_rules__draw_avoid_conflicts",
     "odd_bracket"           : "draw_rules__draw_odd_bracket",
@@ -82,6 +86,7 @@ class BaseDrawManager:
                 "pullup_debates_penalty",
                 "side_penalty",
                 "pairing_penalty",
+                "pairing_candidates",
                 "avoid_conflicts",
             ]
         return []
@@ -161,23 +166,32 @@ class BaseDrawManager:
 
     def _make_bye_debates(self, byes: List['Team'], room_rank: int) -> list[Debate]:
         """We'd want the room rank as to always show byes at the bottom"""
-        debates = []
-        for i, bye in enumerate(byes, start=room_rank + 1):
-            debate = Debate(round=self.round, bracket=-1, room_rank=i)
-            debate.save()
-            debates.append(debate)
-
-            dt = DebateTeam(debate=debate, team=bye, side=DebateSide.BYE)
-            dt.save()
-
-            if self.round.tournament.pref('bye_team_results') == 'points':
-                bs = BallotSubmission(submitter_type=BallotSubmission.Submitter.AUTOMATION, confirmed=True, debate=debate)
-                bs.save()
-                TeamScore.objects.create(ballot_submission=bs, debate_team=dt, points=1, win=True)
+        if not byes:
+            return []
+
+        debates = [Debate(round=self.round, bracket=-1, room_rank=i) for i in range(room_rank + 1, room_rank + len(byes) + 1)]
+        Debate.objects.bulk_create(debates)
+
+        debateteams = [DebateTeam(debate=debate, team=bye, side=DebateSide.BYE) for debate, bye in zip(debates, byes)]
+        DebateTeam.objects.bulk_create(debateteams)
+        logger.debug("Created %d bye debates", len(debates))
+
+        if self.round.tournament.pref('bye_team_results') == 'points':
+            # These debates are new, so there are no other ballots for them to
+            # take the version number from or to unconfirm (cf. Submission.save())
+            ballotsubs = [BallotSubmission(submitter_type=BallotSubmission.Submitter.AUTOMATION,
+                confirmed=True, debate=debate, version=1) for debate in debates]
+            BallotSubmission.objects.bulk_create(ballotsubs)
+            TeamScore.objects.bulk_create([TeamScore(ballot_submission=bs, debate_team=dt, points=1, win=True)
+                for bs, dt in zip(ballotsubs, debateteams)])
+            logger.debug("Created %d bye results", len(ballotsubs))
+
         return debates
 
     def delete(self):
         self.round.debate_set.all().delete()
+        bump_draw_cache_version(self.round)
+        bump_cache_version(self.round.tournament, 'results')  # the debates might have had results
 
     def create(self, options: dict | None = None) -> list[Debate]:
         """Generates a draw and populates the database with it."""
@@ -200,6 +214,7 @@ class BaseDrawManager:
         rrseq = self.get_rrseq()
 
         self._populate_side_history(teams)
+        populate_history(teams)  # generators call Team.seen() for many pairs
         if options.get("side_allocations") == "preallocated":
             self._populate_team_side_allocations(teams)
 
@@ -208,12 +223,25 @@ class BaseDrawManager:
         drawer = DrawGenerator(self.teams_in_debate, generator_type, teams,
                 results=results, rrseq=rrseq, **options)
         pairings = drawer.generate()
-        debates = self._make_debates(pairings)
 
-        debates.extend(self._make_bye_debates(byes, max([p.room_rank for p in pairings], default=0)))
+        queries = []
+
+        def count_queries(execute, sql, params, many, context):
+            queries.append(sql)
+            return execute(sql, params, many, context)
+
+        with transaction.atomic(), connection.execute_wrapper(count_queries):
+            debates = self._make_debates(pairings)
+            debates.extend(self._make_bye_debates(byes, max([p.room_rank for p in pairings], default=0)))
+
+            # Saving the round also invalidates cached results (see tournaments.signals),
+            # which bulk-created bye results don't trigger themselves
+            self.round.draw_status = Round.Status.DRAFT
+            self.round.save()
+            bump_draw_cache_version(self.round)  # nor do bulk-created debates
 
-        self.round.draw_status = Round.Status.DRAFT
-        self.round.save()
+        logger.info("Saved draw for %s: %d debates (%d byes) in %d queries",
+            self.round.name, len(debates), len(byes), len(queries))
 
         return debates
 
@@ -263,7 +291,8 @@ class PowerPairedDrawManager(BaseDrawManager):
             extra_metrics.add("pullup_debates")
         extra_metrics -= set(metrics)
 
-        generator = TeamStandingsGenerator(metrics, ('rank', 'subrank'), tiebreak="random", extra_metrics=list(extra_metrics))
+        # Don't use cached standings, so that ties are broken afresh each time the draw is generated
+        generator = TeamStandingsGenerator(metrics, ('rank', 'subrank'), tiebreak="random", extra_metrics=list(extra_metrics), cache=False)
         standings = generator.generate(teams, round=self.round.prev)
 
         ranked = []
@@ -0,0 +1,73 @@
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_save
+from django.dispatch import receiver
+
+from motions.models import Motion, RoundMotion
+from participants.models import Adjudicator, Institution, Speaker, Team
+from tournaments.models import Tournament
+from tournaments.utils import bump_cache_version, bump_cache_version_where
+from venues.models import Venue, VenueCategory
+
+# The draw cache version (see `tournaments.utils.get_cache_version()`) keys
+# pages and objects that show the draw, so it's bumped whenever anything
+# shown in the draw changes.
+#
+# Debates, debate teams and debate adjudicators aren't watched here: they're
+# written many rows at a time, and a receiver would cost a query per row (and
+# receivers on deletions would stop Django from deleting them in bulk). Code
+# that changes them calls `tournaments.utils.bump_draw_cache_version()` once
+# it's done instead, as do rounds when saved (see `tournaments.signals`). For
+# the same reason, deletions of the other objects below are handled where they
+# happen, e.g. in the admin site, rather than here.
+
+
+@receiver(post_save, sender=Team)
+@receiver(post_save, sender=Motion)
+def update_draw_cache_version_for_tournament_object(sender, instance, **kwargs):
+    bump_cache_version(Tournament(id=instance.tournament_id), 'draw')
+
+
+@receiver(post_save, sender=RoundMotion)
+def update_draw_cache_version_for_round_motion(sender, instance, **kwargs):
+    bump_cache_version_where('draw', round=instance.round_id)
+
+
+@receiver(post_save, sender=Speaker)
+def update_draw_cache_version_for_speaker(sender, instance, **kwargs):
+    bump_cache_version_where('draw', team=instance.team_id)
+
+
+# Adjudicators, rooms and room categories can be shared between tournaments
+
+@receiver(post_save, sender=Adjudicator)
+def update_draw_cache_version_for_adjudicator(sender, instance, **kwargs):
+    bump_cache_version_where('draw', Q(id=instance.tournament_id) |
+        Q(round__debate__debateadjudicator__adjudicator=instance.id))
+
+
+@receiver(post_save, sender=Venue)
+def update_draw_cache_version_for_venue(sender, instance, **kwargs):
+    bump_cache_version_where('draw', Q(id=instance.tournament_id) | Q(round__debate__venue=instance.id))
+
+
+@receiver(post_save, sender=VenueCategory)
+def update_draw_cache_version_for_venue_category(sender, instance, **kwargs):
+    bump_cache_version_where('draw', Q(id=instance.tournament_id) |
+        Q(round__debate__venue__venuecategory=instance.id))
+
+
+@receiver(m2m_changed, sender=VenueCategory.venues.through)
+def update_draw_cache_version_for_venue_categories(sender, instance, action, **kwargs):
+    if action.startswith('post_'):
+        if isinstance(instance, Venue):
+            update_draw_cache_version_for_venue(Venue, instance)
+        else:
+            update_draw_cache_version_for_venue_category(VenueCategory, instance)
+
+
+# Team names are updated by re-saving the teams (see `participants.signals`),
+# but adjudicators show institution codes too
+
+@receiver(post_save, sender=Institution)
+def update_draw_cache_version_for_institution(sender, instance, **kwargs):
+    bump_cache_version_where('draw', round__debate__debateadjudicator__adjudicator__institution=instance.id)
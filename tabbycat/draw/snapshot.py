@@ -0,0 +1,182 @@
+"""Read-only snapshots of the draw for a round.
+
+A `DrawSnapshot` holds the debates of a round with their teams, speakers,
+adjudicators and rooms, as small slotted objects rather than model instances.
+It's built from a fixed number of queries, however large the draw, and cached
+until the draw changes, so that code that only reads the draw (like
+printing and notifications) can share one copy of it rather than each building
+its own prefetch tree with `Round.debate_set_with_prefetches()`.
+
+Snapshot objects mirror the attributes and methods of the models they stand in
+for where they're cheap to provide, but they can't be saved, and anything that
+needs a related object that isn't in the snapshot should use the models.
+Snapshots hold nothing that depends on results, so that entering ballots
+doesn't throw them away."""
+
+import logging
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from django.utils.translation import gettext
+
+from adjallocation.allocation import AdjudicatorAllocation
+from adjallocation.models import DebateAdjudicator
+from participants.models import Person, Speaker
+from tournaments.utils import get_cache_version, get_side_name
+from venues.models import Venue
+
+from .models import Debate, DebateTeam
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotObject:
+    __slots__ = ()
+
+    def __init__(self, **kwargs):
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+
+    def __repr__(self):
+        return "<%s %s>" % (self.__class__.__name__, getattr(self, 'id', None))
+
+
+class SnapshotPerson(SnapshotObject):
+    """A speaker or adjudicator. `institution_code` is None for speakers."""
+    __slots__ = ('id', 'name', 'code_name', 'anonymous', 'institution_code')
+
+    get_public_name = Person.get_public_name
+
+
+class SnapshotTeam(SnapshotObject):
+    __slots__ = ('id', 'short_name', 'long_name', 'code_name', 'emoji', 'institution_code', 'speakers')
+
+
+class SnapshotVenue(SnapshotObject):
+    __slots__ = ('id', 'name', 'display_name')
+
+
+class SnapshotDebateTeam(SnapshotObject):
+    __slots__ = ('id', 'side', 'team')
+
+    def get_side_name(self, tournament, name_type='full'):
+        try:
+            return get_side_name(tournament, self.side, name_type)
+        except KeyError:
+            return gettext('Team %d') % (self.side + 1)  # fallback
+
+
+class SnapshotDebate(SnapshotObject):
+    __slots__ = ('id', 'bracket', 'room_rank', 'importance', 'flags', 'sides_confirmed',
+                 'venue', 'debateteams', 'chair', 'panellists', 'trainees')
+
+    @property
+    def teams(self):
+        return [dt.team for dt in self.debateteams]
+
+    def get_dt(self, side):
+        for dt in self.debateteams:
+            if dt.side == side:
+                return dt
+        raise DebateTeam.DoesNotExist("No team on side %d in debate %d" % (side, self.id))
+
+    def get_team(self, side):
+        return self.get_dt(side).team
+
+    @property
+    def adjudicators(self):
+        return AdjudicatorAllocation(self, chair=self.chair, panellists=self.panellists, trainees=self.trainees)
+
+    def matchup(self, tournament, use_codes=False):
+        """Like `Debate.matchup` (or `Debate.matchup_codes`, if `use_codes` is
+        True)."""
+        def team_name(team):
+            return team.code_name if use_codes else team.short_name
+
+        if not self.sides_confirmed:
+            return ", ".join([team_name(dt.team) for dt in self.debateteams]) + gettext(" (sides not confirmed)")
+
+        try:
+            return gettext(" vs ").join(team_name(self.get_team(side)) for side in tournament.sides)
+        except (DebateTeam.DoesNotExist, IndexError):
+            return ", ".join(["%s (%s)" % (team_name(dt.team), dt.get_side_name(tournament))
+                for dt in self.debateteams])
+
+
+class DrawSnapshot:
+    """The debates in a round, in the same order as
+    `Round.debate_set_with_prefetches()` (by room name). Use `for_round()` to
+    get the cached snapshot for a round."""
+
+    __slots__ = ('round_id', 'debates')
+
+    def __init__(self, round_id, debates):
+        self.round_id = round_id
+        self.debates = debates
+
+    def __iter__(self):
+        return iter(self.debates)
+
+    def __len__(self):
+        return len(self.debates)
+
+    @classmethod
+    def for_round(cls, round):
+        key = "drawsnapshot_%d_%d" % (round.id, get_cache_version(round.tournament, 'draw'))
+        snapshot = cache.get(key)
+        if snapshot is None:
+            snapshot = cls.build(round)
+            cache.set(key, snapshot, settings.TAB_PAGES_CACHE_TIMEOUT)
+        return snapshot
+
+    @classmethod
+    def build(cls, round):
+        venues = {venue.id: SnapshotVenue(id=venue.id, name=venue.name, display_name=venue.display_name)
+                  for venue in Venue.objects.filter(debate__round=round).distinct().prefetch_related('venuecategory_set')}
+
+        speakers_by_team = defaultdict(list)
+        for speaker in Speaker.objects.filter(team__debateteam__debate__round=round).distinct().order_by('name').values(
+                'id', 'team_id', 'name', 'code_name', 'anonymous'):
+            team_id = speaker.pop('team_id')
+            speakers_by_team[team_id].append(SnapshotPerson(institution_code=None, **speaker))
+
+        debateteams_by_debate = defaultdict(list)
+        debateteams = DebateTeam.objects.filter(debate__round=round).values(
+            'id', 'debate_id', 'side', 'team_id', 'team__short_name', 'team__long_name',
+            'team__code_name', 'team__emoji', 'team__institution__code',
+        ).order_by('side')
+        for dt in debateteams:
+            team = SnapshotTeam(id=dt['team_id'], short_name=dt['team__short_name'], long_name=dt['team__long_name'],
+                code_name=dt['team__code_name'], emoji=dt['team__emoji'], institution_code=dt['team__institution__code'],
+                speakers=speakers_by_team[dt['team_id']])
+            debateteams_by_debate[dt['debate_id']].append(SnapshotDebateTeam(id=dt['id'], side=dt['side'], team=team))
+
+        adjudicators = {}
+        debateadjs_by_debate = defaultdict(list)
+        for da in DebateAdjudicator.objects.filter(debate__round=round).order_by('adjudicator__name').values(
+                'debate_id', 'type', 'adjudicator_id', 'adjudicator__name', 'adjudicator__code_name',
+                'adjudicator__anonymous', 'adjudicator__institution__code'):
+            adj = adjudicators.setdefault(da['adjudicator_id'], SnapshotPerson(
+                id=da['adjudicator_id'], name=da['adjudicator__name'], code_name=da['adjudicator__code_name'],
+                anonymous=da['adjudicator__anonymous'], institution_code=da['adjudicator__institution__code']))
+            debateadjs_by_debate[da['debate_id']].append((adj, da['type']))
+
+        debates = []
+        for debate in Debate.objects.filter(round=round).order_by(F('venue__name').asc(nulls_last=True)).values(
+                'id', 'bracket', 'room_rank', 'importance', 'flags', 'sides_confirmed', 'venue_id'):
+            debateadjs = debateadjs_by_debate[debate['id']]
+            chairs = [adj for adj, t in debateadjs if t == DebateAdjudicator.TYPE_CHAIR]
+            debates.append(SnapshotDebate(
+                id=debate['id'], bracket=debate['bracket'], room_rank=debate['room_rank'],
+                importance=debate['importance'], flags=debate['flags'], sides_confirmed=debate['sides_confirmed'],
+                venue=venues.get(debate['venue_id']),
+                debateteams=debateteams_by_debate[debate['id']],
+                chair=chairs[0] if chairs else None,
+                panellists=[adj for adj, t in debateadjs if t == DebateAdjudicator.TYPE_PANEL],
+                trainees=[adj for adj, t in debateadjs if t == DebateAdjudicator.TYPE_TRAINEE],
+            ))
+
+        logger.debug("Built draw snapshot for %s with %d debates", round, len(debates))
+        return cls(round.id, debates)
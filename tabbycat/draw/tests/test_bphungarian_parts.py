@@ -1,7 +1,9 @@
 import unittest
 
+import munkres
+
 from .utils import TestTeam
-from ..generator.bphungarian import BPHungarianDrawGenerator
+from ..generator.bphungarian import BPHungarianDrawGenerator, linear_sum_assignment
 
 DUMMY_TEAMS = [TestTeam(1, 'A', side_history=[0, 0, 0, 0]),
                TestTeam(2, 'B', side_history=[0, 0, 0, 0]),
@@ -45,3 +47,52 @@ class TestDefineRooms(unittest.TestCase):
 
     def test_pullup_one_room(self):
         self._test_define_rooms("one_room", self.one_room)
+
+
+@unittest.skipIf(linear_sum_assignment is None, "SciPy not installed")
+class TestCostArray(unittest.TestCase):
+    """Tests that the vectorised cost array used by the "lsa" assignment method
+    matches the cost matrix used by the Hungarian algorithm."""
+
+    teams = [TestTeam(i, 'I', points=p, side_history=h) for i, (p, h) in enumerate([
+        (3, [1, 1, 1, 0]), (3, [0, 2, 0, 1]), (2, [3, 0, 0, 0]), (2, [1, 0, 1, 1]),
+        (2, [0, 0, 0, 3]), (2, [1, 1, 0, 1]), (1, [2, 1, 0, 0]), (0, [0, 1, 1, 1]),
+    ])]
+
+    def _test_cost_array(self, position_cost, renyi_order=1.0):
+        generator = BPHungarianDrawGenerator(self.teams, position_cost=position_cost, renyi_order=renyi_order)
+        rooms = generator.define_rooms([team.points for team in self.teams])
+        matrix = generator.generate_cost_matrix(rooms)
+        array = generator.generate_cost_array(rooms)
+        for row, array_row in zip(matrix, array):
+            for cost, array_cost in zip(row, array_row):
+                if cost is munkres.DISALLOWED:
+                    self.assertEqual(array_cost, float('inf'))
+                else:
+                    self.assertAlmostEqual(cost, array_cost)
+
+    def test_simple(self):
+        self._test_cost_array("simple")
+
+    def test_variance(self):
+        self._test_cost_array("variance")
+
+    def test_shannon_entropy(self):
+        self._test_cost_array("entropy", 1.0)
+
+    def test_min_entropy(self):
+        self._test_cost_array("entropy", 0.0)
+
+    def test_renyi_entropy(self):
+        self._test_cost_array("entropy", 2.0)
+
+    def test_lsa_assignment(self):
+        generator = BPHungarianDrawGenerator(self.teams, assignment_method="lsa")
+        pairings = generator.generate()
+        self.assertCountEqual([team for pairing in pairings for team in pairing.teams], self.teams)
+
+    def test_lsa_assignment_with_cost_function(self):
+        generator = BPHungarianDrawGenerator(self.teams, assignment_method="lsa",
+            position_cost=lambda pos, history: history[pos])
+        pairings = generator.generate()
+        self.assertCountEqual([team for pairing in pairings for team in pairing.teams], self.teams)
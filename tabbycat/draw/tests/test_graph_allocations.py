@@ -138,3 +138,26 @@ class TestPowerPairedDrawGeneratorParts(unittest.TestCase):
         gcm = GraphPowerPairedDrawGenerator([team, team])
         gcm.options = {'pullup_debates_penalty': 1, 'pairing_method': 'fold', 'avoid_history': False, 'avoid_institution': False, 'side_allocations': False, 'pairing_penalty': 1}
         self.assertEqual(gcm.assignment_cost(team, team, 2), None)
+
+    def test_sparse_matching_same_as_complete(self):
+        teams = [TestTeam(i+1, chr(ord('A') + i), subrank=i+1) for i in range(20)]
+        costs = {(t1, t2): GraphCostMixin._pairings_fold([t1, t2], 20)
+                 for i, t1 in enumerate(teams) for t2 in teams[i+1:]}
+        expected = {frozenset((teams[i], teams[19-i])) for i in range(10)}
+
+        for n_candidates in [0, 1, 3, 25]:
+            with self.subTest(n_candidates=n_candidates):
+                gcm = GraphPowerPairedDrawGenerator(teams, pairing_candidates=n_candidates)
+                matching = gcm.min_weight_matching(teams, costs)
+                self.assertEqual({frozenset(pair) for pair in matching}, expected)
+
+    def test_sparse_matching_widens(self):
+        # Everyone's cheapest opponent is C, so with one candidate there is no
+        # perfect matching and the graph must be widened
+        teams = [TestTeam(i+1, chr(ord('A') + i)) for i in range(4)]
+        a, b, c, d = teams
+        costs = {(a, b): 10, (a, c): 0, (a, d): 5, (b, c): 0, (b, d): 5, (c, d): 0}
+        gcm = GraphPowerPairedDrawGenerator(teams, pairing_candidates=1)
+        matching = gcm.min_weight_matching(teams, costs)
+        self.assertEqual(len(matching), 2)
+        self.assertEqual(sum(costs.get(pair, costs.get(pair[::-1])) for pair in matching), 5)
@@ -0,0 +1,86 @@
+from django.contrib import admin
+from django.test import TestCase
+
+from adjallocation.admin import DebateAdjudicatorAdmin
+from adjallocation.models import DebateAdjudicator
+from participants.models import Adjudicator, Speaker, Team
+from tournaments.utils import get_cache_version
+from utils.tests import CompletedTournamentTestMixin
+from venues.models import Venue, VenueCategory
+
+from ..admin import DebateAdmin
+from ..manager import DrawManager
+from ..models import Debate, DebateTeam
+
+
+class DrawCacheVersionTests(CompletedTournamentTestMixin, TestCase):
+    """Checks that changes to anything shown in the draw change the draw cache
+    version, whether through signals or where debates are written."""
+
+    round_seq = 4
+
+    def assertDrawVersionChanged(self, func, *args):  # noqa: N802
+        version = get_cache_version(self.tournament, 'draw')
+        with self.captureOnCommitCallbacks(execute=True):
+            func(*args)
+        self.assertNotEqual(get_cache_version(self.tournament, 'draw'), version)
+
+    def assertDrawVersionUnchanged(self, func, *args):  # noqa: N802
+        version = get_cache_version(self.tournament, 'draw')
+        with self.captureOnCommitCallbacks(execute=True):
+            func(*args)
+        self.assertEqual(get_cache_version(self.tournament, 'draw'), version)
+
+    def test_debate_saves_not_watched(self):
+        # debates are bumped once per operation where they're written, not per row
+        debate = Debate.objects.filter(round=self.round).first()
+        debate.importance = 1
+        self.assertDrawVersionUnchanged(debate.save)
+        dt = DebateTeam.objects.filter(debate__round=self.round).first()
+        self.assertDrawVersionUnchanged(dt.save)
+
+    def test_draw_manager_delete(self):
+        self.assertDrawVersionChanged(DrawManager(self.round).delete)
+
+    def test_round_save(self):
+        self.assertDrawVersionChanged(self.round.save)
+
+    def test_admin_edits(self):
+        debate_admin = DebateAdmin(Debate, admin.site)
+        debate = Debate.objects.filter(round=self.round).first()
+        debate.importance = 1
+        self.assertDrawVersionChanged(debate_admin.save_model, None, debate, None, True)
+
+        da_admin = DebateAdjudicatorAdmin(DebateAdjudicator, admin.site)
+        da = DebateAdjudicator.objects.filter(debate__round=self.round).first()
+        self.assertDrawVersionChanged(da_admin.delete_model, None, da)
+
+        self.assertDrawVersionChanged(debate_admin.delete_queryset, None, Debate.objects.filter(round=self.round))
+
+    def test_participants(self):
+        team = Team.objects.filter(tournament=self.tournament).first()
+        team.reference = "Renamed"
+        self.assertDrawVersionChanged(team.save)
+
+        speaker = Speaker.objects.filter(team__tournament=self.tournament).first()
+        speaker.name = "Renamed"
+        self.assertDrawVersionChanged(speaker.save)
+
+        adj = Adjudicator.objects.filter(debateadjudicator__debate__round=self.round).first()
+        adj.name = "Renamed"
+        self.assertDrawVersionChanged(adj.save)
+
+    def test_venues(self):
+        venue = Venue.objects.filter(debate__round=self.round).first()
+        venue.name = "Renamed"
+        self.assertDrawVersionChanged(venue.save)
+
+        category = VenueCategory.objects.create(name="Category", display_in_venue_name=VenueCategory.DISPLAY_PREFIX)
+        self.assertDrawVersionChanged(category.venues.add, venue)
+
+    def test_admin_update(self):
+        debates = Debate.objects.filter(round=self.round)
+        model_admin = DebateAdmin(Debate, admin.site)
+        model_admin.log_change = lambda *args: None
+        model_admin.message_user = lambda *args: None
+        self.assertDrawVersionChanged(model_admin.mark_as_sides_confirmed, None, debates)
@@ -0,0 +1,32 @@
+from django.test import TestCase
+
+from draw.snapshot import DrawSnapshot
+from utils.tests import CompletedTournamentTestMixin
+
+
+class DrawSnapshotTests(CompletedTournamentTestMixin, TestCase):
+    """Checks that snapshots match the prefetched draw they stand in for."""
+
+    round_seq = 4
+
+    def test_matches_prefetched_draw(self):
+        snapshot = DrawSnapshot.build(self.round)
+        debates = list(self.round.debate_set_with_prefetches())
+        self.assertEqual([d.id for d in snapshot], [d.id for d in debates])
+
+        for snap, debate in zip(snapshot, debates):
+            self.assertEqual(snap.venue.display_name if snap.venue else None,
+                             debate.venue.display_name if debate.venue else None)
+            self.assertEqual(snap.matchup(self.tournament), debate.matchup)
+            self.assertEqual(snap.matchup(self.tournament, use_codes=True), debate.matchup_codes)
+            self.assertEqual([(adj.id, pos) for adj, pos in snap.adjudicators.with_positions()],
+                             [(adj.id, pos) for adj, pos in debate.adjudicators.with_positions()])
+            for side in self.tournament.sides:
+                dt = debate.get_dt(side)
+                self.assertEqual(snap.get_team(side).id, dt.team_id)
+                self.assertEqual([s.id for s in snap.get_team(side).speakers], [s.id for s in dt.team.speakers])
+
+    def test_build_query_count(self):
+        # venues, venue categories, speakers, debate teams, adjudicators, debates
+        with self.assertNumQueries(6):
+            DrawSnapshot.build(self.round)
@@ -174,6 +174,7 @@ class PublicDrawMixin(PublicTournamentPageMixin):
     """Governs permissions, particularly those relating to draw release."""
 
     empty_table_title = gettext_lazy("The draw for this round hasn't been released.")
+    cache_versions = ('results', 'draw', 'preferences')  # draw releases save the round
 
     @cached_property
     def draws_available(self):
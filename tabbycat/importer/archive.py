@@ -1,11 +1,15 @@
-from xml.etree.ElementTree import Element, SubElement
+import logging
+import time
+from xml.etree.ElementTree import Element, SubElement, tostring
 
 from django.contrib.contenttypes.models import ContentType
-from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import Prefetch, Q
+from django.db import transaction
+from django.db.models import Prefetch, prefetch_related_objects, Q
 from django.utils.text import slugify
 
-from adjallocation.models import AdjudicatorAdjudicatorConflict, DebateAdjudicator
+from adjallocation.models import (AdjudicatorAdjudicatorConflict, AdjudicatorInstitutionConflict,
+                                  AdjudicatorTeamConflict, DebateAdjudicator, TeamInstitutionConflict)
+from adjfeedback.aggregates import rebuild_feedback_aggregates
 from adjfeedback.models import AdjudicatorFeedback, AdjudicatorFeedbackQuestion
 from breakqual.models import BreakCategory
 from draw.models import Debate, DebateTeam
@@ -22,6 +26,7 @@ from results.result import DebateResult
 from tournaments.models import Round, Tournament
 from venues.models import Venue
 
+logger = logging.getLogger(__name__)
 
 # As ID/IDREF(S) must be unique to the whole document, prefix IDs
 ADJ_PREFIX = "A"
@@ -37,6 +42,15 @@ QUESTION_PREFIX = "Q"
 
 
 class Exporter:
+    """Writes a tournament to an XML archive.
+
+    The archive is produced by `stream()` as a sequence of byte strings, each
+    the serialization of one top-level element (a round, a team, an
+    adjudicator, etc.) that is discarded once written. Results are fetched one
+    round at a time, so memory use doesn't grow with the size of the
+    tournament."""
+
+    CHUNK_SIZE = 100
 
     def __init__(self, tournament):
         self.t = tournament
@@ -44,35 +58,39 @@ class Exporter:
         if tournament.pref('teams_in_debate') == 4:
             self.root.set('style', 'bp')
 
-    def create_all(self):
-        self.add_rounds()
-        self.add_participants()
-        self.add_break_categories()
-        self.add_institutions()
-        self.add_motions()
-        self.add_venues()
-        self.add_questions()
+    def stream(self):
+        end_tag = b"</tournament>"
+        yield tostring(self.root, short_empty_elements=False)[:-len(end_tag)]
+
+        yield from self.add_rounds()
+        yield from self.add_participants()
+        yield from self.add_break_categories()
+        yield from self.add_institutions()
+        yield from self.add_motions()
+        yield from self.add_venues()
+        yield from self.add_questions()
 
-        return self.root
+        yield end_tag
+
+    def write(self, file):
+        """Writes the archive to a file opened in binary mode."""
+        for chunk in self.stream():
+            file.write(chunk)
 
     def add_rounds(self):
-        results_prefetch = Prefetch('ballotsubmission_set', queryset=BallotSubmission.objects.filter(confirmed=True).prefetch_related(
-            'speakerscore_set', 'speakerscorebyadj_set', 'teamscore_set'))
         veto_prefetch = Prefetch('debateteammotionpreference_set', queryset=DebateTeamMotionPreference.objects.filter(
             preference=3, ballot_submission__confirmed=True,
         ))
         dt_prefetch = Prefetch('debateteam_set', queryset=DebateTeam.objects.all().select_related(
             'team', 'team__institution',
         ).prefetch_related(veto_prefetch))
-        debate_prefetch = Prefetch('debate_set', queryset=Debate.objects.all().prefetch_related(
-            'debateadjudicator_set', dt_prefetch, results_prefetch,
-        ))
 
-        for round in self.t.round_set.all().prefetch_related(debate_prefetch, 'motion_set').order_by('seq'):
-            populate_confirmed_ballots(round.debate_set.all(), motions=True, results=True)
-            populate_wins(round.debate_set.all())
+        for round in self.t.round_set.all().prefetch_related('motion_set').order_by('seq'):
+            debates = round.debate_set.all().prefetch_related('debateadjudicator_set__adjudicator', dt_prefetch)
+            populate_confirmed_ballots(debates, motions=True, results=True)
+            populate_wins(debates)
 
-            round_tag = SubElement(self.root, 'round', {
+            round_tag = Element('round', {
                 'name': round.name,
                 'abbreviation': round.abbreviation,
                 'elimination': str(round.stage == Round.Stage.ELIMINATION).lower(),
@@ -87,9 +105,11 @@ class Exporter:
 
             motion = round.motion_set.first()
 
-            for debate in round.debate_set.all():
+            for debate in debates:
                 self.add_debates(round_tag, motion, debate)
 
+            yield tostring(round_tag)
+
     def add_debates(self, round_tag, motion, debate):
         debate_tag = SubElement(round_tag, 'debate', {
             'id': DEBATE_PREFIX + str(debate.id),
@@ -100,7 +120,8 @@ class Exporter:
         if adjs != "":
             debate_tag.set('adjudicators', adjs)
 
-            chair = debate.debateadjudicator_set.get(type=DebateAdjudicator.TYPE_CHAIR).adjudicator_id
+            chair = next(d_adj.adjudicator_id for d_adj in debate.debateadjudicator_set.all()
+                         if d_adj.type == DebateAdjudicator.TYPE_CHAIR)
             debate_tag.set('chair', ADJ_PREFIX + str(chair))
 
         # Venue
@@ -121,9 +142,9 @@ class Exporter:
                     'team': TEAM_PREFIX + str(debate.get_team(side).id),
                 })
 
-                dt = debate.get_dt(side)
-                if dt.debateteammotionpreference_set.exists():
-                    side_tag.set('motion-veto', MOTION_PREFIX + str(dt.debateteammotionpreference_set.first().motion_id))
+                vetos = debate.get_dt(side).debateteammotionpreference_set.all()
+                if len(vetos) > 0:
+                    side_tag.set('motion-veto', MOTION_PREFIX + str(vetos[0].motion_id))
 
                 if result.is_voting:
                     for (adj, scoresheet) in result.scoresheets.items():
@@ -193,11 +214,12 @@ class Exporter:
                     ballot_tag.text = str(result.scoresheet.get_score(side, pos))
 
     def add_participants(self):
-        participants_tag = SubElement(self.root, 'participants')
+        yield b"<participants>"
 
         speaker_category_prefetch = Prefetch('speaker_set', queryset=Speaker.objects.all().prefetch_related('categories'))
-        for team in self.t.team_set.all().prefetch_related(speaker_category_prefetch, 'break_categories'):
-            team_tag = SubElement(participants_tag, 'team', {
+        teams = self.t.team_set.all().prefetch_related(speaker_category_prefetch, 'break_categories')
+        for team in teams.iterator(chunk_size=self.CHUNK_SIZE):
+            team_tag = Element('team', {
                 'name': team.long_name,
                 'code': team.code_name,
                 'id': TEAM_PREFIX + str(team.id),
@@ -219,8 +241,16 @@ class Exporter:
 
                 speaker_tag.set('categories', " ".join([SPEAKER_CATEGORY_PREFIX + str(sc.id) for sc in speaker.categories.all()]))
 
-        for adj in self.t.relevant_adjudicators.prefetch_related('adjudicatorfeedback_set'):
-            adj_tag = SubElement(participants_tag, 'adjudicator', {
+            yield tostring(team_tag)
+
+        questions = list(AdjudicatorFeedbackQuestion.objects.filter(tournament=self.t))
+        feedback_prefetch = Prefetch('adjudicatorfeedback_set', queryset=AdjudicatorFeedback.objects.filter(
+            confirmed=True,
+        ).select_related('source_adjudicator', 'source_team').prefetch_related('answers'))
+        adjudicators = self.t.relevant_adjudicators.prefetch_related(feedback_prefetch)
+
+        for adj in adjudicators.iterator(chunk_size=self.CHUNK_SIZE):
+            adj_tag = Element('adjudicator', {
                 'id': ADJ_PREFIX + str(adj.id),
                 'name': adj.name,
                 'core': str(adj.adj_core).lower(),
@@ -234,7 +264,7 @@ class Exporter:
             if adj.gender != "":
                 adj_tag.set('gender', adj.gender)
 
-            for feedback in adj.adjudicatorfeedback_set.filter(confirmed=True):
+            for feedback in adj.adjudicatorfeedback_set.all():
                 feedback_tag = SubElement(adj_tag, 'feedback', {
                     'score': str(feedback.score),
                 })
@@ -245,37 +275,38 @@ class Exporter:
                     feedback_tag.set('source-team', TEAM_PREFIX + str(feedback.source_team.team_id))
                     feedback_tag.set('debate', DEBATE_PREFIX + str(feedback.source_team.debate_id))
 
-                for question in AdjudicatorFeedbackQuestion.objects.filter(tournament=self.t):
-                    try:
-                        answer = Answer.objects.get(
-                            content_type=question.for_content_type,
-                            object_id=feedback.id,
-                            question=question,
-                        )
-                    except ObjectDoesNotExist:
+                answers = {answer.question_id: answer for answer in feedback.answers.all()}
+                for question in questions:
+                    if question.id not in answers:
                         continue
 
                     answer_tag = SubElement(feedback_tag, 'answer', {
-                        'question': QUESTION_PREFIX + str(answer.question_id),
+                        'question': QUESTION_PREFIX + str(question.id),
                     })
-                    answer_tag.text = str(answer.answer)
+                    answer_tag.text = str(answers[question.id].answer)
+
+            yield tostring(adj_tag)
+
+        yield b"</participants>"
 
     def add_break_categories(self):
         speaker_categories = self.t.speakercategory_set.all().order_by('seq')
 
         for category in speaker_categories:
-            sc_tag = SubElement(self.root, 'speaker-category', {
+            sc_tag = Element('speaker-category', {
                 'id': SPEAKER_CATEGORY_PREFIX + str(category.id),
             })
             sc_tag.text = category.name
+            yield tostring(sc_tag)
 
         break_categories = self.t.breakcategory_set.all().order_by('seq')
 
         for category in break_categories:
-            bc_tag = SubElement(self.root, 'break-category', {
+            bc_tag = Element('break-category', {
                 'id': BREAK_CATEGORY_PREFIX + str(category.id),
             })
             bc_tag.text = category.name
+            yield tostring(bc_tag)
 
     def add_institutions(self):
         institution_query = Institution.objects.filter(
@@ -283,7 +314,7 @@ class Exporter:
             Q(id__in=self.t.team_set.all().values_list('institution_id')),
         ).select_related('region')
         for institution in institution_query:
-            institution_tag = SubElement(self.root, 'institution', {
+            institution_tag = Element('institution', {
                 'id': INST_PREFIX + str(institution.id),
                 'reference': institution.code,
             })
@@ -292,9 +323,11 @@ class Exporter:
             if institution.region is not None:
                 institution_tag.set('region', institution.region.name)
 
+            yield tostring(institution_tag)
+
     def add_motions(self):
         for motion in Motion.objects.filter(tournament=self.t):
-            motion_tag = SubElement(self.root, 'motion', {
+            motion_tag = Element('motion', {
                 'id': MOTION_PREFIX + str(motion.id),
                 'reference': motion.reference,
             })
@@ -304,17 +337,19 @@ class Exporter:
                 info_slide.text = motion.info_slide
 
             motion_tag.text = motion.text
+            yield tostring(motion_tag)
 
     def add_venues(self):
         for venue in self.t.relevant_venues:
-            venue_tag = SubElement(self.root, 'venue', {
+            venue_tag = Element('venue', {
                 'id': VENUE_PREFIX + str(venue.id),
             })
             venue_tag.text = venue.name
+            yield tostring(venue_tag)
 
     def add_questions(self):
         for question in AdjudicatorFeedbackQuestion.objects.filter(tournament=self.t):
-            question_tag = SubElement(self.root, 'question', {
+            question_tag = Element('question', {
                 'id': QUESTION_PREFIX + str(question.id),
                 'name': question.name,
                 'from-teams': str(question.from_team).lower(),
@@ -322,13 +357,22 @@ class Exporter:
                 'type': question.answer_type,
             })
             question_tag.text = question.text
+            yield tostring(question_tag)
 
 
 class Importer:
+    """Creates a new tournament from an XML archive.
+
+    Each phase builds all the instances of its models from the parsed archive
+    and inserts them using `bulk_create()`, in dependency order, all in one
+    transaction. The time taken by each phase is logged and kept in
+    `self.timings`."""
 
     def __init__(self, tournament):
         self.root = tournament
+        self.timings = []
 
+    @transaction.atomic
     def import_tournament(self):
         self.tournament = Tournament(name=self.root.get('name'))
 
@@ -343,18 +387,25 @@ class Importer:
         self.is_bp = self.root.get('style') == 'bp' or len(self.root.findall('round[1]/debate[1]/side')) == 4
 
         # Import all the separate parts
-        self.set_preferences()
-        self.import_institutions()
-        self.import_categories()
-        self.import_venues()
-        self.import_questions()
-        self.import_teams()
-        self.import_speakers()
-        self.import_adjudicators()
-        self.import_debates()
-        self.import_motions()
-        self.import_results()
-        self.import_feedback()
+        for phase in [
+            self.set_preferences,
+            self.import_institutions,
+            self.import_categories,
+            self.import_venues,
+            self.import_questions,
+            self.import_teams,
+            self.import_speakers,
+            self.import_adjudicators,
+            self.import_debates,
+            self.import_motions,
+            self.import_results,
+            self.import_feedback,
+        ]:
+            start = time.perf_counter()
+            phase()
+            elapsed = time.perf_counter() - start
+            self.timings.append((phase.__name__, elapsed))
+            logger.info("Archive import for %s: %s took %.3f s", self.tournament.slug, phase.__name__, elapsed)
 
     def _is_consensus_ballot(self, elimination):
         xpath = "round[@elimination='" + elimination + "']/debate/side"
@@ -405,51 +456,61 @@ class Importer:
 
     def import_institutions(self):
         self.institutions = {}
-        self.regions = {}
 
-        for institution in self.root.findall('institution'):
-            # Use get_or_create as institutions may be shared between tournaments
-            inst_obj, created = Institution.objects.get_or_create(
-                code=institution.get('reference'), name=institution.text,
-            )
+        # Institutions may be shared between tournaments, so reuse existing ones
+        # that match on both code and name
+        elements = self.root.findall('institution')
+        existing = {(inst.code, inst.name): inst for inst in Institution.objects.filter(
+            code__in={institution.get('reference') for institution in elements})}
+
+        region_names = {institution.get('region') for institution in elements} - {None}
+        self.regions = {region.name: region for region in Region.objects.filter(name__in=region_names)}
+        new_regions = Region.objects.bulk_create([Region(name=name) for name in region_names if name not in self.regions])
+        self.regions.update({region.name: region for region in new_regions})
+
+        new_institutions = []
+        changed_institutions = []
+        for institution in elements:
+            key = (institution.get('reference'), institution.text)
+            inst_obj = existing.get(key)
+            if inst_obj is None:
+                inst_obj = existing[key] = Institution(code=key[0], name=key[1])
+                new_institutions.append(inst_obj)
             self.institutions[institution.get('id')] = inst_obj
 
             if institution.get('region') is not None:
-                region = institution.get('region')
-                if region not in self.regions:
-                    self.regions[region], created = Region.objects.get_or_create(name=region)
+                inst_obj.region = self.regions[institution.get('region')]
+                if inst_obj.pk is not None:
+                    changed_institutions.append(inst_obj)
 
-                inst_obj.region = self.regions[region]
-                inst_obj.save()
+        Institution.objects.bulk_create(new_institutions)
+        Institution.objects.bulk_update(changed_institutions, ['region'])
 
     def import_categories(self):
         self.team_breaks = {}
         self.speaker_categories = {}
 
         for i, breakqual in enumerate(self.root.findall('break-category'), 1):
-            bc = BreakCategory(
+            self.team_breaks[breakqual.get('id')] = BreakCategory(
                 tournament=self.tournament, name=breakqual.text,
                 slug=slugify(breakqual.text[:50]), seq=i,
                 break_size=0, is_general=False, priority=0,
             )
-            bc.save()
-            self.team_breaks[breakqual.get('id')] = bc
+        BreakCategory.objects.bulk_create(self.team_breaks.values())
 
         for i, category in enumerate(self.root.findall('speaker-category'), 1):
-            sc = SpeakerCategory(
+            self.speaker_categories[category.get('id')] = SpeakerCategory(
                 tournament=self.tournament, name=category.text,
                 slug=slugify(category.text[:50]), seq=i,
             )
-            sc.save()
-            self.speaker_categories[category.get('id')] = sc
+        SpeakerCategory.objects.bulk_create(self.speaker_categories.values())
 
     def import_venues(self):
         self.venues = {}
 
         for venue in self.root.findall('venue'):
-            v = Venue(tournament=self.tournament, name=venue.text, priority=venue.get('priority', 0))
-            v.save()
-            self.venues[venue.get('id')] = v
+            self.venues[venue.get('id')] = Venue(tournament=self.tournament, name=venue.text, priority=venue.get('priority', 0))
+        Venue.objects.bulk_create(self.venues.values())
 
     def import_questions(self):
         self.questions = {}
@@ -457,18 +518,20 @@ class Importer:
         content_type = ContentType.objects.get(app_label="adjfeedback", model="adjudicatorfeedback")
 
         for i, question in enumerate(self.root.findall('question'), 1):
-            q = AdjudicatorFeedbackQuestion(
+            self.questions[question.get('id')] = AdjudicatorFeedbackQuestion(
                 tournament=self.tournament, seq=i, text=question.text,
                 for_content_type=content_type,
                 name=question.get('name'), reference=slugify(question.get('name')[:50]),
                 from_adj=question.get('from-adjudicators') == 'true', from_team=question.get('from-teams') == 'true',
                 answer_type=question.get('type'), required=False,
             )
-            q.save()
-            self.questions[question.get('id')] = q
+        AdjudicatorFeedbackQuestion.objects.bulk_create(self.questions.values())
 
     def import_teams(self):
         self.teams = {}
+        institution_conflicts = set()
+        break_categories = set()
+
         for team in self.root.findall('participants/team'):
             team_obj = Team(tournament=self.tournament, long_name=team.get('name'))
             self.teams[team.get('id')] = team_obj
@@ -498,17 +561,31 @@ class Importer:
                 team_obj.reference = team_obj.long_name
                 team_obj.short_name = team_obj.reference[:50]
             team_obj.short_reference = team_obj.reference[:35]
-            team_obj.save()
+
+            # bulk_create() doesn't call Team.save(), which constructs these
+            team_obj.short_name = team_obj._construct_short_name()
+            team_obj.long_name = team_obj._construct_long_name()
 
             # Institution conflicts
-            team_obj.institution_conflicts.set([self.institutions.get(i) for i in institutions if i != ""])
+            institution_conflicts.update((team.get('id'), i) for i in institutions if i in self.institutions)
 
             # Break eligibilities
-            team_obj.break_categories.set([self.team_breaks[bc] for bc in team.get('break-eligibilities', "").split() if bc != ""])
+            break_categories.update((team.get('id'), bc) for bc in team.get('break-eligibilities', "").split())
+
+        Team.objects.bulk_create(self.teams.values())
+        TeamInstitutionConflict.objects.bulk_create([
+            TeamInstitutionConflict(team=self.teams[t], institution=self.institutions[i]) for t, i in institution_conflicts
+        ])
+        Team.break_categories.through.objects.bulk_create([
+            Team.break_categories.through(team=self.teams[t], breakcategory=self.team_breaks[bc]) for t, bc in break_categories
+        ])
 
     def import_speakers(self):
         self.speakers = {}
+        categories = set()
 
+        # Speakers and adjudicators inherit from Person in separate tables,
+        # which bulk_create() doesn't support, so these are saved one by one
         for team in self.root.findall('participants/team'):
             for speaker in team.findall('speaker'):
                 speaker_obj = Speaker(
@@ -517,10 +594,19 @@ class Importer:
                 speaker_obj.save()
                 self.speakers[speaker.get('id')] = speaker_obj
 
-                speaker_obj.categories.set([self.speaker_categories[sc] for sc in speaker.get('categories', "").split() if sc != ""])
+                categories.update((speaker.get('id'), sc) for sc in speaker.get('categories', "").split())
+
+        Speaker.categories.through.objects.bulk_create([
+            Speaker.categories.through(speaker=self.speakers[s], speakercategory=self.speaker_categories[sc]) for s, sc in categories
+        ])
+
+        # Results check speakers against their teams
+        prefetch_related_objects(list(self.teams.values()), 'speaker_set')
 
     def import_adjudicators(self):
         self.adjudicators = {}
+        institution_conflicts = set()
+        team_conflicts = set()
         adj_adj_conflicts = []
 
         for adj in self.root.findall('participants/adjudicator'):
@@ -533,10 +619,16 @@ class Importer:
             self.adjudicators[adj.get('id')] = adj_obj
 
             # Conflicts
-            adj_obj.institution_conflicts.set([self.institutions[i] for i in adj.get('institutions', "").split(" ") if i != ""])
-            adj_obj.team_conflicts.set([self.teams[t] for t in adj.get('team-conflicts', "").split(" ") if t != ""])
+            institution_conflicts.update((adj.get('id'), i) for i in adj.get('institutions', "").split(" ") if i != "")
+            team_conflicts.update((adj.get('id'), t) for t in adj.get('team-conflicts', "").split(" ") if t != "")
             adj_adj_conflicts.extend([(adj_obj, adj2) for adj2 in adj.get('adjudicator-conflicts', "").split(" ") if adj2 != ""])
 
+        AdjudicatorInstitutionConflict.objects.bulk_create([
+            AdjudicatorInstitutionConflict(adjudicator=self.adjudicators[a], institution=self.institutions[i]) for a, i in institution_conflicts
+        ])
+        AdjudicatorTeamConflict.objects.bulk_create([
+            AdjudicatorTeamConflict(adjudicator=self.adjudicators[a], team=self.teams[t]) for a, t in team_conflicts
+        ])
         AdjudicatorAdjudicatorConflict.objects.bulk_create([
             AdjudicatorAdjudicatorConflict(adjudicator1=adj1, adjudicator2=self.adjudicators[adj2]) for adj1, adj2 in adj_adj_conflicts
         ])
@@ -548,11 +640,11 @@ class Importer:
         return voting_adjs
 
     def import_debates(self):
+        self.rounds = []
         self.debates = {}
         self.debateteams = {}
         self.debateadjudicators = {}
 
-        rounds = []
         for i, round in enumerate(self.root.findall('round'), 1):
             round_stage = Round.Stage.ELIMINATION if round.get('elimination', 'false') == 'true' else Round.Stage.PRELIMINARY
             draw_type = Round.DrawType.ELIMINATION if round_stage == Round.Stage.ELIMINATION else Round.DrawType.MANUAL
@@ -562,7 +654,7 @@ class Importer:
                 abbreviation=round.get('abbreviation', round.get('name')[:10]), stage=round_stage, draw_type=draw_type,
                 draw_status=Round.Status.RELEASED, feedback_weight=round.get('feedback-weight', 0),
                 starts_at=round.get('start'))
-            rounds.append(round_obj)
+            self.rounds.append((round_obj, round))
 
             if round.find('debate') is None:
                 round_obj.completed = False
@@ -571,17 +663,14 @@ class Importer:
 
             if round_stage == Round.Stage.ELIMINATION:
                 round_obj.break_category = self.team_breaks.get(round.get('break-category'))
-            round_obj.save()
 
             for debate in round.findall('debate'):
                 debate_obj = Debate(round=round_obj, venue=self.venues.get(debate.get('venue')), result_status=Debate.STATUS_CONFIRMED)
-                debate_obj.save()
                 self.debates[debate.get('id')] = debate_obj
 
                 # Debate-teams
                 for j, side in enumerate(debate.findall('side')):
                     debateteam_obj = DebateTeam(debate=debate_obj, team=self.teams[side.get('team')], side=j)
-                    debateteam_obj.save()
                     self.debateteams[(debate.get('id'), side.get('team'))] = debateteam_obj
 
                 # Debate-adjudicators
@@ -591,96 +680,147 @@ class Importer:
                     if debate.get('chair') == adj:
                         adj_type = DebateAdjudicator.TYPE_CHAIR
                     adj_obj = DebateAdjudicator(debate=debate_obj, adjudicator=self.adjudicators[adj], type=adj_type)
-                    adj_obj.save()
                     self.debateadjudicators[(debate.get('id'), adj)] = adj_obj
 
+        Round.objects.bulk_create([round_obj for round_obj, _ in self.rounds])
+        Debate.objects.bulk_create(self.debates.values())
+        DebateTeam.objects.bulk_create(self.debateteams.values())
+        DebateAdjudicator.objects.bulk_create(self.debateadjudicators.values())
+
     def import_motions(self):
         # Can cause data consistency problems if motions are re-used between rounds: See #645
         self.motions = {}
+        round_motions = []
 
-        motions_by_round = {}
-        seq_by_round = {}
-        for r_obj, round in zip(self.tournament.round_set.all().order_by('seq'), self.root.findall('round')):
-            motions_by_round[r_obj.id] = set()
-            seq_by_round[r_obj.id] = 1
-            for debate in round.findall('debate'):
-                motions_by_round[r_obj.id].add(debate.get('motion'))
+        motions_by_round = [{debate.get('motion') for debate in round.findall('debate')} for _, round in self.rounds]
+        seq_by_round = [1] * len(self.rounds)
 
         for motion in self.root.findall('motion'):
             motion_obj = Motion(
                 text=motion.text, reference=motion.get('reference'),
                 info_slide=getattr(motion.find('info-slide'), 'text', ''), tournament=self.tournament)
-            motion_obj.save()
             self.motions[motion.get('id')] = motion_obj
 
-            for r, m_set in motions_by_round.items():
+            for i, ((round_obj, _), m_set) in enumerate(zip(self.rounds, motions_by_round)):
                 if motion.get('id') in m_set:
-                    rmotion_obj = RoundMotion(motion=motion_obj, seq=seq_by_round[r], round_id=r)
-                    rmotion_obj.save()
+                    round_motions.append(RoundMotion(motion=motion_obj, seq=seq_by_round[i], round=round_obj))
+                    seq_by_round[i] += 1
 
-    def import_results(self):
-        for round in self.root.findall('round'):
-            consensus = self.preliminary_consensus if round.get('elimination') == 'false' else self.elimination_consensus
+        Motion.objects.bulk_create(self.motions.values())
+        RoundMotion.objects.bulk_create(round_motions)
+
+    def _blank_result(self, ballotsub, round_obj, debate):
+        """Returns an empty DebateResult for the ballot, with its debate teams
+        and adjudicators filled in from those already imported, rather than
+        loaded from the database."""
+        result = DebateResult(ballotsub, load=False, round=round_obj, tournament=self.tournament,
+                              sides=list(range(len(debate.findall('side')))), criteria=[])
+        result.init_blank_buffer()
+
+        for side, side_code in zip(debate.findall('side'), result.sides):
+            result.debateteams[side_code] = self.debateteams[(debate.get('id'), side.get('team'))]
 
+        if result.is_voting:
+            for adj in debate.get('adjudicators').split():
+                da = self.debateadjudicators[(debate.get('id'), adj)]
+                if da.type == DebateAdjudicator.TYPE_TRAINEE:
+                    continue
+                result.debateadjs[da.adjudicator] = da
+                result.scoresheets[da.adjudicator] = result.scoresheet_class(
+                    sides=result.sides, positions=getattr(result, 'positions', None), criteria=[])
+
+        return result
+
+    def import_results(self):
+        ballotsubs = []
+        for round_obj, round in self.rounds:
             for debate in round.findall('debate'):
+                if debate.find('side/ballot') is None:
+                    continue  # no result, e.g. a debate in the current round
                 bs_obj = BallotSubmission(
                     version=1, submitter_type=Submission.Submitter.TABROOM, confirmed=True,
                     debate=self.debates[debate.get('id')], motion=self.motions.get(debate.get('motion')))
-                bs_obj.save()
-                dr = DebateResult(bs_obj)
-
-                numeric_scores = True
-                try:
-                    float(debate.find("side/ballot").text)
-                except ValueError:
-                    numeric_scores = False
-
-                for side, side_code in zip(debate.findall('side'), self.tournament.sides):
-
-                    if side.get('motion-veto') is not None:
-                        bs_obj.debateteammotionpreference_set.add(
-                            debate_team=self.debateteams.get((debate.get('id'), side.get('team'))),
-                            motion=self.motions.get(side.get('motion-veto')), preference=3)
-
-                    for speech, pos in zip(side.findall('speech'), self.tournament.positions):
-                        if numeric_scores:
-                            dr.set_speaker(side_code, pos, self.speakers.get(speech.get('speaker')))
-                            if consensus:
-                                dr.set_score(side_code, pos, float(speech.find('ballot').text))
-                            else:
-                                for ballot in speech.findall('ballot'):
-                                    for adj in [self.adjudicators[a] for a in ballot.get('adjudicators', "").split(" ")]:
-                                        dr.set_score(adj, side_code, pos, float(ballot.text))
-                    # Note: Dependent on #1180
-                    if consensus:
-                        if int(side.find('ballot').get('rank')) == 1:
-                            dr.add_winner(side_code)
-                    else:
-                        for ballot in side.findall('ballot'):
-                            for adj in [self.adjudicators.get(a) for a in ballot.get('adjudicators', "").split(" ")]:
-                                if int(ballot.get('rank')) == 1:
-                                    dr.add_winner(adj, side_code)
-                dr.save()
+                ballotsubs.append((bs_obj, round_obj, round, debate))
+        BallotSubmission.objects.bulk_create([bs_obj for bs_obj, _, _, _ in ballotsubs])
+
+        vetos = []
+        scores = {}  # model: list of instances
+
+        for bs_obj, round_obj, round, debate in ballotsubs:
+            consensus = self.preliminary_consensus if round.get('elimination') == 'false' else self.elimination_consensus
+            dr = self._blank_result(bs_obj, round_obj, debate)
+
+            numeric_scores = True
+            try:
+                float(debate.find("side/ballot").text)
+            except ValueError:
+                numeric_scores = False
+
+            for side, side_code in zip(debate.findall('side'), self.tournament.sides):
+
+                if side.get('motion-veto') is not None:
+                    vetos.append(DebateTeamMotionPreference(
+                        ballot_submission=bs_obj, debate_team=self.debateteams.get((debate.get('id'), side.get('team'))),
+                        motion=self.motions.get(side.get('motion-veto')), preference=3))
+
+                for speech, pos in zip(side.findall('speech'), self.tournament.positions):
+                    if numeric_scores:
+                        dr.set_speaker(side_code, pos, self.speakers.get(speech.get('speaker')))
+                        if consensus:
+                            dr.set_score(side_code, pos, float(speech.find('ballot').text))
+                        else:
+                            for ballot in speech.findall('ballot'):
+                                for adj in [self.adjudicators[a] for a in ballot.get('adjudicators', "").split(" ")]:
+                                    dr.set_score(adj, side_code, pos, float(ballot.text))
+                # Note: Dependent on #1180
+                if consensus:
+                    if int(side.find('ballot').get('rank')) == 1:
+                        dr.add_winner(side_code)
+                else:
+                    for ballot in side.findall('ballot'):
+                        for adj in [self.adjudicators.get(a) for a in ballot.get('adjudicators', "").split(" ")]:
+                            if int(ballot.get('rank')) == 1:
+                                dr.add_winner(adj, side_code)
+
+            for instance in dr.build_instances():
+                scores.setdefault(type(instance), []).append(instance)
+
+        DebateTeamMotionPreference.objects.bulk_create(vetos)
+        for model, instances in scores.items():
+            model.objects.bulk_create(instances)
 
     def import_feedback(self):
+        feedbacks = {}  # (adjudicator, source adjudicator, source team): latest feedback
+        all_feedback = []
+        answers = []
+
         for adj in self.root.findall('participants/adjudicator'):
             adj_obj = self.adjudicators[adj.get('id')]
 
             for feedback in adj.findall('feedback'):
                 d_adj = self.debateadjudicators.get((feedback.get('debate'), feedback.get('source-adjudicator')))
                 d_team = self.debateteams.get((feedback.get('debate'), feedback.get('source-team')))
-                feedback_obj = AdjudicatorFeedback(adjudicator=adj_obj, score=feedback.get('score'), version=1,
+
+                # Number versions and leave only the latest confirmed, as
+                # Submission.save() would
+                key = (adj.get('id'), feedback.get('debate'), feedback.get('source-adjudicator'), feedback.get('source-team'))
+                previous = feedbacks.get(key)
+                if previous is not None:
+                    previous.confirmed = False
+
+                feedback_obj = AdjudicatorFeedback(adjudicator=adj_obj, score=feedback.get('score'),
+                    version=1 if previous is None else previous.version + 1,
                     source_adjudicator=d_adj, source_team=d_team,
                     submitter_type=Submission.Submitter.TABROOM, confirmed=True)
-                feedback_obj.save()
+                feedbacks[key] = feedback_obj
+                all_feedback.append(feedback_obj)
 
                 for answer in feedback.findall('answer'):
-                    question = self.questions[answer.get('question')]
-
-                    cast_answer = answer.text
-                    answer = Answer(
-                        question=question,
-                        answer=cast_answer,
-                        object_id=feedback_obj.id,
-                        content_type=question.for_content_type,
-                    )
+                    answers.append((feedback_obj, self.questions[answer.get('question')], answer.text))
+
+        AdjudicatorFeedback.objects.bulk_create(all_feedback)
+        Answer.objects.bulk_create([
+            Answer(question=question, answer=cast_answer, object_id=feedback_obj.id, content_type=question.for_content_type)
+            for feedback_obj, question, cast_answer in answers
+        ])
+        rebuild_feedback_aggregates(self.tournament)  # bulk_create() doesn't send signals
@@ -11,7 +11,7 @@ import venues.models as vm
 from draw.types import DebateSide
 from participants.emoji import set_emoji
 
-from .base import BaseTournamentDataImporter, make_interpreter, make_lookup
+from .base import BaseTournamentDataImporter, make_interpreter, make_lookup, PreloadedLookup
 
 
 class AnorakTournamentDataImporter(BaseTournamentDataImporter):
@@ -110,7 +110,7 @@ class AnorakTournamentDataImporter(BaseTournamentDataImporter):
             self._import(f, pm.Region, region_interpreter, expect_unique=False)
 
         institution_interpreter = make_interpreter(
-            region=lambda x: pm.Region.objects.get(name=x),
+            region=PreloadedLookup(pm.Region.objects.all(), 'name'),
         )
 
         self._import(f, pm.Institution, institution_interpreter)
@@ -165,7 +165,7 @@ class AnorakTournamentDataImporter(BaseTournamentDataImporter):
 
         team_interpreter_part = make_interpreter(
             tournament=self.tournament,
-            institution=pm.Institution.objects.lookup,
+            institution=PreloadedLookup.by_name_fields(pm.Institution.objects.all()),
         )
 
         def team_interpreter(lineno, line):
@@ -198,6 +198,8 @@ class AnorakTournamentDataImporter(BaseTournamentDataImporter):
         if an institution doesn't exist, an error is raised.
         """
 
+        institution_lookup = PreloadedLookup.by_name_fields(pm.Institution.objects.all())
+
         if auto_create_teams:
 
             def team_interpreter(lineno, line):
@@ -207,7 +209,7 @@ class AnorakTournamentDataImporter(BaseTournamentDataImporter):
                     'short_reference':  line['team_name'][:34],
                 }
                 if line.get('institution'):
-                    interpreted['institution'] = pm.Institution.objects.lookup(line['institution'])
+                    interpreted['institution'] = institution_lookup(line['institution'])
                 if line.get('use_institution_prefix'):
                     interpreted['use_institution_prefix'] = line['use_institution_prefix']
                 return interpreted
@@ -229,10 +231,11 @@ class AnorakTournamentDataImporter(BaseTournamentDataImporter):
             gender=self.lookup_gender,
         )
 
+        team_lookup = PreloadedLookup(pm.Team.objects.filter(tournament=self.tournament), 'reference')
+
         def speaker_interpreter(lineno, line):
-            institution = pm.Institution.objects.lookup(line['institution']) if line.get('institution') else None
-            line['team'] = pm.Team.objects.get(
-                institution=institution, reference=line['team_name'], tournament=self.tournament)
+            institution = institution_lookup(line['institution']) if line.get('institution') else None
+            line['team'] = team_lookup(line['team_name'], institution_id=getattr(institution, 'id', None))
             line = speaker_interpreter_part(lineno, line)
             return line
         self._import(f, pm.Speaker, speaker_interpreter)
@@ -244,8 +247,9 @@ class AnorakTournamentDataImporter(BaseTournamentDataImporter):
         conflicts are created with adjudicators' own institutions.
         """
 
+        institution_lookup = PreloadedLookup.by_name_fields(pm.Institution.objects.all())
         adjudicator_interpreter = make_interpreter(
-            institution=pm.Institution.objects.lookup,
+            institution=institution_lookup,
             tournament=self.tournament,
             gender=self.lookup_gender,
             DELETE=['team_conflicts', 'institution_conflicts', 'adj_conflicts'],
@@ -277,33 +281,37 @@ class AnorakTournamentDataImporter(BaseTournamentDataImporter):
             adjudicator = adjudicators[lineno]
             for institution_name in line['institution_conflicts'].split(","):
                 institution_name = institution_name.strip()
-                institution = pm.Institution.objects.lookup(institution_name)
+                institution = institution_lookup(institution_name)
                 yield {
                     'adjudicator' : adjudicator,
                     'institution' : institution,
                 }
         self._import(f, am.AdjudicatorInstitutionConflict, institution_conflict_interpreter)
 
+        team_lookup = PreloadedLookup.by_name_fields(pm.Team.objects.all())
+
         def team_conflict_interpreter(lineno, line):
             if not line.get('team_conflicts'):
                 return
             adjudicator = adjudicators[lineno]
             for team_name in line['team_conflicts'].split(","):
                 team_name = team_name.strip()
-                team = pm.Team.objects.lookup(team_name)
+                team = team_lookup(team_name)
                 yield {
                     'adjudicator' : adjudicator,
                     'team'        : team,
                 }
         self._import(f, am.AdjudicatorTeamConflict, team_conflict_interpreter)
 
+        adj_lookup = PreloadedLookup(pm.Adjudicator.objects.all(), 'name')
+
         def adj_conflict_interpreter(lineno, line):
             if not line.get('adj_conflicts'):
                 return
             adjudicator = adjudicators[lineno]
             for adj_name in line['adj_conflicts'].split(","):
                 adj_name = adj_name.strip()
-                conflicted_adj = pm.Adjudicator.objects.get(name=adj_name)
+                conflicted_adj = adj_lookup(adj_name)
                 yield {
                     'adjudicator1' : adjudicator,
                     'adjudicator2' : conflicted_adj,
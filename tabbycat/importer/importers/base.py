@@ -2,11 +2,18 @@
 
 import csv
 import logging
+import operator
 import re
 from collections import Counter
+from functools import reduce
 from types import GeneratorType
 
 from django.core.exceptions import FieldError, MultipleObjectsReturned, ObjectDoesNotExist, ValidationError
+from django.db import connection, IntegrityError, models, transaction
+from django.db.models import Q
+from django.db.models.signals import pre_save
+
+from tournaments.utils import bump_cache_version
 
 NON_FIELD_ERRORS = '__all__'
 DUPLICATE_INFO = 19  # Logging level just below INFO
@@ -70,6 +77,49 @@ def make_lookup(name, choices):
     return staticmethod(lookup)
 
 
+class PreloadedLookup:
+    """Looks up instances by an exact match on any of `fields`, like
+    `LookupByNameFieldsMixin.lookup()`, but fetches everything in `queryset`
+    with one query the first time it's called, rather than querying once per
+    call. Keyword arguments further filter the matches by attribute, e.g.
+    `lookup("Alpha", institution=inst)`. Raises the model's `DoesNotExist` or
+    `MultipleObjectsReturned` in the same circumstances as `get()` would.
+
+    Since the query is only made on the first call, construct one for each
+    call to `_import()`, so that it sees instances saved by earlier calls.
+    """
+
+    def __init__(self, queryset, *fields):
+        self.queryset = queryset
+        self.fields = fields
+        self.index = None
+
+    @classmethod
+    def by_name_fields(cls, queryset):
+        """Looks up by the `name_fields` of the model's `LookupByNameFieldsMixin`
+        manager, i.e. like `Model.objects.lookup()`."""
+        return cls(queryset, *queryset.model.objects.name_fields)
+
+    def _load(self):
+        self.index = {}
+        for obj in self.queryset:
+            for field in self.fields:
+                self.index.setdefault(getattr(obj, field), {})[obj.pk] = obj
+
+    def __call__(self, value, **kwargs):
+        if self.index is None:
+            self._load()
+        model = self.queryset.model
+        matches = [obj for obj in self.index.get(value, {}).values()
+                   if all(getattr(obj, attr) == v for attr, v in kwargs.items())]
+        if not matches:
+            raise model.DoesNotExist("%s matching %r does not exist." % (model._meta.object_name, value))
+        if len(matches) > 1:
+            raise model.MultipleObjectsReturned("%d %s objects match %r." % (
+                len(matches), model._meta.object_name, value))
+        return matches[0]
+
+
 class TournamentDataImporterFatalError(Exception):
     pass
 
@@ -160,13 +210,15 @@ class BaseTournamentDataImporter(object):
         if 'loglevel' in kwargs:
             self.logger.setLevel(kwargs['loglevel'])
         self.expect_unique = kwargs.get('expect_unique', True)
+        self.bulk = kwargs.get('bulk', False)
+        self.batch_size = kwargs.get('batch_size', 500)
         self.reset_counts()
 
     def reset_counts(self):
         self.counts = Counter()
         self.errors = TournamentDataImporterError()
 
-    def _import(self, csvfile, model, interpreter=make_interpreter(), expect_unique=None):
+    def _import(self, csvfile, model, interpreter=make_interpreter(), expect_unique=None, bulk=None):
         """Parses the object given in f, using the callable interpreter to parse
         each line, and passing the arguments to the given model's constructor.
         `csvfile` can be any object that is supported by csv.DictReader(), which
@@ -202,15 +254,27 @@ class BaseTournamentDataImporter(object):
         duplicate objects before saving any of the objects it creates. If
         `expect_unique` is False, it will just skip objects that would be
         duplicates and log a DUPLICATE_INFO message to say so.
+
+        If `bulk` is True, this function checks for existing objects in batches
+        of `self.batch_size`, leaves uniqueness checks to the database, and
+        inserts the objects using `bulk_create()` in a single transaction. If
+        the database rejects the batch, it falls back to importing the file one
+        line at a time, so that errors are still attributed to lines. Since
+        `bulk_create()` doesn't send signals, cached data that the objects might
+        appear in is invalidated once afterwards (see `bump_cache_versions()`).
         """
         if hasattr(csvfile, 'seek') and callable(csvfile.seek):
             csvfile.seek(0)
         reader = csv.DictReader(csvfile)
-        kwargs_seen = list()
+        kwargs_seen = set()
+        kwargs_seen_unhashable = list()
+        pending = list()
         instances = dict()
         errors = TournamentDataImporterError()
         if expect_unique is None:
             expect_unique = self.expect_unique
+        if bulk is None:
+            bulk = self.bulk
         skipped_because_existing = 0
         boolean_fields = [field.name for field in model._meta.get_fields()
                           if hasattr(field, 'get_internal_type') and
@@ -259,63 +323,67 @@ class BaseTournamentDataImporter(object):
 
                 description = model.__name__ + "(" + ", ".join(["%s=%r" % args for args in kwargs.items()]) + ")"
 
-                # Check if it's a duplicate
-                kwargs_expect_unique = kwargs.copy()
-                if kwargs_expect_unique in kwargs_seen:
+                # Check if it's a duplicate (using a set where the values allow it,
+                # since this is quadratic in the number of lines otherwise)
+                try:
+                    kwargs_key = frozenset(kwargs.items())
+                    duplicate = kwargs_key in kwargs_seen
+                except TypeError:
+                    kwargs_key = kwargs.copy()
+                    duplicate = kwargs_key in kwargs_seen_unhashable
+                if duplicate:
                     if expect_unique:
                         message = "Duplicate " + description
                         errors.add(lineno, model, message)
                     else:
                         self.logger.log(DUPLICATE_INFO, "Skipping duplicate " + description)
                     continue
-                kwargs_seen.append(kwargs_expect_unique)
-
-                # Create (but don't save) an instance (or handle an error)
-                try:
-                    inst = model.objects.get(**kwargs)
-                except ObjectDoesNotExist:
-                    inst = model(**kwargs)  # normal case (create object)
-                except MultipleObjectsReturned as e:
-                    if expect_unique:
-                        errors.add(lineno, model, str(e))
-                    continue
-                except FieldError as e:
-                    match = re.match(r"Cannot resolve keyword '(\w+)' into field.", str(e))
-                    if match:
-                        message = "There's an unrecognized column header in this file: {}".format(match.group(1))
-                        self.logger.error(message)
-                        self.logger.error("I was trying to import %s at the time.", model._meta.verbose_name_plural)
-                        self.logger.error("The original error was: " + str(e))
-                        self.logger.error("If you're writing a new importer, it might be that you "
-                                "need to delete some columns from the dict in your interpreter.")
-                        self.logger.error("If using construct_interpreter(), you can do this with the DELETE argument.")
-                        raise TournamentDataImporterFatalError(message)
-                    else:
-                        raise
-                except ValueError as e:
-                    errors.add(lineno, model, str(e))
-                    continue
-                except ValidationError as e:
-                    errors.update_with_validation_error(lineno, model, e)
-                    continue
+                if isinstance(kwargs_key, frozenset):
+                    kwargs_seen.add(kwargs_key)
                 else:
-                    skipped_because_existing += 1
-                    if expect_unique:
-                        message = description + " already exists"
-                        errors.add(lineno, model, message)
-                    else:
-                        self.logger.log(DUPLICATE_INFO, "Skipping %s, already exists", description)
-                    continue
+                    kwargs_seen_unhashable.append(kwargs_key)
 
-                try:
+                key = (lineno, itemno) if list_provided else lineno
+                pending.append((key, lineno, kwargs, description))
+
+        # Create (but don't save) the instances, checking for existing ones
+        if bulk:
+            created = self._instantiate_in_batches(model, pending, expect_unique, errors)
+        else:
+            created = ((key, lineno, description) + self._instantiate(model, kwargs, lineno, description, expect_unique, errors)
+                       for key, lineno, kwargs, description in pending)
+
+        for key, lineno, description, inst, existing in created:
+            if existing:
+                skipped_because_existing += 1
+            if inst is None:
+                continue
+
+            try:
+                if bulk:
+                    # Uniqueness is left to the database, and foreign keys to
+                    # instances fetched from the database needn't be checked
+                    inst.full_clean(exclude=self._saved_relations(inst),
+                                    validate_unique=False, validate_constraints=False)
+                else:
                     inst.full_clean()
-                except ValidationError as e:
-                    errors.update_with_validation_error(lineno, model, e)
-                    continue
+            except ValidationError as e:
+                errors.update_with_validation_error(lineno, model, e)
+                continue
 
-                key = (lineno, itemno) if list_provided else lineno
-                self.logger.debug("To create from line %s: %s", key, description)
-                instances[key] = inst
+            self.logger.debug("To create from line %s: %s", key, description)
+            instances[key] = inst
+
+        # Create the instances in bulk (unless there are errors to raise first)
+        if bulk and instances and not (errors and self.strict):
+            try:
+                with transaction.atomic():
+                    self._bulk_create(model, list(instances.values()))
+                    self.bump_cache_versions()
+            except IntegrityError as e:
+                self.logger.warning("Couldn't create %s in bulk, so importing them one line at a time "
+                        "instead. The database said: %s", model._meta.verbose_name_plural, e)
+                return self._import(csvfile, model, interpreter, expect_unique, bulk=False)
 
         # Report errors, if any
         if errors:
@@ -330,7 +398,8 @@ class BaseTournamentDataImporter(object):
 
         # Create the instances
         for lineno, inst in instances.items():
-            inst.save()
+            if not bulk:
+                inst.save()
             self.logger.debug("Made %s from line %s: %r", model._meta.verbose_name, lineno, inst)
 
         self.logger.info("Imported %d %s", len(instances), model._meta.verbose_name_plural)
@@ -340,3 +409,127 @@ class BaseTournamentDataImporter(object):
         self.counts.update({model: len(instances)})
 
         return instances
+
+    def _instantiate(self, model, kwargs, lineno, description, expect_unique, errors):
+        """Creates (but doesn't save) an instance from `kwargs`, unless one
+        already exists or there's an error, which is added to `errors`. Returns
+        a 2-tuple `(inst, existing)`, where `inst` is None if the line should be
+        skipped, and `existing` is True if that's because it already exists."""
+        try:
+            model.objects.get(**kwargs)
+        except ObjectDoesNotExist:
+            return model(**kwargs), False  # normal case (create object)
+        except MultipleObjectsReturned as e:
+            if expect_unique:
+                errors.add(lineno, model, str(e))
+            return None, False
+        except FieldError as e:
+            self._raise_unrecognized_column(model, e)
+        except ValueError as e:
+            errors.add(lineno, model, str(e))
+            return None, False
+        except ValidationError as e:
+            errors.update_with_validation_error(lineno, model, e)
+            return None, False
+        else:
+            if expect_unique:
+                message = description + " already exists"
+                errors.add(lineno, model, message)
+            else:
+                self.logger.log(DUPLICATE_INFO, "Skipping %s, already exists", description)
+            return None, True
+
+    def _instantiate_in_batches(self, model, pending, expect_unique, errors):
+        """Like `_instantiate()`, but for a list of `(key, lineno, kwargs,
+        description)` tuples, yielding `(key, lineno, description, inst,
+        existing)` for each. Checks whether any instances in each batch already
+        exist using one query, and only checks line by line in batches where
+        some do (or where the query fails, so that the error has a line)."""
+        for start in range(0, len(pending), self.batch_size):
+            batch = pending[start:start + self.batch_size]
+            try:
+                any_existing = model.objects.filter(
+                    reduce(operator.or_, (Q(**kwargs) for _, _, kwargs, _ in batch))).exists()
+            except FieldError as e:
+                self._raise_unrecognized_column(model, e)
+            except (ValueError, ValidationError):
+                any_existing = True
+
+            for key, lineno, kwargs, description in batch:
+                if any_existing:
+                    yield (key, lineno, description) + self._instantiate(
+                        model, kwargs, lineno, description, expect_unique, errors)
+                else:
+                    yield key, lineno, description, model(**kwargs), False
+
+    def _raise_unrecognized_column(self, model, e):
+        match = re.match(r"Cannot resolve keyword '(\w+)' into field.", str(e))
+        if not match:
+            raise e
+        message = "There's an unrecognized column header in this file: {}".format(match.group(1))
+        self.logger.error(message)
+        self.logger.error("I was trying to import %s at the time.", model._meta.verbose_name_plural)
+        self.logger.error("The original error was: " + str(e))
+        self.logger.error("If you're writing a new importer, it might be that you "
+                "need to delete some columns from the dict in your interpreter.")
+        self.logger.error("If using construct_interpreter(), you can do this with the DELETE argument.")
+        raise TournamentDataImporterFatalError(message)
+
+    @staticmethod
+    def _saved_relations(inst):
+        """Returns the names of foreign keys on `inst` that refer to instances
+        already in the database, which `full_clean()` would otherwise look up
+        again, one query each."""
+        return [field.name for field in inst._meta.concrete_fields
+                if isinstance(field, models.ForeignKey) and field.is_cached(inst) and
+                field.get_cached_value(inst) is not None and
+                not field.get_cached_value(inst)._state.adding]
+
+    def _bulk_create(self, model, instances):
+        """Saves `instances` using `bulk_create()` where possible. Models that
+        override `save()` or have `pre_save` receivers are saved one at a time,
+        since `bulk_create()` would skip those."""
+        if model.save is not models.Model.save or pre_save.has_listeners(model):
+            for inst in instances:
+                inst.save()
+            return
+
+        if model._meta.parents:
+            self._bulk_create_multi_table(model, instances)
+        else:
+            model.objects.bulk_create(instances, batch_size=self.batch_size)
+
+    def bump_cache_versions(self):
+        """Invalidates cached data that imported objects might appear in (see
+        `tournaments.utils.get_cache_version()`), which signal receivers would
+        otherwise do for each object saved."""
+        for kind in ('results', 'draw', 'breaks'):
+            bump_cache_version(self.tournament, kind)
+        bump_cache_version(None, 'conflicts')  # institutions and conflicts are site-wide
+
+    def _bulk_create_multi_table(self, model, instances):
+        """`bulk_create()` doesn't support multi-table inheritance (e.g. speakers
+        and adjudicators), because it needs the parents' primary keys. Where the
+        database returns them, this inserts the parent rows with `bulk_create()`,
+        then the child rows with the same internal method `save()` uses."""
+        if len(model._meta.get_parent_list()) > 1 or not connection.features.can_return_rows_from_bulk_insert:
+            for inst in instances:
+                inst.save()
+            return
+
+        [(parent, parent_link)] = model._meta.parents.items()
+        parent_fields = parent._meta.concrete_fields
+        parents = [parent(**{field.attname: getattr(inst, field.attname) for field in parent_fields})
+                   for inst in instances]
+        parent.objects.bulk_create(parents, batch_size=self.batch_size)
+
+        for inst, parent_inst in zip(instances, parents):
+            for field in parent_fields:
+                setattr(inst, field.attname, getattr(parent_inst, field.attname))
+            setattr(inst, parent_link.attname, parent_inst.pk)
+            inst._state.adding = False
+            inst._state.db = parent_inst._state.db
+
+        fields = model._meta.local_concrete_fields
+        for start in range(0, len(instances), self.batch_size):
+            model._base_manager._insert(instances[start:start + self.batch_size], fields=fields)
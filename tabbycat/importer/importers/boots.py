@@ -11,7 +11,7 @@ import tournaments.models as tm
 import venues.models as vm
 from participants.emoji import set_emoji
 
-from .base import BaseTournamentDataImporter, convert_bool, make_interpreter, make_lookup
+from .base import BaseTournamentDataImporter, convert_bool, make_interpreter, make_lookup, PreloadedLookup
 
 
 class BootsTournamentDataImporter(BaseTournamentDataImporter):
@@ -65,9 +65,12 @@ class BootsTournamentDataImporter(BaseTournamentDataImporter):
         ("select multiple", "multiple select"): fm.AdjudicatorFeedbackQuestion.AnswerType.MULTIPLE_SELECT,
     })
 
-    def _adj_lookup(self, x):
-        return pm.Adjudicator.objects.get(
-                Q(tournament=self.tournament) | Q(tournament__isnull=True), name=x)
+    def _make_adj_lookup(self):
+        return PreloadedLookup(pm.Adjudicator.objects.filter(
+                Q(tournament=self.tournament) | Q(tournament__isnull=True)), 'name')
+
+    def _make_team_lookup(self):
+        return PreloadedLookup.by_name_fields(pm.Team.objects.filter(tournament=self.tournament))
 
     def import_rounds(self, f):
         interpreter_part = make_interpreter(
@@ -92,7 +95,7 @@ class BootsTournamentDataImporter(BaseTournamentDataImporter):
                     return {'name': line['region']}  # otherwise return None
             self._import(f, pm.Region, region_interpreter, expect_unique=False)
 
-        interpreter = make_interpreter(region=lambda x: pm.Region.objects.get(name=x))
+        interpreter = make_interpreter(region=PreloadedLookup(pm.Region.objects.all(), 'name'))
         self._import(f, pm.Institution, interpreter)
 
     def import_break_categories(self, f):
@@ -105,7 +108,7 @@ class BootsTournamentDataImporter(BaseTournamentDataImporter):
 
     def import_adjudicators(self, f):
         interpreter = make_interpreter(
-            institution=pm.Institution.objects.lookup,
+            institution=PreloadedLookup.by_name_fields(pm.Institution.objects.all()),
             tournament=self.tournament,
             gender=self.lookup_gender,
             DELETE=['category', lambda x: x.startswith('available:')],
@@ -122,12 +125,13 @@ class BootsTournamentDataImporter(BaseTournamentDataImporter):
         self._import(f, am.AdjudicatorInstitutionConflict, own_institution_conflict_interpreter)
 
         content_type = ContentType.objects.get_for_model(pm.Adjudicator)
+        round_lookup = PreloadedLookup.by_name_fields(tm.Round.objects.all())
 
         def adjudicator_availability_interpreter(lineno, line):
             availability_columns = [col for col in line if col.startswith('available:')]
             for col in availability_columns:
                 round_name = col[10:]  # length of 'available:'
-                round = tm.Round.objects.lookup(round_name)
+                round = round_lookup(round_name)
                 if convert_bool(line[col]):
                     yield {
                         'content_type': content_type,
@@ -143,7 +147,7 @@ class BootsTournamentDataImporter(BaseTournamentDataImporter):
         # on adjudicators.
         interpreter = make_interpreter(
             round=None,
-            adjudicator=self._adj_lookup,
+            adjudicator=self._make_adj_lookup(),
         )
         histories = self._import(f, fm.AdjudicatorBaseScoreHistory, interpreter)
 
@@ -156,7 +160,7 @@ class BootsTournamentDataImporter(BaseTournamentDataImporter):
 
         team_interpreter_part = make_interpreter(
             tournament=self.tournament,
-            institution=pm.Institution.objects.lookup,
+            institution=PreloadedLookup.by_name_fields(pm.Institution.objects.all()),
             DELETE=['speaker%d_%s' % (i, field) for i in [1, 2] for field in speaker_fields] + ['break_category'],
         )
 
@@ -177,12 +181,14 @@ class BootsTournamentDataImporter(BaseTournamentDataImporter):
                 }
         self._import(f, am.TeamInstitutionConflict, own_team_institution_conflict_interpreter)
 
+        break_category_lookup = PreloadedLookup(self.tournament.breakcategory_set.all(), 'slug')
+
         def break_category_interpreter(lineno, line):
             if line.get('break_category'):
                 for category in line['break_category'].split('/'):
                     yield {
                         'team': teams[lineno],
-                        'breakcategory': self.tournament.breakcategory_set.get(slug=category),
+                        'breakcategory': break_category_lookup(category),
                     }
         self._import(f, pm.Team.break_categories.through, break_category_interpreter)
 
@@ -194,12 +200,14 @@ class BootsTournamentDataImporter(BaseTournamentDataImporter):
                 yield subline
         speakers = self._import(f, pm.Speaker, speakers_interpreter)
 
+        speaker_category_lookup = PreloadedLookup(self.tournament.speakercategory_set.all(), 'slug')
+
         def speaker_category_interpreter(lineno, line):
             for i in [1, 2]:
                 if line.get('speaker%d_category' % i):
                     for category in line['speaker%d_category' % i].split('/'):
                         yield {
-                            'speakercategory': self.tournament.speakercategory_set.get(slug=category),
+                            'speakercategory': speaker_category_lookup(category),
                             'speaker': speakers[(lineno, i)],
                         }
         self._import(f, pm.Speaker.categories.through, speaker_category_interpreter)
@@ -227,12 +235,13 @@ class BootsTournamentDataImporter(BaseTournamentDataImporter):
         self._import(f, vm.VenueCategory.venues.through, venue_category_venue_interpreter)
 
         content_type = ContentType.objects.get_for_model(vm.Venue)
+        round_lookup = PreloadedLookup.by_name_fields(tm.Round.objects.all())
 
         def venue_availability_interpreter(lineno, line):
             availability_columns = [col for col in line if col.startswith('available:')]
             for col in availability_columns:
                 round_name = col[10:]  # length of 'available:'
-                round = tm.Round.objects.lookup(round_name)
+                round = round_lookup(round_name)
                 if convert_bool(line[col]):
                     yield {
                         'content_type': content_type,
@@ -244,29 +253,30 @@ class BootsTournamentDataImporter(BaseTournamentDataImporter):
 
     def import_team_conflicts(self, f):
         interpreter = make_interpreter(
-            team=lambda x: pm.Team.objects.lookup(name=x, tournament=self.tournament),
-            adjudicator=self._adj_lookup,
+            team=self._make_team_lookup(),
+            adjudicator=self._make_adj_lookup(),
         )
         self._import(f, am.AdjudicatorTeamConflict, interpreter)
 
     def import_institution_conflicts(self, f):
         interpreter = make_interpreter(
-            institution=pm.Institution.objects.lookup,
-            adjudicator=self._adj_lookup,
+            institution=PreloadedLookup.by_name_fields(pm.Institution.objects.all()),
+            adjudicator=self._make_adj_lookup(),
         )
         self._import(f, am.AdjudicatorInstitutionConflict, interpreter)
 
     def import_adjudicator_conflicts(self, f):
+        adj_lookup = self._make_adj_lookup()
         interpreter = make_interpreter(
-            adjudicator1=self._adj_lookup,
-            adjudicator2=self._adj_lookup,
+            adjudicator1=adj_lookup,
+            adjudicator2=adj_lookup,
         )
         self._import(f, am.AdjudicatorAdjudicatorConflict, interpreter)
 
     def import_team_institution_conflicts(self, f):
         interpreter = make_interpreter(
-            team=lambda x: pm.Team.objects.lookup(name=x, tournament=self.tournament),
-            institution=pm.Institution.objects.lookup,
+            team=self._make_team_lookup(),
+            institution=PreloadedLookup.by_name_fields(pm.Institution.objects.all()),
         )
         self._import(f, am.TeamInstitutionConflict, interpreter)
 
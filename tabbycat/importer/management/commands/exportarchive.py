@@ -0,0 +1,20 @@
+import os
+
+from importer.archive import Exporter
+from utils.management.base import TournamentCommand
+
+
+class Command(TournamentCommand):
+
+    help = "Exports tournament(s) to XML archive files, named after each tournament's slug."
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument("-o", "--output-dir", type=str, default=".",
+            help="Directory to write archive files to (default: current directory)")
+
+    def handle_tournament(self, tournament, **options):
+        path = os.path.join(options["output_dir"], tournament.slug + ".xml")
+        with open(path, 'wb') as f:
+            Exporter(tournament).write(f)
+        self.stdout.write("Exported {tournament} to {path}".format(tournament=tournament.name, path=path))
@@ -34,6 +34,10 @@ class Command(BaseCommand):
                             help="Keep existing tournament and data, skipping lines if they are duplicates.")
         parser.add_argument('--relaxed', action='store_false', dest='strict', default=True,
                             help="Don't crash if there is an error, just skip and keep going.")
+        parser.add_argument('--bulk', action='store_true', default=False,
+                            help="Check and insert rows in batches, rather than one at a time. Faster for large files.")
+        parser.add_argument('--batch-size', type=int, metavar='N', default=500,
+                            help="Number of rows per batch when using --bulk (default: 500)")
 
         # Cleaning shared objects
         parser.add_argument('--clean-shared', action='store_true', default=False,
@@ -65,7 +69,8 @@ class Command(BaseCommand):
 
         importer_class = self.get_importer_class()
         self.importer = importer_class(
-            self.tournament, loglevel=loglevel, strict=options['strict'], expect_unique=not options['keep_existing'])
+            self.tournament, loglevel=loglevel, strict=options['strict'], expect_unique=not options['keep_existing'],
+            bulk=options['bulk'], batch_size=options['batch_size'])
 
         # Importer classes specify what they import, and in what order
         for item in self.importer.order:
@@ -13,6 +13,7 @@ import participants.models as pm
 import tournaments.models as tm
 import venues.models as vm
 from settings import BASE_DIR
+from tournaments.utils import get_cache_version
 
 from ..importers import TournamentDataImporterError
 from ..importers.anorak import AnorakTournamentDataImporter
@@ -186,3 +187,18 @@ class TestImporterAnorak(TestCase):
         self.assertEqual(len(self.importer.errors), 6)
         self.assertEqual(len(logscm.records), 6)
         self.importer.strict = True
+
+
+class TestImporterAnorakBulk(TestImporterAnorak):
+    """Runs the same tests as above, but with the importer in bulk mode."""
+
+    def setUp(self):
+        super().setUp()
+        self.importer = AnorakTournamentDataImporter(self.tournament, logger=self.logger, bulk=True)
+
+    def test_cache_versions_bumped(self):
+        # bulk_create() doesn't send signals, so the importer bumps versions itself
+        version = get_cache_version(self.tournament, 'breaks')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.test_break_categories()
+        self.assertNotEqual(get_cache_version(self.tournament, 'breaks'), version)
@@ -0,0 +1,67 @@
+"""Round-trip tests for the XML archive exporter and importer."""
+
+from collections import Counter
+from xml.etree import ElementTree
+
+from django.test import TestCase
+
+from results.models import BallotSubmission, SpeakerScore, SpeakerScoreByAdj, TeamScore, TeamScoreByAdj
+from results.result import DebateResult
+from utils.tests import CompletedTournamentTestMixin
+
+from ..archive import Exporter, Importer
+
+
+class TestArchiveRoundTrip(CompletedTournamentTestMixin, TestCase):
+
+    score_models = [TeamScore, SpeakerScore, TeamScoreByAdj, SpeakerScoreByAdj]
+
+    def setUp(self):
+        super().setUp()
+        root = ElementTree.fromstring(b"".join(Exporter(self.tournament).stream()))
+        root.set('name', "Imported " + self.tournament.name)
+        root.set('short', "imported")  # so that the slug doesn't clash
+        self.importer = Importer(root)
+        self.importer.import_tournament()
+        self.imported = self.importer.tournament
+
+    def get_team_scores(self, tournament):
+        return Counter(TeamScore.objects.filter(
+            ballot_submission__confirmed=True, debate_team__debate__round__tournament=tournament,
+        ).values_list('debate_team__debate__round__seq', 'debate_team__team__short_name', 'debate_team__side',
+                      'win', 'score'))
+
+    def get_speaker_scores(self, tournament):
+        return Counter(SpeakerScore.objects.filter(
+            ballot_submission__confirmed=True, debate_team__debate__round__tournament=tournament,
+        ).values_list('debate_team__debate__round__seq', 'speaker__name', 'position', 'score'))
+
+    def get_saved_scores(self, ballotsub):
+        """Returns the scores of all kinds saved for the ballot submission,
+        without their primary keys."""
+        scores = {}
+        for model in self.score_models:
+            fields = [f.name for f in model._meta.concrete_fields if not f.primary_key]
+            scores[model.__name__] = set(model.objects.filter(ballot_submission=ballotsub).values_list(*fields))
+        return scores
+
+    def test_phases_timed(self):
+        self.assertEqual([phase for phase, _ in self.importer.timings][-2:], ['import_results', 'import_feedback'])
+
+    def test_scores_match_original(self):
+        self.assertEqual(self.get_team_scores(self.imported), self.get_team_scores(self.tournament))
+        self.assertEqual(self.get_speaker_scores(self.imported), self.get_speaker_scores(self.tournament))
+
+    def test_scores_match_save(self):
+        """Checks that the bulk-created scores are what `DebateResult.save()`
+        would have written for the same ballots."""
+        ballotsubs = BallotSubmission.objects.filter(debate__round__tournament=self.imported, confirmed=True)
+        self.assertEqual(ballotsubs.count(), BallotSubmission.objects.filter(
+            debate__round__tournament=self.tournament, confirmed=True).count())
+
+        for ballotsub in ballotsubs:
+            with self.subTest(debate=ballotsub.debate_id):
+                imported = self.get_saved_scores(ballotsub)
+                self.assertTrue(imported['TeamScore'])
+                DebateResult(ballotsub).save()
+                self.assertEqual(self.get_saved_scores(ballotsub), imported)
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from utils.admin import ModelAdmin, TabbycatModelAdminFieldsMixin
+from utils.admin import CacheVersionsAdminMixin, ModelAdmin, TabbycatModelAdminFieldsMixin
 
 from .models import DebateTeamMotionPreference, Motion, RoundMotion
 
@@ -10,9 +10,11 @@ from .models import DebateTeamMotionPreference, Motion, RoundMotion
 # ==============================================================================
 
 @admin.register(Motion)
-class MotionAdmin(TabbycatModelAdminFieldsMixin, ModelAdmin):
+class MotionAdmin(CacheVersionsAdminMixin, TabbycatModelAdminFieldsMixin, ModelAdmin):
     list_display = ('reference', 'text')
     list_filter = ('rounds',)
+    cache_versions = ('draw',)  # for deletions; saves are covered by draw.signals
+    tournament_lookup = 'motion'
 
 
 @admin.register(DebateTeamMotionPreference)
@@ -23,7 +25,9 @@ class DebateTeamMotionPreferenceAdmin(TabbycatModelAdminFieldsMixin, ModelAdmin)
 
 
 @admin.register(RoundMotion)
-class RoundMotionAdmin(TabbycatModelAdminFieldsMixin, ModelAdmin):
+class RoundMotionAdmin(CacheVersionsAdminMixin, TabbycatModelAdminFieldsMixin, ModelAdmin):
     list_display = ('seq', 'round', 'motion')
     list_filter = ('round', 'motion')
     ordering = ('round__seq', 'seq')
+    cache_versions = ('draw',)  # for deletions; saves are covered by draw.signals
+    tournament_lookup = 'round__roundmotion'
@@ -16,6 +16,7 @@ from results.models import BallotSubmission
 from tournaments.mixins import (CurrentRoundMixin, OptionalAssistantTournamentPageMixin,
                                 PublicTournamentPageMixin, RoundMixin, TournamentMixin)
 from tournaments.models import Round
+from tournaments.utils import bump_cache_version
 from users.permissions import Permission
 from utils.misc import redirect_round
 from utils.mixins import AdministratorMixin
@@ -85,9 +86,12 @@ class EditMotionsView(AdministratorMixin, LogActionMixin, RoundMixin, ModelFormS
 
         for motion in formset.deleted_objects:
             motion.delete()
+        if formset.deleted_objects:
+            bump_cache_version(self.tournament, 'draw')  # see draw.signals
 
         if len(motions) == 1 and motions[0].created:
             BallotSubmission.objects.filter(debate__round=self.round, motion__isnull=True).update(motion=motions[0])
+            bump_cache_version(self.tournament, 'results')  # update() doesn't send signals
 
         for i, motion in enumerate(motions, start=1):
             if not motion.created:  # Do not re-create associated RoundMotion if merely modifying
@@ -130,6 +134,8 @@ class CopyMotionsView(EditMotionsView):
 
         for rm in formset.deleted_objects:
             rm.delete()
+        if formset.deleted_objects:
+            bump_cache_version(self.tournament, 'draw')  # see draw.signals
 
         return self.show_message(len(motions), len(formset.deleted_objects))
 
@@ -152,6 +158,7 @@ class CopyPreviousMotionsView(AdministratorMixin, LogActionMixin, RoundMixin, Po
             self.log_action(content_object=motion.motion)
 
         RoundMotion.objects.bulk_create(new_motions)
+        bump_cache_version(self.tournament, 'draw')  # bulk_create() doesn't send signals
         messages.success(request, ngettext(
             "Reused the motion from the previous round.",
             "Reused the %(count)d motions from the previous round.",
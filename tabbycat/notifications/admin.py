@@ -34,7 +34,7 @@ class SentMessageAdmin(TabbycatModelAdminFieldsMixin, ModelAdmin):
 
 @admin.register(BulkNotification)
 class BulkNotificationAdmin(TabbycatModelAdminFieldsMixin, ModelAdmin):
-    list_display = ('precise_timestamp', 'event', 'round', 'tournament')
+    list_display = ('precise_timestamp', 'event', 'round', 'tournament', 'sent_count', 'total_count')
     list_filter = ('tournament', 'round', 'event')
     ordering = ('-timestamp',)
 
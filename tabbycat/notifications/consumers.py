@@ -1,12 +1,18 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from dataclasses import asdict
-from email.utils import formataddr
+from email.utils import formataddr, make_msgid
 from time import time
 from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 from channels.consumer import SyncConsumer
 from django.conf import settings
 from django.core import mail
+from django.core.mail.utils import DNS_NAME
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Coalesce
 from django.template import Context, Template
 from html2text import html2text
 
@@ -22,6 +28,11 @@ from .utils import (AdjudicatorAssignmentEmailGenerator, BallotsEmailGenerator,
 
 class NotificationQueueConsumer(SyncConsumer):
 
+    # Emails are rendered, sent and recorded this many at a time, so that an
+    # interrupted notification can be resumed from the last chunk sent
+    EMAIL_CHUNK_SIZE = 100
+    EMAIL_RENDER_THREADS = 4
+
     NOTIFICATION_GENERATORS: Dict[BulkNotification.EventType, Type[NotificationContextGenerator]] = {
         BulkNotification.EventType.ADJ_DRAW: AdjudicatorAssignmentEmailGenerator,
         BulkNotification.EventType.URL: RandomizedUrlEmailGenerator,
@@ -33,11 +44,6 @@ class NotificationQueueConsumer(SyncConsumer):
         BulkNotification.EventType.CUSTOM: NotificationContextGenerator,
     }
 
-    @staticmethod
-    def _send(messages: List[mail.EmailMultiAlternatives], records: List[SentMessage]) -> None:
-        mail.get_connection().send_messages(messages)
-        SentMessage.objects.bulk_create(records)
-
     @staticmethod
     def _get_from_fields(t: Tournament) -> Tuple[str, Optional[List[str]]]:
         from_email = formataddr((t.short_name, settings.DEFAULT_FROM_EMAIL))
@@ -45,32 +51,37 @@ class NotificationQueueConsumer(SyncConsumer):
             return from_email, [formataddr((t.pref('reply_to_name'), t.pref('reply_to_address')))]
         return from_email, None  # Shouldn't have array of None
 
-    def email(self, event: Dict[str, Union[str, BulkNotification.EventType, List[int], Dict[str, Any]]]) -> None:
-        # Get database objects
-        if 'debate_id' in event['extra']:
-            debate = Debate.objects.select_related('round__tournament').get(pk=event['extra'].pop('debate_id'))
-            event['extra']['debate'] = debate
-            round = event['extra']['debate'].round
-            t = round.tournament
-        elif 'round_id' in event['extra']:
-            round = Round.objects.select_related('tournament').get(pk=event['extra'].pop('round_id'))
-            event['extra']['round'] = round
-            t = round.tournament
+    @staticmethod
+    def _get_objects(extra: Dict[str, Any]) -> Tuple[Optional[Round], Tournament]:
+        """Replaces the IDs in `extra` with database objects, and returns the
+        round (if any) and tournament."""
+        if 'debate_id' in extra:
+            debate = Debate.objects.select_related('round__tournament', 'venue').get(pk=extra.pop('debate_id'))
+            extra['debate'] = debate
+            return debate.round, debate.round.tournament
+        elif 'round_id' in extra:
+            round = Round.objects.select_related('tournament').get(pk=extra.pop('round_id'))
+            extra['round'] = round
+            return round, round.tournament
         else:
-            round = None
-            t = Tournament.objects.get(pk=event['extra'].pop('tournament_id'))
-            event['extra']['tournament'] = t
-
-        from_email, reply_to = self._get_from_fields(t)
-        notification_type = event['message']
-
-        subject = Template(event['subject'])
-        html_body = Template(event['body'])
+            t = Tournament.objects.get(pk=extra.pop('tournament_id'))
+            extra['tournament'] = t
+            return None, t
 
+    def _get_contexts(self, notification_type: BulkNotification.EventType, event: Dict[str, Any],
+            exclude_notification: Optional[BulkNotification] = None) -> List[Tuple[Any, Person]]:
         recipients = Person.objects.filter(pk__in=event['send_to'] or [], email__isnull=False).exclude(email='')
-        contexts = self.NOTIFICATION_GENERATORS[notification_type].generate(to=recipients, **event['extra'])
+        if exclude_notification is not None:
+            recipients = recipients.exclude(sentmessage__notification=exclude_notification)
+        return list(self.NOTIFICATION_GENERATORS[notification_type].generate(to=recipients, **event['extra']))
+
+    def email(self, event: Dict[str, Union[str, BulkNotification.EventType, List[int], Dict[str, Any]]]) -> None:
+        queued_event = deepcopy(event)  # before IDs are replaced with database objects
 
-        # Prepare messages
+        # Get database objects
+        round, t = self._get_objects(event['extra'])
+        notification_type = BulkNotification.EventType(event['message'])
+        contexts = self._get_contexts(notification_type, event)
 
         # Ballot receipts are grouped by round in the same BulkNotification
         creation_kwargs = {
@@ -82,33 +93,81 @@ class NotificationQueueConsumer(SyncConsumer):
         if notification_type is BulkNotification.EventType.BALLOTS_CONFIRMED:
             bulk_notification, c = BulkNotification.objects.get_or_create(
                 event=BulkNotification.EventType.BALLOTS_CONFIRMED, **creation_kwargs)
+            BulkNotification.objects.filter(pk=bulk_notification.pk).update(
+                total_count=Coalesce(F('total_count'), 0) + len(contexts))
         else:
-            bulk_notification = BulkNotification.objects.create(event=notification_type, **creation_kwargs)
+            bulk_notification = BulkNotification.objects.create(event=notification_type,
+                queued_event=queued_event, total_count=len(contexts), **creation_kwargs)
+
+        self._send(bulk_notification, event, contexts)
+
+    def resume_email(self, event: Dict[str, int]) -> None:
+        """Resumes sending a bulk notification that was interrupted, skipping
+        recipients who were already sent it. Ballot receipts can't be resumed,
+        since each confirmation adds to the same notification."""
+        bulk_notification = BulkNotification.objects.select_related('tournament').get(pk=event['notification_id'])
+        if bulk_notification.queued_event is None or bulk_notification.is_complete:
+            return
+
+        event = bulk_notification.queued_event
+        self._get_objects(event['extra'])
+        notification_type = BulkNotification.EventType(event['message'])
+        contexts = self._get_contexts(notification_type, event, exclude_notification=bulk_notification)
+        self._send(bulk_notification, event, contexts)
+
+    def _send(self, bulk_notification: BulkNotification, event: Dict[str, Any], contexts: List[Tuple[Any, Person]]) -> None:
+        from_email, reply_to = self._get_from_fields(bulk_notification.tournament)
+        subject = Template(event['subject'])
+        html_body = Template(event['body'])
 
-        messages = []
-        records = []
-        for instance, recipient in contexts:
+        def render(item: Tuple[Any, Person]) -> Tuple[mail.EmailMultiAlternatives, SentMessage]:
+            instance, recipient = item
             data = asdict(instance)
             data['USER'] = recipient.name
 
             hook_id = str(bulk_notification.id) + "-" + str(recipient.id) + "-" + str(int(time()))[4:]
+            message_id = make_msgid(domain=DNS_NAME)
             context = Context(data)
             body = html_body.render(context)
             email = mail.EmailMultiAlternatives(
                 subject=subject.render(context), body=html2text(body),
                 from_email=from_email, to=[formataddr((recipient.name, recipient.email))],
                 reply_to=reply_to, headers={
+                    'Message-ID': message_id,
                     'X-SMTPAPI': json.dumps({'unique_args': {'hook-id': hook_id}}),  # SendGrid-specific 'hook-id'
                 },
             )
             email.attach_alternative(body, "text/html")
-            messages.append(email)
-
-            raw_message = email.message()
-            records.append(
-                SentMessage(recipient=recipient, email=recipient.email,
-                            method=SentMessage.METHOD_TYPE_EMAIL,
-                            context=data, message_id=raw_message['Message-ID'],
-                            hook_id=hook_id, notification=bulk_notification))
 
-        self._send(messages, records)
+            record = SentMessage(recipient=recipient, email=recipient.email,
+                                 method=SentMessage.METHOD_TYPE_EMAIL,
+                                 context=data, message_id=message_id,
+                                 hook_id=hook_id, notification=bulk_notification)
+            return email, record
+
+        def record(records: List[SentMessage]) -> None:
+            with transaction.atomic():
+                SentMessage.objects.bulk_create(records)
+                BulkNotification.objects.filter(pk=bulk_notification.pk).update(
+                    sent_count=F('sent_count') + len(records))
+
+        # Keep one connection open for the whole notification. Messages are
+        # sent one at a time, but recorded a chunk at a time; if sending fails
+        # partway through a chunk, the messages already sent are still
+        # recorded, so that they aren't sent again if resumed.
+        connection = mail.get_connection()
+        connection.open()
+        try:
+            with ThreadPoolExecutor(max_workers=self.EMAIL_RENDER_THREADS) as executor:
+                for start in range(0, len(contexts), self.EMAIL_CHUNK_SIZE):
+                    messages, records = zip(*executor.map(render, contexts[start:start + self.EMAIL_CHUNK_SIZE]))
+                    sent = 0
+                    try:
+                        for message in messages:
+                            connection.send_messages([message])
+                            sent += 1
+                    finally:
+                        if sent > 0:
+                            record(records[:sent])
+        finally:
+            connection.close()
@@ -0,0 +1,31 @@
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db.models import F
+
+from utils.management.base import TournamentCommand
+
+from ...consumers import NotificationQueueConsumer
+
+
+class Command(TournamentCommand):
+
+    help = "Queues interrupted email notifications to be resumed, skipping people who were already sent them. " \
+           "Only use this after the notifications worker has crashed or been restarted, not while it's still sending. " \
+           "Messages are recorded as sent up to {n:d} at a time, so if the worker was killed (rather than failing to " \
+           "send), up to {n:d} people who were sent a message just before it stopped may be sent it again.".format(
+               n=NotificationQueueConsumer.EMAIL_CHUNK_SIZE)
+
+    def handle_tournament(self, tournament, **options):
+        notifications = tournament.bulknotification_set.filter(
+            queued_event__isnull=False, sent_count__lt=F('total_count'))
+
+        for notification in notifications:
+            async_to_sync(get_channel_layer().send)("notifications", {
+                "type": "resume_email",
+                "notification_id": notification.id,
+            })
+            self.stdout.write("Resuming {notification} ({sent:d} of {total:d} sent)".format(
+                notification=notification, sent=notification.sent_count, total=notification.total_count))
+
+        if not notifications:
+            self.stdout.write("No interrupted notifications in {tournament}".format(tournament=tournament.name))
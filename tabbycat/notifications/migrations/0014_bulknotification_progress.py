@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0013_alter_bulknotification_event'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bulknotification',
+            name='queued_event',
+            field=models.JSONField(blank=True, help_text='The request that queued this notification, kept so that sending can be resumed if it is interrupted', null=True, verbose_name='queued event'),
+        ),
+        migrations.AddField(
+            model_name='bulknotification',
+            name='sent_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='sent count'),
+        ),
+        migrations.AddField(
+            model_name='bulknotification',
+            name='total_count',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='total count'),
+        ),
+    ]
@@ -70,6 +70,14 @@ class BulkNotification(models.Model):
     body_template = models.TextField(null=True,
         verbose_name=_("body template"))
 
+    queued_event = models.JSONField(blank=True, null=True,
+        verbose_name=_("queued event"),
+        help_text=_("The request that queued this notification, kept so that sending can be resumed if it is interrupted"))
+    sent_count = models.PositiveIntegerField(default=0,
+        verbose_name=_("sent count"))
+    total_count = models.PositiveIntegerField(blank=True, null=True,
+        verbose_name=_("total count"))
+
     class Meta:
         verbose_name = _("bulk notification")
         verbose_name_plural = _("bulk notifications")
@@ -82,6 +90,10 @@ class BulkNotification(models.Model):
             timezone.localtime(self.timestamp).isoformat(),
         )
 
+    @property
+    def is_complete(self):
+        return self.total_count is None or self.sent_count >= self.total_count
+
 
 class EmailStatus(models.Model):
     class EventType(models.TextChoices):
@@ -0,0 +1,82 @@
+from unittest import mock
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import override_settings, TestCase
+
+from participants.models import Person
+from utils.tests import CompletedTournamentTestMixin
+
+from ..consumers import NotificationQueueConsumer
+from ..models import BulkNotification, SentMessage
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+@mock.patch.object(NotificationQueueConsumer, 'EMAIL_CHUNK_SIZE', 3)
+class NotificationQueueConsumerTests(CompletedTournamentTestMixin, TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.people = list(Person.objects.filter(speaker__team__tournament=self.tournament).order_by('id')[:8])
+        for i, person in enumerate(self.people):
+            person.email = "person%d@example.com" % i
+            person.save()
+        self.consumer = NotificationQueueConsumer()
+
+    def get_event(self):
+        return {
+            'message': BulkNotification.EventType.CUSTOM,
+            'subject': "Hello {{ USER }}",
+            'body': "<p>Test message</p>",
+            'send_to': [person.id for person in self.people],
+            'extra': {'tournament_id': self.tournament.id},
+        }
+
+    def get_recipients(self):
+        return sorted(message.to[0] for message in mail.outbox)
+
+    def test_sends_in_chunks(self):
+        self.consumer.email(self.get_event())
+
+        self.assertEqual(len(mail.outbox), len(self.people))
+        self.assertEqual(mail.outbox[0].subject, "Hello " + self.people[0].name)
+        notification = BulkNotification.objects.get()
+        self.assertEqual(notification.total_count, len(self.people))
+        self.assertEqual(notification.sent_count, len(self.people))
+        self.assertTrue(notification.is_complete)
+        self.assertEqual(SentMessage.objects.filter(notification=notification).count(), len(self.people))
+
+    def test_failure_records_messages_sent(self):
+        send_messages = EmailBackend.send_messages
+
+        def fail_on_fifth(backend, messages):
+            if len(mail.outbox) == 4:
+                raise OSError("Connection lost")
+            return send_messages(backend, messages)
+
+        # The fifth message is the second of the second chunk
+        with mock.patch.object(EmailBackend, 'send_messages', fail_on_fifth):
+            with self.assertRaises(OSError):
+                self.consumer.email(self.get_event())
+
+        notification = BulkNotification.objects.get()
+        self.assertEqual(notification.sent_count, 4)
+        self.assertFalse(notification.is_complete)
+        self.assertEqual(SentMessage.objects.filter(notification=notification).count(), 4)
+
+        # Resuming sends to only those who weren't sent it
+        sent = self.get_recipients()
+        mail.outbox = []
+        self.consumer.resume_email({'notification_id': notification.id})
+
+        self.assertEqual(len(mail.outbox), len(self.people) - 4)
+        self.assertFalse(set(sent) & set(self.get_recipients()))
+        notification.refresh_from_db()
+        self.assertEqual(notification.sent_count, len(self.people))
+        self.assertTrue(notification.is_complete)
+
+    def test_resume_complete_notification(self):
+        self.consumer.email(self.get_event())
+        mail.outbox = []
+        self.consumer.resume_email({'notification_id': BulkNotification.objects.get().id})
+        self.assertEqual(mail.outbox, [])
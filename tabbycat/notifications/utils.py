@@ -11,13 +11,14 @@ Objects should be fetched from the database here as it is an asynchronous proces
 thus the object itself cannot be passed.
 """
 from dataclasses import dataclass
-from typing import Any, Dict, List, Set, Tuple, TYPE_CHECKING
+from typing import Any, Dict, List, Tuple, TYPE_CHECKING
 
 from django.utils import formats
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext as _
 
 from adjallocation.allocation import AdjudicatorAllocation
+from draw.snapshot import DrawSnapshot
 from options.utils import use_team_code_names
 from participants.prefetch import populate_win_counts
 from results.result import ConsensusDebateResultWithScores, DebateResult, DebateResultByAdjudicatorWithScores
@@ -28,6 +29,7 @@ if TYPE_CHECKING:
     from participants.models import Person
     from tournaments.models import Round, Tournament
     from draw.models import Debate
+    from draw.snapshot import SnapshotDebate, SnapshotDebateTeam, SnapshotPerson
 
 
 adj_position_names = {
@@ -51,12 +53,40 @@ def _assemble_panel(adjs: List[Tuple['Person', str]]) -> str:
     return ", ".join(adj_string)
 
 
-def _check_in_to(pk: int, to_ids: Set[int]) -> bool:
-    try:
-        to_ids.remove(pk)
-    except KeyError:
-        return False
-    return True
+def _recipient_ids(to: 'QuerySet[Person]') -> List[int]:
+    return list(to.order_by('name').values_list('id', flat=True))
+
+
+class _DrawIndex:
+    """Indexes the draw snapshot for a round by participant, so that generators
+    can find each recipient's debate with a dict lookup. Per-debate values are
+    computed once per debate, using `debate_context()`."""
+
+    def __init__(self, round: 'Round') -> None:
+        self.round = round
+        self.debates = DrawSnapshot.for_round(round)
+        self.use_codes = use_team_code_names(round.tournament, False)
+
+        self.adjudicators: Dict[int, Tuple['SnapshotDebate', 'SnapshotPerson', str]] = {}
+        self.speakers: Dict[int, Tuple['SnapshotDebate', 'SnapshotDebateTeam', 'SnapshotPerson']] = {}
+        for debate in self.debates:
+            for adj, pos in debate.adjudicators.with_positions():
+                self.adjudicators[adj.id] = (debate, adj, pos)
+            for dt in debate.debateteams:
+                for speaker in dt.team.speakers:
+                    self.speakers[speaker.id] = (debate, dt, speaker)
+
+        self._debate_contexts: Dict[int, Dict[str, str]] = {}
+
+    def debate_context(self, debate: 'SnapshotDebate') -> Dict[str, str]:
+        if debate.id not in self._debate_contexts:
+            self._debate_contexts[debate.id] = {
+                'ROUND': self.round.name,
+                'VENUE': debate.venue.display_name if debate.venue is not None else _("TBA"),
+                'PANEL': _assemble_panel(debate.adjudicators.with_positions()),
+                'DRAW': debate.matchup(self.round.tournament, use_codes=self.use_codes),
+            }
+        return self._debate_contexts[debate.id]
 
 
 class NotificationContextGenerator:
@@ -83,26 +113,15 @@ class AdjudicatorAssignmentEmailGenerator(NotificationContextGenerator):
     @classmethod
     def generate(cls, to: 'QuerySet[Person]', url: str, round: 'Round') -> List[Tuple[EmailContextData, 'Person']]:
         emails = []
-        to_ids = {p.id for p in to}
-        draw = round.debate_set_with_prefetches(speakers=False).filter(debateadjudicator__adjudicator__in=to)
-        use_codes = use_team_code_names(round.tournament, False)
-
-        for debate in draw:
-            matchup = debate.matchup_codes if use_codes else debate.matchup
-            context = {
-                'ROUND': round.name,
-                'VENUE': debate.venue.display_name if debate.venue is not None else _("TBA"),
-                'PANEL': _assemble_panel(debate.adjudicators.with_positions()),
-                'DRAW': matchup,
-            }
-
-            for adj, pos in debate.adjudicators.with_positions():
-                if not _check_in_to(adj.id, to_ids):
-                    continue
+        draw = _DrawIndex(round)
 
-                context_user = cls.context_class(**context, POSITION=adj_position_names[pos],
-                    URL=url + adj.url_key + '/' if adj.url_key else '')
-                emails.append((context_user, adj))
+        for person in to.order_by('name'):
+            if person.id not in draw.adjudicators:
+                continue
+            debate, adj, pos = draw.adjudicators[person.id]
+            context_user = cls.context_class(**draw.debate_context(debate), POSITION=adj_position_names[pos],
+                URL=url + person.url_key + '/' if person.url_key else '')
+            emails.append((context_user, person))
 
         return emails
 
@@ -184,11 +203,11 @@ class BallotsEmailGenerator(NotificationContextGenerator):
                 emails.append((context, adj))
         elif isinstance(results, ConsensusDebateResultWithScores):
             context = cls.context_class(DEBATE=round_name, SCORES=_create_ballot(results, results.scoresheet))
-            for adj in debate.debateadjudicator_set.all().select_related('adjudicator'):
-                if adj.adjudicator.email is None:
+            for adj, pos in debate.adjudicators.with_positions():
+                if adj.email is None:
                     continue
 
-                emails.append((context, adj.adjudicator))
+                emails.append((context, adj))
 
         return emails
 
@@ -208,10 +227,9 @@ class StandingsEmailGenerator(NotificationContextGenerator):
     @classmethod
     def generate(cls, to: 'QuerySet[Person]', url: str, round: 'Round') -> List[Tuple[EmailContextData, 'Person']]:
         emails = []
-        to_ids = {p.id for p in to}
-
-        teams = round.active_teams.filter(speaker__in=to).prefetch_related('speaker_set')
+        teams = list(round.active_teams.prefetch_related('speaker_set'))
         populate_win_counts(teams, round)
+        teams_by_speaker = {speaker.id: (team, speaker) for team in teams for speaker in team.speaker_set.all()}
 
         context = {
             'TOURN': str(round.tournament),
@@ -219,14 +237,12 @@ class StandingsEmailGenerator(NotificationContextGenerator):
             'URL': url,
         }
 
-        for team in teams:
-            team_context = {"POINTS": str(team.points_count), "TEAM": team.short_name}
-            for speaker in team.speaker_set.all():
-                if not _check_in_to(speaker.id, to_ids):
-                    continue
-
-                context_user = cls.context_class(**context, **team_context)
-                emails.append((context_user, speaker))
+        for pk in _recipient_ids(to):
+            if pk not in teams_by_speaker:
+                continue
+            team, speaker = teams_by_speaker[pk]
+            context_user = cls.context_class(**context, POINTS=str(team.points_count), TEAM=team.short_name)
+            emails.append((context_user, speaker))
 
         return emails
 
@@ -277,9 +293,9 @@ class TeamSpeakerEmailGenerator(NotificationContextGenerator):
     @classmethod
     def generate(cls, to: 'QuerySet[Person]', tournament: 'Tournament') -> List[Tuple[EmailContextData, 'Person']]:
         emails = []
-        to_ids = {p.id for p in to}
+        to_ids = set(_recipient_ids(to))
 
-        teams = tournament.team_set.filter(speaker__in=to).prefetch_related(
+        teams = tournament.team_set.filter(speaker__in=to).distinct().prefetch_related(
             'speaker_set', 'break_categories').select_related('institution')
         for team in teams:
             context = cls.context_class(
@@ -289,10 +305,8 @@ class TeamSpeakerEmailGenerator(NotificationContextGenerator):
                 INSTITUTION=str(team.institution), EMOJI=team.emoji,
             )
             for speaker in team.speakers:
-                if not _check_in_to(speaker.id, to_ids):
-                    continue
-
-                emails.append((context, speaker))
+                if speaker.id in to_ids:
+                    emails.append((context, speaker))
 
         return emails
 
@@ -313,24 +327,16 @@ class TeamDrawEmailGenerator(NotificationContextGenerator):
     @classmethod
     def generate(cls, to: 'QuerySet[Person]', round: 'Round') -> List[Tuple[EmailContextData, 'Person']]:
         emails = []
-        to_ids = {p.id for p in to}
-        tournament = round.tournament
-        draw = round.debate_set_with_prefetches(speakers=True).filter(debateteam__team__speaker__in=to)
-        use_codes = use_team_code_names(tournament, False)
-
-        for debate in draw:
-            context_debate = {"ROUND": round.name, "VENUE": debate.venue.display_name if debate.venue is not None else _("TBA"),
-                "DRAW": debate.matchup_codes if use_codes else debate.matchup,
-                "PANEL": _assemble_panel(debate.adjudicators.with_positions())}
-            for dt in debate.debateteam_set.all():
-                context = cls.context_class(**context_debate,
-                    TEAM=dt.team.code_name if use_codes else dt.team.short_name,
-                    SIDE=dt.get_side_name(tournament=round.tournament),
-                )
-                for speaker in dt.team.speakers:
-                    if not _check_in_to(speaker.id, to_ids):
-                        continue
-
-                    emails.append((context, speaker))
+        draw = _DrawIndex(round)
+
+        for person in to.order_by('name'):
+            if person.id not in draw.speakers:
+                continue
+            debate, dt, speaker = draw.speakers[person.id]
+            context = cls.context_class(**draw.debate_context(debate),
+                TEAM=dt.team.code_name if draw.use_codes else dt.team.short_name,
+                SIDE=dt.get_side_name(round.tournament),
+            )
+            emails.append((context, person))
 
         return emails
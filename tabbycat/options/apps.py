@@ -12,3 +12,5 @@ class OptionsConfig(AppConfig):
     def ready(self):
         TournamentPreferenceModel = self.get_model('TournamentPreferenceModel')  # noqa: N806
         preference_models.register(TournamentPreferenceModel, tournament_preferences_registry)
+
+        from . import signals  # noqa: F401
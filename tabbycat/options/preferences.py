@@ -148,6 +148,32 @@ class AdjHistoryPenalty(IntegerPreference):
     default = 10000
 
 
+@tournament_preferences_registry.register
+class AdjAssignmentMethod(ChoicePreference):
+    help_text = _("Which method the adjudicator auto-allocator uses to solve the assignment problem")
+    verbose_name = _("Adjudicator assignment method")
+    section = draw_rules
+    name = 'adj_assignment_method'
+    choices = (
+        ('hungarian', _("Hungarian algorithm")),
+        ('lsa', _("Linear sum assignment (faster, requires SciPy)")),
+    )
+    default = 'hungarian'
+
+
+@tournament_preferences_registry.register
+class VenueAllocationMethod(ChoicePreference):
+    help_text = _("Which method the room auto-allocator uses to satisfy room constraints")
+    verbose_name = _("Room allocation method")
+    section = draw_rules
+    name = 'venue_allocation_method'
+    choices = (
+        ('greedy', _("Greedy, in order of constraint priority")),
+        ('hungarian', _("Optimal assignment")),
+    )
+    default = 'greedy'
+
+
 @tournament_preferences_registry.register
 class PreformedPanelMismatchPenalty(IntegerPreference):
     help_text = _("Penality applied by preformed panel auto-allocator for priority mismatch")
@@ -220,6 +246,16 @@ class PairingPenalty(IntegerPreference):
     default = 0
 
 
+@tournament_preferences_registry.register
+class PairingCandidates(IntegerPreference):
+    help_text = _("For minimum cost matching, only consider this many lowest-cost opponents for each team, "
+                  "widening the search if no valid draw is found. Speeds up large brackets. 0 considers all opponents.")
+    verbose_name = _("Pairing candidates per team")
+    section = draw_rules
+    name = 'pairing_candidates'
+    default = 0
+
+
 @tournament_preferences_registry.register
 class DrawOddBracket(ChoicePreference):
     help_text = _("How odd brackets are resolved (see documentation for further details)")
@@ -365,13 +401,14 @@ class BPPositionCostExponent(FloatPreference):
 @tournament_preferences_registry.register
 class BPAssignmentMethod(ChoicePreference):
     help_text = _("In BP, which method to use to solve the assignment problem. "
-                  "Only Hungarian with preshuffling is WUDC-compliant.")
+                  "Only the methods with preshuffling are WUDC-compliant.")
     verbose_name = _("BP assignment method")
     section = draw_rules
     name = 'bp_assignment_method'
     choices = (
         ('hungarian', _("Hungarian algorithm (not WUDC-compliant)")),
         ('hungarian_preshuffled', _("Hungarian algorithm with preshuffling")),
+        ('lsa', _("Linear sum assignment with preshuffling (requires SciPy)")),
     )
     default = 'hungarian_preshuffled'
 
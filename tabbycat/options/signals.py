@@ -0,0 +1,11 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from tournaments.utils import bump_cache_version
+
+from .models import TournamentPreferenceModel
+
+
+@receiver(post_save, sender=TournamentPreferenceModel)
+def update_preferences_cache_version(sender, instance, **kwargs):
+    bump_cache_version(instance.instance, 'preferences')
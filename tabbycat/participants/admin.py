@@ -12,7 +12,7 @@ from availability.admin import RoundAvailabilityInline
 from breakqual.models import BreakCategory
 from draw.models import TeamSideAllocation
 from tournaments.models import Tournament
-from utils.admin import ModelAdmin
+from utils.admin import CacheVersionsAdminMixin, ModelAdmin
 from venues.admin import VenueConstraintInline
 
 from .emoji import pick_unused_emoji, populate_code_names_from_emoji, set_emoji
@@ -88,12 +88,14 @@ class CoachAdmin(ModelAdmin):
 
 
 @admin.register(Speaker)
-class SpeakerAdmin(ModelAdmin):
+class SpeakerAdmin(CacheVersionsAdminMixin, ModelAdmin):
     list_filter = ('team__tournament', 'team__institution')
     list_display = ('name', 'team', 'gender')
     search_fields = ('name', 'team__short_name', 'team__long_name',
                      'team__institution__name', 'team__institution__code')
     raw_id_fields = ('team', )
+    cache_versions = ('results', 'draw')  # saves are covered by signals, deletions aren't
+    tournament_lookup = 'team__speaker'
 
 
 # ==============================================================================
@@ -159,7 +161,7 @@ class AdjudicatorTeamConflictInline(admin.TabularInline):
 
 
 @admin.register(Team)
-class TeamAdmin(ModelAdmin):
+class TeamAdmin(CacheVersionsAdminMixin, ModelAdmin):
     form = TeamForm
     list_display = ('long_name', 'short_name', 'emoji_code', 'institution',
                     'tournament')
@@ -170,6 +172,8 @@ class TeamAdmin(ModelAdmin):
                AdjudicatorTeamConflictInline, TeamInstitutionConflictInline,
                RoundAvailabilityInline)
     actions = ['delete_url_key', 'assign_emoji', 'assign_code_names']
+    cache_versions = ('results', 'draw')  # saves are covered by signals, deletions aren't
+    tournament_lookup = 'team'
 
     def get_queryset(self, request):
         # can't use select_related, because TeamManager always puts a select_related on this
@@ -260,7 +264,7 @@ class AdjudicatorForm(forms.ModelForm):
 
 
 @admin.register(Adjudicator)
-class AdjudicatorAdmin(ModelAdmin):
+class AdjudicatorAdmin(CacheVersionsAdminMixin, ModelAdmin):
     form = AdjudicatorForm
     list_display = ('name', 'institution', 'tournament', 'trainee',
                     'independent', 'adj_core', 'gender', 'base_score')
@@ -271,6 +275,8 @@ class AdjudicatorAdmin(ModelAdmin):
                AdjudicatorAdjudicatorConflictInline, AdjudicatorBaseScoreHistoryInline,
                RoundAvailabilityInline)
     actions = ['delete_url_key']
+    cache_versions = ('draw',)  # for deletions; saves are covered by draw.signals
+    tournament_lookup = 'round__debate__debateadjudicator__adjudicator'
 
     def get_queryset(self, request):
         # can't use select_related, because TeamManager always puts a select_related on this
@@ -364,6 +364,11 @@ class Team(models.Model):
         return self.speaker_set.all()
 
     def seen(self, other, before_round=None):
+        """Returns the number of debates this team has had against `other`.
+        Callers using this for many pairs of teams should prefetch them using
+        `populate_history()` in the `participants.prefetch` module."""
+        if before_round is None and hasattr(self, '_seen_counts'):
+            return self._seen_counts.get(other.id, 0)
         queryset = self.debateteam_set.filter(debate__debateteam__team=other)
         if before_round:
             queryset = queryset.filter(debate__round__seq__lt=before_round)
@@ -496,14 +501,22 @@ class Adjudicator(Person):
             weight = 1  # For shared ajudicators
         return self.weighted_score(weight)
 
+    def _feedback_aggregate(self):
+        """Returns a tuple `(count, total, total_squares)` summarizing this
+        adjudicator's feedback, from their `AdjudicatorFeedbackAggregate`s."""
+        try:
+            return self._feedback_aggregate_cache
+        except AttributeError:
+            rows = self.adjudicatorfeedbackaggregate_set.values_list('count', 'total', 'total_squares')
+            self._feedback_aggregate_cache = tuple(map(sum, zip(*rows))) or (0, 0.0, 0.0)
+            return self._feedback_aggregate_cache
+
     def _feedback_score(self):
         try:
             return self._feedback_score_cache
         except AttributeError:
-            from adjallocation.models import DebateAdjudicator
-            self._feedback_score_cache = self.adjudicatorfeedback_set.filter(confirmed=True, ignored=False).exclude(
-                source_adjudicator__type=DebateAdjudicator.TYPE_TRAINEE).aggregate(
-                    avg=models.Avg('score'))['avg']
+            count, total, _ = self._feedback_aggregate()
+            self._feedback_score_cache = total / count if count else None
             return self._feedback_score_cache
 
     @property
@@ -1,9 +1,12 @@
-from django.db.models import Avg, Value
+from collections import Counter, defaultdict
+from itertools import permutations
+
+from django.db.models import Value
 from django.db.models.functions import Coalesce
 
-from adjallocation.models import DebateAdjudicator
-from adjfeedback.models import AdjudicatorFeedback
-from participants.models import Adjudicator, Team
+from adjfeedback.models import AdjudicatorFeedbackAggregate
+from draw.models import DebateTeam
+from participants.models import Team
 from standings.teams import PointsMetricAnnotator, WinsMetricAnnotator
 
 
@@ -23,27 +26,49 @@ def populate_win_counts(teams, round=None):
         teams_by_id[team.id]._points = team.points_annotation
 
 
+def populate_history(teams):
+    """Populates the `_seen_counts` attribute of the teams in `teams`, which
+    maps opponent team IDs to the number of debates the two teams have had
+    against each other, so that `Team.seen()` doesn't need to hit the database.
+    Uses a single query for all teams. Operates in-place."""
+
+    teams_by_id = {team.id: team for team in teams}
+
+    debateteams = DebateTeam.objects.filter(
+        debate__debateteam__team_id__in=teams_by_id.keys(),
+    ).values_list('debate_id', 'team_id').distinct()
+
+    teams_by_debate = defaultdict(list)
+    for debate_id, team_id in debateteams:
+        teams_by_debate[debate_id].append(team_id)
+
+    for team in teams:
+        team._seen_counts = Counter()
+
+    for team_ids in teams_by_debate.values():
+        for team_id, opponent_id in permutations(team_ids, 2):
+            if team_id in teams_by_id:
+                teams_by_id[team_id]._seen_counts[opponent_id] += 1
+
+
 def populate_feedback_scores(adjudicators):
-    """Populates the `_feedback_score_cache` attribute of the adjudicators
-    in `adjudicators`.
+    """Populates the `_feedback_aggregate_cache` and `_feedback_score_cache`
+    attributes of the adjudicators in `adjudicators`, from their
+    `AdjudicatorFeedbackAggregate`s.
     Operates in-place."""
 
-    adjs_by_id = {adj.id: adj for adj in adjudicators}
-
-    adjfeedbacks = AdjudicatorFeedback.objects.filter(
-        adjudicator_id__in=adjs_by_id.keys(),
-        confirmed=True,
-        ignored=False,
-    ).exclude(source_adjudicator__type=DebateAdjudicator.TYPE_TRAINEE)
+    totals = {adj.id: [0, 0.0, 0.0] for adj in adjudicators}
 
-    adjs_annotated = Adjudicator.objects.filter(
-        id__in=adjs_by_id.keys(),
-        adjudicatorfeedback__in=adjfeedbacks,
-    ).annotate(feedback_score_annotation=Avg('adjudicatorfeedback__score'))
+    aggregates = AdjudicatorFeedbackAggregate.objects.filter(adjudicator_id__in=totals.keys()).values_list(
+        'adjudicator_id', 'count', 'total', 'total_squares')
 
-    for adj in adjs_annotated:
-        adjs_by_id[adj.id]._feedback_score_cache = adj.feedback_score_annotation
+    for adj_id, count, total, total_squares in aggregates:
+        adj_totals = totals[adj_id]
+        adj_totals[0] += count
+        adj_totals[1] += total
+        adj_totals[2] += total_squares
 
     for adj in adjudicators:
-        if not hasattr(adj, '_feedback_score_cache'):
-            adj._feedback_score_cache = None
+        count, total, total_squares = totals[adj.id]
+        adj._feedback_aggregate_cache = (count, total, total_squares)
+        adj._feedback_score_cache = total / count if count else None
@@ -1,5 +1,8 @@
+from django.test import TestCase
+
 from participants.models import Adjudicator, Institution
-from utils.tests import BaseMinimalTournamentTestCase
+from participants.prefetch import populate_history
+from utils.tests import BaseMinimalTournamentTestCase, CompletedTournamentTestMixin
 
 
 class TestInstitution(BaseMinimalTournamentTestCase):
@@ -10,3 +13,17 @@ class TestInstitution(BaseMinimalTournamentTestCase):
 class TestAdjudicator(BaseMinimalTournamentTestCase):
     def test_objects(self):
         self.assertEqual(8, Adjudicator.objects.count())
+
+
+class TestTeamHistory(CompletedTournamentTestMixin, TestCase):
+    def test_populate_history(self):
+        teams = list(self.tournament.team_set.all())
+        expected = {(t1.id, t2.id): t1.seen(t2) for t1 in teams for t2 in teams if t1 != t2}
+
+        with self.assertNumQueries(1):
+            populate_history(teams)
+        with self.assertNumQueries(0):
+            actual = {(t1.id, t2.id): t1.seen(t2) for t1 in teams for t2 in teams if t1 != t2}
+
+        self.assertEqual(expected, actual)
+        self.assertTrue(any(actual.values()))
@@ -1,9 +1,12 @@
 import json
 
 import qrcode
+from django.conf import settings
 from django.contrib.humanize.templatetags.humanize import ordinal
+from django.core.cache import cache
+from django.utils.functional import cached_property
 from django.utils.html import escape
-from django.utils.translation import gettext as _
+from django.utils.translation import get_language, gettext as _
 from django.views.generic.base import TemplateView
 from qrcode.image import svg
 
@@ -12,20 +15,48 @@ from adjfeedback.utils import expected_feedback_targets
 from checkins.models import DebateIdentifier
 from checkins.utils import create_identifiers
 from draw.models import DebateTeam
+from draw.snapshot import DrawSnapshot
 from options.utils import use_team_code_names
 from participants.models import Adjudicator, Speaker
+from results.models import TeamScore
 from results.utils import side_and_position_names
 from tournaments.mixins import (CurrentRoundMixin, OptionalAssistantTournamentPageMixin,
                                 RoundMixin, TournamentMixin)
+from tournaments.utils import get_cache_version
 from users.permissions import Permission
 from utils.misc import reverse_tournament
 from utils.mixins import AdministratorMixin
 from venues.serializers import VenueSerializer
 
 
-class BasePrintFeedbackFormsView(RoundMixin, TemplateView):
+class PrintDataCacheMixin:
+    """Caches the JSON of the ballots returned by `get_ballots_dicts()` for the
+    round, so that printing a round in several batches builds it only once.
+    The key includes the versions of the data kinds in `print_cache_versions`
+    (see `tournaments.utils.get_cache_version()`), which cover everything on
+    the forms, including participants' names, so entries are kept as long as
+    other versioned pages."""
+
+    print_cache_name = None
+    print_cache_versions = ('draw', 'results', 'preferences')
+
+    def get_ballots_dicts(self):
+        raise NotImplementedError("subclasses must implement get_ballots_dicts()")
+
+    def get_ballots_json(self):
+        versions = "_".join("%s%d" % (kind, get_cache_version(self.tournament, kind)) for kind in self.print_cache_versions)
+        key = "%s_%d_%s_%s" % (self.print_cache_name, self.round.id, get_language(), versions)
+        ballots = cache.get(key)
+        if ballots is None:
+            ballots = json.dumps(self.get_ballots_dicts())
+            cache.set(key, ballots, settings.TAB_PAGES_CACHE_TIMEOUT)
+        return ballots
+
+
+class BasePrintFeedbackFormsView(PrintDataCacheMixin, RoundMixin, TemplateView):
 
     template_name = 'feedback_list.html'
+    print_cache_name = 'printfeedback'
 
     def add_defaults(self):
         default_questions = []
@@ -56,22 +87,26 @@ class BasePrintFeedbackFormsView(RoundMixin, TemplateView):
 
         return questions
 
+    @cached_property
+    def use_code_names(self):
+        return use_team_code_names(self.tournament, False)
+
     def construct_info(self, venue, source, source_p, target, target_p):
         if hasattr(source, 'name'): # Not a team
             source_n = source.name
-        elif use_team_code_names(self.tournament, False):
+        elif self.use_code_names:
             source_n = source.code_name
         else:
             source_n = source.short_name
 
         return {
-            'venue': VenueSerializer(venue).data if venue else '',
+            'venue': venue,
             'authorInstitution': escape(source.institution.code) if source.institution else _("Unaffiliated"),
             'author': escape(source_n), 'authorPosition': source_p,
             'target': escape(target.name), 'targetPosition': target_p,
         }
 
-    def get_team_feedbacks(self, debate, team):
+    def get_team_feedbacks(self, debate, team, venue=None):
         if len(debate.adjudicators) == 0:
             return []
 
@@ -79,15 +114,15 @@ class BasePrintFeedbackFormsView(RoundMixin, TemplateView):
         ballots = []
 
         if team_paths == 'orallist' and debate.adjudicators.chair:
-            ballots.append(self.construct_info(debate.venue, team, _("Team"),
+            ballots.append(self.construct_info(venue, team, _("Team"),
                                                debate.adjudicators.chair, ""))
         elif team_paths == 'all-adjs':
             for target in debate.adjudicators.all():
-                ballots.append(self.construct_info(debate.venue, team, _("Team"), target, ""))
+                ballots.append(self.construct_info(venue, team, _("Team"), target, ""))
 
         return ballots
 
-    def get_adj_feedbacks(self, debate):
+    def get_adj_feedbacks(self, debate, venue=None):
         adj_paths = self.tournament.pref('feedback_paths')
         ballots = []
 
@@ -97,21 +132,26 @@ class BasePrintFeedbackFormsView(RoundMixin, TemplateView):
             spos = debate.adjudicators.get_position(sadj)
             targets = expected_feedback_targets(debateadj, feedback_paths=adj_paths, debate=debate)
             for tadj, tpos in targets:
-                ballots.append(self.construct_info(debate.venue, sadj, spos, tadj, tpos))
+                ballots.append(self.construct_info(venue, sadj, spos, tadj, tpos))
 
         return ballots
 
-    def get_context_data(self, **kwargs):
+    def get_ballots_dicts(self):
         draw = self.round.debate_set_with_prefetches(institutions=True)
         draw = sorted(draw, key=lambda d: d.venue.display_name if d.venue else "")
 
         ballots = []
         for debate in draw:
+            # Serialize the venue once, rather than for every form in the room
+            venue = VenueSerializer(debate.venue).data if debate.venue else ''
             for team in debate.teams:
-                ballots.extend(self.get_team_feedbacks(debate, team))
-            ballots.extend(self.get_adj_feedbacks(debate))
+                ballots.extend(self.get_team_feedbacks(debate, team, venue))
+            ballots.extend(self.get_adj_feedbacks(debate, venue))
+
+        return ballots
 
-        kwargs['ballots'] = json.dumps(ballots)
+    def get_context_data(self, **kwargs):
+        kwargs['ballots'] = self.get_ballots_json()
         kwargs['questions'] = json.dumps(self.questions_dict())
 
         kwargs['team_questions_exist'] = AdjudicatorFeedbackQuestion.objects.filter(tournament=self.tournament, from_team=True).exists()
@@ -128,16 +168,21 @@ class AssistantPrintFeedbackFormsView(CurrentRoundMixin, OptionalAssistantTourna
     assistant_page_permissions = ['all_areas', 'results_draw']
 
 
-class BasePrintScoresheetsView(RoundMixin, TemplateView):
+class BasePrintScoresheetsView(PrintDataCacheMixin, RoundMixin, TemplateView):
 
     template_name = 'scoresheet_list.html'
+    print_cache_name = 'printscoresheets'
 
     def get_ballots_dicts(self):
-        draw = self.round.debate_set_with_prefetches(iron=True)
-
         # Create the DebateIdentifiers for the ballots if needed
-        create_identifiers(DebateIdentifier, draw)
-        identifiers = DebateIdentifier.objects.values('debate_id', 'barcode')
+        create_identifiers(DebateIdentifier, self.round.debate_set.all())
+        draw = DrawSnapshot.for_round(self.round)
+        barcodes = dict(DebateIdentifier.objects.filter(
+            debate__round=self.round).values_list('debate_id', 'barcode'))
+        # Teams that were ironed last round, which the snapshot doesn't hold
+        # since it doesn't follow results
+        ironed = set(TeamScore.objects.filter(debate_team__debate__round=self.round.prev, has_ghost=True,
+            ballot_submission__confirmed=True).values_list('debate_team__team_id', flat=True))
 
         draw = sorted(draw, key=lambda d: d.venue.display_name if d.venue else "")
         ballots_dicts = []
@@ -154,7 +199,7 @@ class BasePrintScoresheetsView(RoundMixin, TemplateView):
             else:
                 debate_dict['venue'] = None
 
-            debate_dict['barcode'] = next((i['barcode'] for i in identifiers if i['debate_id'] == debate.id), None)
+            debate_dict['barcode'] = barcodes.get(debate.id)
 
             debate_dict['debateTeams'] = []
             for side, (side_name, positions) in zip(self.tournament.sides, sides_and_positions):
@@ -165,7 +210,7 @@ class BasePrintScoresheetsView(RoundMixin, TemplateView):
                         'short_name': escape(team.short_name),
                         'code_name': escape(team.code_name),
                         'speakers': [{'name': escape(s.get_public_name(self.tournament))} for s in team.speakers],
-                        'iron': debate.get_dt(side).iron_prev > 0,
+                        'iron': team.id in ironed,
                     }
                 except DebateTeam.DoesNotExist:
                     dt_dict['team'] = None
@@ -176,7 +221,7 @@ class BasePrintScoresheetsView(RoundMixin, TemplateView):
                 da_dict = {'position': pos}
                 da_dict['adjudicator'] = {
                     'name': escape(adj.get_public_name(self.tournament)),
-                    'institution': {'code': escape(adj.institution.code) if adj.institution else _("Unaffiliated")},
+                    'institution': {'code': escape(adj.institution_code) if adj.institution_code else _("Unaffiliated")},
                 }
                 debate_dict['debateAdjudicators'].append(da_dict)
 
@@ -196,7 +241,7 @@ class BasePrintScoresheetsView(RoundMixin, TemplateView):
                 if author:
                     ballot_dict = {
                         'author': escape(author.name),
-                        'authorInstitution': escape(author.institution.code) if author.institution else _("Unaffiliated"),
+                        'authorInstitution': escape(author.institution_code) if author.institution_code else _("Unaffiliated"),
                         'authorPosition': pos,
                     }
                 else:
@@ -213,7 +258,7 @@ class BasePrintScoresheetsView(RoundMixin, TemplateView):
         return ballots_dicts
 
     def get_context_data(self, **kwargs):
-        kwargs['ballots'] = json.dumps(self.get_ballots_dicts())
+        kwargs['ballots'] = self.get_ballots_json()
         kwargs['ordinals'] = [ordinal(i) for i in range(1, 5)]
         motions = self.round.roundmotion_set.order_by('seq').select_related('motion')
         kwargs['motions'] = json.dumps([{'seq': m.seq, 'text': escape(m.motion.text)} for m in motions])
@@ -5,7 +5,8 @@ from django.db.models import OuterRef, Prefetch, Subquery
 from django.utils.translation import gettext_lazy as _, ngettext_lazy
 
 from draw.models import DebateTeam
-from utils.admin import ModelAdmin, TabbycatModelAdminFieldsMixin
+from tournaments.utils import bump_cache_version
+from utils.admin import CacheVersionsAdminMixin, ModelAdmin, TabbycatModelAdminFieldsMixin
 
 from .models import BallotSubmission, ScoreCriterion, SpeakerCriterionScore, SpeakerCriterionScoreByAdj, SpeakerScore, SpeakerScoreByAdj, TeamScore, TeamScoreByAdj
 from .prefetch import populate_results
@@ -16,7 +17,7 @@ from .prefetch import populate_results
 # ==============================================================================
 
 @admin.register(BallotSubmission)
-class BallotSubmissionAdmin(TabbycatModelAdminFieldsMixin, ModelAdmin):
+class BallotSubmissionAdmin(CacheVersionsAdminMixin, TabbycatModelAdminFieldsMixin, ModelAdmin):
     list_display = ('id', 'debate', 'version', 'get_round', 'timestamp',
             'submitter_type', 'submitter', 'confirmer', 'confirmed')
     list_editable = ('confirmed',)
@@ -26,6 +27,8 @@ class BallotSubmissionAdmin(TabbycatModelAdminFieldsMixin, ModelAdmin):
     # This incurs a massive performance hit
     # inlines = (SpeakerScoreByAdjInline, SpeakerScoreInline, TeamScoreInline)
     actions = ['resave_ballots']
+    cache_versions = ('results',)
+    tournament_lookup = 'round__debate__ballotsubmission'
 
     def get_queryset(self, request):
         return super(BallotSubmissionAdmin, self).get_queryset(request).select_related(
@@ -40,6 +43,7 @@ class BallotSubmissionAdmin(TabbycatModelAdminFieldsMixin, ModelAdmin):
             populate_results(bss, tournament)
             for bs in bss:
                 bs.result.save()
+            bump_cache_version(tournament, 'results')  # saving results doesn't re-save the ballots
 
         self.message_user(request, ngettext_lazy(
             "Resaved results for %(count)d ballot submission.",
@@ -52,12 +56,14 @@ class BallotSubmissionAdmin(TabbycatModelAdminFieldsMixin, ModelAdmin):
 # ==============================================================================
 
 @admin.register(TeamScore)
-class TeamScoreAdmin(TabbycatModelAdminFieldsMixin, ModelAdmin):
+class TeamScoreAdmin(CacheVersionsAdminMixin, TabbycatModelAdminFieldsMixin, ModelAdmin):
     list_display = ('id', 'ballot_submission', 'get_round', 'get_team', 'points', 'win', 'score')
     search_fields = ('debate_team__debate__round__seq', 'debate_team__debate__round__tournament__name',
                      'debate_team__team__short_name', 'debate_team__team__institution__name')
     list_filter = ('debate_team__debate__round', )
     raw_id_fields = ('ballot_submission', 'debate_team')
+    cache_versions = ('results',)
+    tournament_lookup = 'round__debate__debateteam__teamscore'
 
     def get_queryset(self, request):
         return super(TeamScoreAdmin, self).get_queryset(request).select_related(
@@ -72,12 +78,14 @@ class TeamScoreAdmin(TabbycatModelAdminFieldsMixin, ModelAdmin):
 # ==============================================================================
 
 @admin.register(TeamScoreByAdj)
-class TeamScoreByAdjAdmin(TabbycatModelAdminFieldsMixin, ModelAdmin):
+class TeamScoreByAdjAdmin(CacheVersionsAdminMixin, TabbycatModelAdminFieldsMixin, ModelAdmin):
     list_display = ('id', 'ballot_submission', 'get_round', 'get_adj_name', 'get_team', 'win', 'margin', 'score')
     search_fields = ('debate_team__debate__round__seq', 'debate_team__debate__round__tournament__name',
                      'debate_team__team__short_name', 'debate_team__team__institution__name')
     list_filter = ('debate_team__debate__round', 'debate_adjudicator__adjudicator__name')
     raw_id_fields = ('ballot_submission', 'debate_adjudicator', 'debate_team')
+    cache_versions = ('results',)
+    tournament_lookup = 'round__debate__debateteam__teamscorebyadj'
 
     def get_queryset(self, request):
         return super(TeamScoreByAdjAdmin, self).get_queryset(request).select_related(
@@ -95,7 +103,7 @@ class TeamScoreByAdjAdmin(TabbycatModelAdminFieldsMixin, ModelAdmin):
 # ==============================================================================
 
 @admin.register(SpeakerScore)
-class SpeakerScoreAdmin(TabbycatModelAdminFieldsMixin, ModelAdmin):
+class SpeakerScoreAdmin(CacheVersionsAdminMixin, TabbycatModelAdminFieldsMixin, ModelAdmin):
     list_display = ('id', 'ballot_submission', 'get_round', 'get_team', 'position',
                     'get_speaker_name', 'score', 'ghost')
     search_fields = ('debate_team__debate__round__abbreviation',
@@ -103,6 +111,8 @@ class SpeakerScoreAdmin(TabbycatModelAdminFieldsMixin, ModelAdmin):
                      'speaker__name')
     list_filter = ('score', 'debate_team__debate__round', 'ghost')
     raw_id_fields = ('debate_team', 'ballot_submission')
+    cache_versions = ('results',)
+    tournament_lookup = 'round__debate__debateteam__speakerscore'
 
     def get_queryset(self, request):
         return super(SpeakerScoreAdmin, self).get_queryset(request).select_related(
@@ -118,7 +128,7 @@ class SpeakerScoreAdmin(TabbycatModelAdminFieldsMixin, ModelAdmin):
 # ==============================================================================
 
 @admin.register(SpeakerScoreByAdj)
-class SpeakerScoreByAdjAdmin(TabbycatModelAdminFieldsMixin, ModelAdmin):
+class SpeakerScoreByAdjAdmin(CacheVersionsAdminMixin, TabbycatModelAdminFieldsMixin, ModelAdmin):
     list_display = ('id', 'ballot_submission', 'get_round', 'get_adj_name', 'get_team', 'position', 'get_speaker_name', 'score')
     search_fields = ('debate_team__debate__round__seq',
                      'debate_team__team__short_name', 'debate_team__team__institution__name',
@@ -127,6 +137,8 @@ class SpeakerScoreByAdjAdmin(TabbycatModelAdminFieldsMixin, ModelAdmin):
     list_filter = ('debate_team__debate__round', 'debate_adjudicator__adjudicator__name',
                    'debate_adjudicator__type')
     raw_id_fields = ('debate_team', 'debate_adjudicator', 'ballot_submission')
+    cache_versions = ('results',)
+    tournament_lookup = 'round__debate__debateteam__speakerscorebyadj'
 
     @admin.display(description=_("Speaker"))
     def get_speaker_name(self, obj):
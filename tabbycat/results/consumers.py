@@ -1,5 +1,6 @@
 from channels.generic.websocket import JsonWebsocketConsumer
 
+from draw.models import Debate
 from tournaments.mixins import TournamentWebsocketMixin
 from utils.mixins import LoginRequiredWebsocketMixin
 
@@ -9,4 +10,35 @@ class BallotResultConsumer(LoginRequiredWebsocketMixin, TournamentWebsocketMixin
 
 
 class BallotStatusConsumer(LoginRequiredWebsocketMixin, TournamentWebsocketMixin, JsonWebsocketConsumer):
+    """Broadcasts changes to ballot statuses (see
+    `results.forms.broadcast_ballot_status()`). Clients that detect a gap in
+    the sequence numbers of those messages can send `{'resync': [debate ids]}`
+    to get the current status and ballots of those debates."""
+
     group_prefix = 'ballot_statuses'
+
+    def receive_json(self, content):
+        from .utils import ballot_status_delta, get_ballot_status_seq
+
+        debate_ids = content.get('resync')
+        if not isinstance(debate_ids, list):
+            return
+
+        # Get the sequence number first, so that any message sent while this
+        # is being prepared is newer than the resync and gets applied after it
+        seq = get_ballot_status_seq(self.tournament)
+
+        debates = Debate.objects.filter(
+            round__tournament=self.tournament, id__in=debate_ids,
+        ).select_related('round__tournament').prefetch_related(
+            'ballotsubmission_set__submitter', 'ballotsubmission_set__participant_submitter',
+        )
+
+        deltas = []
+        for debate in debates:
+            delta = ballot_status_delta(debate)
+            ballotsubs = sorted(debate.ballotsubmission_set.all(), key=lambda b: b.version)
+            delta['ballots'] = [b.serialize(self.tournament) for b in ballotsubs]
+            deltas.append(delta)
+
+        self.send_json({'data': {'resync': True, 'seq': seq, 'debates': deltas}})
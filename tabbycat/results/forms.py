@@ -15,12 +15,12 @@ from draw.types import DebateSide
 from options.utils import use_team_code_names_data_entry
 from participants.models import Speaker, Team
 from participants.templatetags.team_name_for_data_entry import team_name_for_data_entry
-from tournaments.utils import get_side_name
+from tournaments.utils import bump_draw_cache_version, get_side_name
 
 from .consumers import BallotResultConsumer, BallotStatusConsumer
 from .result import (ConsensusDebateResult, ConsensusDebateResultWithScores,
                      DebateResultByAdjudicator, DebateResultByAdjudicatorWithScores)
-from .utils import get_status_meta, side_and_position_names
+from .utils import ballot_status_delta, next_ballot_status_seq, side_and_position_names
 
 if TYPE_CHECKING:
     from .models import BallotSubmission
@@ -102,31 +102,38 @@ class ReplyScoreField(BaseScoreField):
     DEFAULT_STEP_VALUE = 0.5
 
 
-def broadcast_results(ballotsub: 'BallotSubmission', debate: Debate):
+def broadcast_ballot_status(debate, ballotsub=None, result=None):
+    """Sends the debate's ballot status to `BallotStatusConsumer` listeners.
+
+    Each message carries a sequence number, one more than the last message for
+    the tournament, so that clients can tell if they missed any and ask the
+    consumer to resync."""
     t = debate.round.tournament
+    data = ballot_status_delta(debate, ballotsub, result)
+    data['seq'] = next_ballot_status_seq(t)
+
+    group_name = BallotStatusConsumer.group_prefix + "_" + t.slug
+    async_to_sync(get_channel_layer().group_send)(group_name, {
+        "type": "send_json",
+        "data": data,
+    })
+
+
+def broadcast_results(ballotsub: 'BallotSubmission', debate: Debate):
+    result = None
 
     # 5. Notify the Latest Results consumer (for results/overview)
     if ballotsub.confirmed and debate.result_status == Debate.STATUS_CONFIRMED:
-        group_name = BallotResultConsumer.group_prefix + "_" + t.slug
+        summary = ballotsub.serialize_like_actionlog
+        result = {'winner': summary['user'], 'result': summary['type']}
+        group_name = BallotResultConsumer.group_prefix + "_" + debate.round.tournament.slug
         async_to_sync(get_channel_layer().group_send)(group_name, {
             "type": "send_json",
-            "data": ballotsub.serialize_like_actionlog,
+            "data": summary,
         })
 
     # 6. Notify the Results Page/Ballots Status Graph
-    group_name = BallotStatusConsumer.group_prefix + "_" + t.slug
-    meta = get_status_meta(debate)
-    async_to_sync(get_channel_layer().group_send)(group_name, {
-        "type": "send_json",
-        "data": {
-            'status': debate.result_status,
-            'icon': meta[0],
-            'class': meta[1],
-            'sort': meta[2],
-            'ballot': ballotsub.serialize(t),
-            'round': debate.round_id,
-        },
-    })
+    broadcast_ballot_status(debate, ballotsub, result)
 
 
 # ==============================================================================
@@ -419,6 +426,7 @@ class BaseBallotSetForm(BaseResultForm):
         # 4. Save the sides
         if self.choosing_sides:
             self.result.set_sides(*self.cleaned_data['choose_sides'])
+            bump_draw_cache_version(self.debate.round)
 
         # 5. Save motions
         if self.using_motions and self.cleaned_data.get('motion'):
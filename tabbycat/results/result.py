@@ -302,6 +302,20 @@ class BaseDebateResult:
             self.ballotsub.teamscore_set.update_or_create(debate_team=dt,
                     defaults=self.get_defaults_fields('teamscore', side))
 
+    def build_instances(self):
+        """Returns a list of unsaved model instances equivalent to what `save()`
+        would write for a new ballot submission, for callers that create many
+        results at once (e.g. importers) to insert using `bulk_create()`.
+        Subclasses should extend this method alongside `save()`.
+        Raises ResultError if the ballot set is incomplete or invalid."""
+        from .models import TeamScore
+
+        if not self.is_valid():
+            raise ResultError("Tried to save an invalid result.")
+
+        return [TeamScore(ballot_submission=self.ballotsub, debate_team=self.debateteams[side],
+                          **self.get_defaults_fields('teamscore', side)) for side in self.sides]
+
     def get_defaults_fields(self, model, *args):
         """Collects fields defined in subclasses"""
         fields = {}
@@ -499,6 +513,18 @@ class DebateResultByAdjudicator(BaseDebateResult):
                     debate_team=dt, debate_adjudicator=da,
                     defaults=self.get_defaults_fields('teamscorebyadj', adj, side))
 
+    def build_instances(self):
+        from .models import TeamScoreByAdj
+
+        instances = super().build_instances()
+        for adj, sheet in self.scoresheets.items():
+            da = self.debateadjs[adj]
+            for side in self.sides:
+                instances.append(TeamScoreByAdj(ballot_submission=self.ballotsub,
+                    debate_team=self.debateteams[side], debate_adjudicator=da,
+                    **self.get_defaults_fields('teamscorebyadj', adj, side)))
+        return instances
+
     # --------------------------------------------------------------------------
     # Data setting and retrieval
     # --------------------------------------------------------------------------
@@ -769,6 +795,21 @@ class DebateResultWithScoresMixin:
                     speaker_score.speakercriterionscore_set.update_or_create(
                         criterion=criterion, defaults=self.get_defaults_fields('speakercriterionscore', side, pos, criterion))
 
+    def build_instances(self):
+        from .models import SpeakerScore
+
+        # Criterion scores need the primary keys of their speaker scores
+        if self.criteria:
+            raise ResultError("Can't build instances for results with score criteria.")
+
+        instances = super().build_instances()
+        for side in self.sides:
+            for pos in self.positions:
+                instances.append(SpeakerScore(ballot_submission=self.ballotsub,
+                    debate_team=self.debateteams[side], position=pos,
+                    **self.get_defaults_fields('speakerscore', side, pos)))
+        return instances
+
     # --------------------------------------------------------------------------
     # Data setting and retrieval
     # --------------------------------------------------------------------------
@@ -1130,6 +1171,19 @@ class DebateResultByAdjudicatorWithScores(DebateResultWithScoresMixin, DebateRes
                         speaker_score_by_adj.speakercriterionscorebyadj_set.update_or_create(
                             criterion=criterion, defaults=self.get_defaults_fields('speakercriterionscorebyadj', adj, side, pos, criterion))
 
+    def build_instances(self):
+        from .models import SpeakerScoreByAdj
+
+        instances = super().build_instances()
+        for adj, sheet in self.scoresheets.items():
+            da = self.debateadjs[adj]
+            for side in self.sides:
+                for pos in self.positions:
+                    instances.append(SpeakerScoreByAdj(ballot_submission=self.ballotsub,
+                        debate_team=self.debateteams[side], debate_adjudicator=da, position=pos,
+                        **self.get_defaults_fields('speakerscorebyadj', adj, side, pos)))
+        return instances
+
     def set_score(self, adjudicator, side, position, score):
         try:
             self.scoresheets[adjudicator].set_score(side, position, score)
@@ -0,0 +1,38 @@
+import logging
+
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from participants.models import Speaker, Team
+from tournaments.models import Tournament
+from tournaments.utils import bump_cache_version, bump_cache_version_where
+
+from .models import BallotSubmission
+
+logger = logging.getLogger(__name__)
+
+# Scores aren't watched here: they're saved in bulk with every ballot, and a
+# query per row to find the tournament would add up. Ballot entry is covered
+# by the BallotSubmission receiver; scores edited or deleted in the admin bump
+# the version in `results.admin`, and deleting debates bumps it in the draw
+# code that does so.
+
+
+@receiver(post_save, sender=BallotSubmission)
+def update_results_cache_version(sender, instance, **kwargs):
+    # Scores are saved before the ballot submission is (re-)saved with its
+    # final confirmed status, so this catches every change to results
+    bump_cache_version(instance.debate.round.tournament, 'results')
+
+
+# Standings hold teams and speakers, so renaming them (or moving a speaker to
+# another team) changes cached standings too. Deletions are bumped in the admin.
+
+@receiver(post_save, sender=Team)
+def update_results_cache_version_for_team(sender, instance, **kwargs):
+    bump_cache_version(Tournament(id=instance.tournament_id), 'results')
+
+
+@receiver(post_save, sender=Speaker)
+def update_results_cache_version_for_speaker(sender, instance, **kwargs):
+    bump_cache_version_where('results', team=instance.team_id)
@@ -2,6 +2,7 @@ import logging
 from itertools import combinations
 
 from django.contrib.humanize.templatetags.humanize import ordinal
+from django.core.cache import cache
 from django.db.models import Count
 from django.utils.translation import gettext as _
 from django.utils.translation import gettext_lazy
@@ -22,6 +23,51 @@ def get_status_meta(debate):
     }[debate.result_status]
 
 
+def _ballot_status_seq_key(tournament):
+    return "ballot_statuses_seq_%d" % tournament.id
+
+
+def get_ballot_status_seq(tournament):
+    """Returns the sequence number of the last ballot status message broadcast
+    for the tournament, or 0 if there hasn't been one.
+
+    The sequence number is kept in the default cache, so must be shared by all
+    processes that serve pages or send messages. Deployments with more than one
+    process therefore need a shared cache backend (e.g. Redis, as the Heroku
+    and Docker settings use); with a per-process cache like `LocMemCache`,
+    processes would number messages independently, and clients would resync
+    far more often than they need to."""
+    return cache.get(_ballot_status_seq_key(tournament), 0)
+
+
+def next_ballot_status_seq(tournament):
+    """Increments and returns the tournament's ballot status sequence number."""
+    key = _ballot_status_seq_key(tournament)
+    cache.add(key, 0, None)
+    try:
+        return cache.incr(key)
+    except ValueError:  # evicted in between; clients will resync
+        cache.set(key, 1, None)
+        return 1
+
+
+def ballot_status_delta(debate, ballotsub=None, result=None):
+    """Returns a compact description of the ballot status of a debate, for
+    clients listening to `BallotStatusConsumer` to apply to their tables and
+    graphs. `result` is an optional summary of the confirmed result."""
+    meta = get_status_meta(debate)
+    return {
+        'debate_id': debate.id,
+        'round': debate.round_id,
+        'status': debate.result_status,
+        'icon': meta[0],
+        'class': meta[1],
+        'sort': meta[2],
+        'ballot': ballotsub.serialize(debate.round.tournament) if ballotsub is not None else None,
+        'result': result,
+    }
+
+
 def readable_ballotsub_result(debateresult):
     """ Make a human-readable representation of a debate result """
 
@@ -28,6 +28,7 @@ from notifications.models import BulkNotification
 from options.utils import use_team_code_names, use_team_code_names_data_entry
 from participants.models import Adjudicator
 from participants.templatetags.team_name_for_data_entry import team_name_for_data_entry
+from standings.round_results import RoundScoreboard
 from tournaments.mixins import (CurrentRoundMixin, PersonalizablePublicTournamentPageMixin, PublicTournamentPageMixin,
                                 RoundMixin, SingleObjectByRandomisedUrlMixin, SingleObjectFromTournamentMixin,
                                 TournamentMixin)
@@ -38,14 +39,13 @@ from utils.mixins import AdministratorMixin, AssistantMixin
 from utils.tables import TabbycatTableBuilder
 from utils.views import PostOnlyRedirectView, VueTableTemplateView
 
-from .consumers import BallotStatusConsumer
-from .forms import (broadcast_results, PerAdjudicatorBallotSetForm, PerAdjudicatorEliminationBallotSetForm,
+from .forms import (broadcast_ballot_status, broadcast_results, PerAdjudicatorBallotSetForm, PerAdjudicatorEliminationBallotSetForm,
                     SingleBallotSetForm, SingleEliminationBallotSetForm)
-from .models import BallotSubmission, ScoreCriterion, TeamScore
+from .models import BallotSubmission, ScoreCriterion
 from .prefetch import populate_confirmed_ballots, populate_results
 from .result import DebateResult, get_class_name
 from .tables import ResultsTableBuilder
-from .utils import get_status_meta, populate_identical_ballotsub_lists
+from .utils import get_ballot_status_seq, populate_identical_ballotsub_lists
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +55,7 @@ class PublicResultsIndexView(PublicTournamentPageMixin, TemplateView):
     template_name = 'public_results_index.html'
     public_page_preference = 'public_results'
     cache_timeout = settings.PUBLIC_SLOW_CACHE_TIMEOUT
+    cache_versions = ('results', 'preferences')
 
     def get_context_data(self, **kwargs):
         kwargs["rounds"] = self.tournament.round_set.filter(
@@ -102,6 +103,9 @@ class BaseResultsEntryForRoundView(RoundMixin, VueTableTemplateView):
         return iron_speeches
 
     def get_context_data(self, **kwargs):
+        # Read before the table is built, so that clients can tell if they
+        # missed any ballot status changes made in the meantime
+        kwargs["ballot_status_seq"] = get_ballot_status_seq(self.tournament)
         kwargs["incomplete_ballots"] = self._get_draw().filter(
             Q(result_status=Debate.STATUS_NONE) | Q(result_status=Debate.STATUS_DRAFT)).exists()
         kwargs["iron_speeches"] = self.get_irons_list()
@@ -163,6 +167,7 @@ class PublicResultsForRoundView(RoundMixin, PublicTournamentPageMixin, VueTableT
     page_emoji = '💥'
     default_view = 'team'
     cache_timeout = settings.PUBLIC_SLOW_CACHE_TIMEOUT
+    cache_versions = ('results', 'draw', 'preferences')  # shows rooms, panels and motions
 
     def get_table(self):
         view_type = self.request.session.get('results_view', self.default_view)
@@ -172,8 +177,11 @@ class PublicResultsForRoundView(RoundMixin, PublicTournamentPageMixin, VueTableT
             return self.get_table_by_team()
 
     def get_table_by_debate(self):
-        debates = self.round.debate_set_with_prefetches(results=True,
-                wins=True, institutions=True, adjudicators=True)
+        # This lists every debate, including those without a confirmed ballot,
+        # so it starts from the draw rather than RoundScoreboard's team scores.
+        # Wins come from one query in populate_wins(), and full results are
+        # only needed to show splits.
+        debates = self.round.debate_set_with_prefetches(wins=True, institutions=True, adjudicators=True)
         populate_confirmed_ballots(debates, motions=True,
                 results=self.round.ballots_per_debate == 'per-adj')
 
@@ -190,16 +198,15 @@ class PublicResultsForRoundView(RoundMixin, PublicTournamentPageMixin, VueTableT
         return table
 
     def get_table_by_team(self):
-        teamscores = TeamScore.objects.filter(
-            debate_team__debate__round=self.round,
-            ballot_submission__confirmed=True).prefetch_related(
+        teamscores = RoundScoreboard([self.round]).teamscores(select_related=(
+            'ballot_submission',
+            'debate_team__team__institution',
+        ), prefetch_related=(
             'debate_team__team__speaker_set',
             'debate_team__debate__debateadjudicator_set__adjudicator',
             'debate_team__debate__debateadjudicator_set__adjudicator__institution',
-            'debate_team__debate__debateteam_set__team').select_related(
-            'ballot_submission',
-            'debate_team__team__institution',
-            'debate_team__debate__round')
+            'debate_team__debate__debateteam_set__team',
+        ))
         debates = [ts.debate_team.debate for ts in teamscores]
 
         if self.tournament.pref('teams_in_debate') == 2:
@@ -899,20 +906,7 @@ class PostponeDebateView(AdministratorMixin, RoundMixin, PostOnlyRedirectView):
         debate.result_status = Debate.STATUS_POSTPONED
         debate.save()
 
-        # Notify the Results Page
-        group_name = BallotStatusConsumer.group_prefix + "_" + debate.round.tournament.slug
-        meta = get_status_meta(debate)
-        async_to_sync(get_channel_layer().group_send)(group_name, {
-            "type": "send_json",
-            "data": {
-                'status': debate.result_status,
-                'icon': meta[0],
-                'class': meta[1],
-                'sort': meta[2],
-                'ballot': None,
-                'round': debate.round_id,
-            },
-        })
+        broadcast_ballot_status(debate)  # Notify the Results Page
 
         return super().post(request, *args, **kwargs)
 
@@ -210,6 +210,11 @@ PUBLIC_FAST_CACHE_TIMEOUT = int(os.environ.get('PUBLIC_FAST_CACHE_TIMEOUT', 60 *
 PUBLIC_SLOW_CACHE_TIMEOUT = int(os.environ.get('PUBLIC_SLOW_CACHE_TIMEOUT', 60 * 3.5))
 TAB_PAGES_CACHE_TIMEOUT = int(os.environ.get('TAB_PAGES_CACHE_TIMEOUT', 60 * 120))
 
+
+# How long a request for an uncached public page waits for another worker that
+# is already generating it, before generating it itself
+PUBLIC_CACHE_LOCK_TIMEOUT = int(os.environ.get('PUBLIC_CACHE_LOCK_TIMEOUT', 10))
+
 # Default non-heroku cache is to use local memory
 CACHES = {
     'default': {
@@ -1,11 +1,16 @@
 """Base class for standings generators."""
 
+import hashlib
 import logging
 import random
 
+from django.conf import settings
+from django.core.cache import cache
 from django.db.models import Q
 from django.utils.translation import gettext as _
 
+from tournaments.utils import get_cache_version
+
 from .metrics import metricgetter, QuerySetMetricAnnotator, RepeatedMetricAnnotator
 
 logger = logging.getLogger(__name__)
@@ -258,6 +263,37 @@ class Standings:
     def filter(self, include_filter):
         self.infos = {instance: info for instance, info in self.infos.items() if include_filter(info)}
 
+    def get_cached_data(self):
+        """Returns the computed metrics and rankings in a form that can be
+        cached. The instances themselves are not included; `from_cached_data()`
+        takes them separately."""
+        return {
+            'order': [info.instance_id for info in self.standings],
+            'metrics': {info.instance_id: info.metrics for info in self.infos.values()},
+            'rankings': {info.instance_id: info.rankings for info in self.infos.values()},
+            'metric_specs': [(*spec, self.metric_ascending[spec[0]]) for spec in self._metric_specs],
+            'ranking_specs': self._ranking_specs,
+        }
+
+    @classmethod
+    def from_cached_data(cls, instances, data, rank_filter=None):
+        """Reconstructs ranked standings for `instances` from the output of
+        `get_cached_data()`."""
+        standings = cls(instances, rank_filter=rank_filter)
+        for spec in data['metric_specs']:
+            standings.record_added_metric(*spec)
+        for spec in data['ranking_specs']:
+            standings.record_added_ranking(*spec)
+
+        infos_by_id = {info.instance_id: info for info in standings.infos.values()}
+        for instance_id, info in infos_by_id.items():
+            info.metrics = data['metrics'][instance_id]
+            info.rankings = data['rankings'][instance_id]
+
+        standings._standings = [infos_by_id[instance_id] for instance_id in data['order']]
+        standings.ranked = True
+        return standings
+
     def set_rank_limit(self, rank_limit):
         """Sets the rank limit on these standings. This doesn't affect the data
         held by a Standings instance, but if the rank limit is set, then when
@@ -274,6 +310,7 @@ class BaseStandingsGenerator:
         "tiebreak": "random",
         "rank_filter": (None, None),  # (Field name, Min value)
         "include_filter": None,  # not currently used by other code,
+        "cache": True,  # cache until results in the tournament next change
     }
 
     TIEBREAK_FUNCTIONS = {
@@ -317,6 +354,25 @@ class BaseStandingsGenerator:
     def get_rank_filter(self):
         return lambda info: info.metrics[self.options["rank_filter"][0]] >= self.options["rank_filter"][1]
 
+    def get_cache_key(self, queryset, tournament=None, round=None):
+        """Returns a key under which standings for `queryset` can be cached, or
+        None if they shouldn't be. The key includes the tournament's results
+        version, so cached standings are superseded as soon as a ballot, round
+        or draw changes."""
+        tournament = tournament or (round and round.tournament)
+        if not self.options["cache"] or self.options["include_filter"] or tournament is None:
+            return None
+
+        components = (
+            self.__class__.__name__,
+            [a.key for a in self.metric_annotators], self.precedence,
+            [a.key for a in self.ranking_annotators],
+            self.options["tiebreak"], self.options["rank_filter"],
+            round and round.id, sorted(instance.id for instance in queryset),
+        )
+        digest = hashlib.sha1(repr(components).encode()).hexdigest()
+        return "standings_%d_%d_%s" % (tournament.id, get_cache_version(tournament, 'results'), digest)
+
     def generate(self, queryset, tournament=None, round=None):
         """Generates standings for the objects in queryset. Returns a
         Standings object.
@@ -325,8 +381,27 @@ class BaseStandingsGenerator:
             those objects of interest for these standings.
         `round`, if specified, is the round for which to generate the standings.
             (That is, rounds after `round` are excluded from the standings.)
+
+        Unless the "cache" option is False, the metrics and rankings are cached,
+        so repeated calls only need to fetch the objects in `queryset`.
         """
 
+        cache_key = self.get_cache_key(queryset, tournament, round)
+        if cache_key is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Using cached standings: %s", cache_key)
+                rank_filter = self.get_rank_filter() if self.options["rank_filter"][0] is not None else None
+                return Standings.from_cached_data(queryset, cached, rank_filter=rank_filter)
+
+        standings = self._generate(queryset, tournament, round)
+
+        if cache_key is not None:
+            cache.set(cache_key, standings.get_cached_data(), settings.TAB_PAGES_CACHE_TIMEOUT)
+
+        return standings
+
+    def _generate(self, queryset, tournament=None, round=None):
         rank_filter = self.get_rank_filter() if self.options["rank_filter"][0] is not None else None
         standings = Standings(queryset, rank_filter=rank_filter)
 
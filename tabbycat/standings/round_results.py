@@ -9,7 +9,82 @@ from results.models import SpeakerScore, TeamScore
 logger = logging.getLogger(__name__)
 
 
-def add_team_round_results(standings, rounds, opponents=False, lookup=None, id_attr='instance_id'):
+class RoundScoreboard:
+    """Fetches the confirmed scores of a set of rounds, indexed by team or
+    speaker and then by the position of the round in `rounds`.
+
+    Each kind of score is fetched with one query for all rounds, teams and
+    speakers together. `TeamScore` objects have `debate_team.debate.round` set
+    to the corresponding object in `rounds`, rather than joining the round."""
+
+    def __init__(self, rounds):
+        self.rounds = list(rounds)
+        self.round_indices = {r.id: i for i, r in enumerate(self.rounds)}
+        self.rounds_by_id = {r.id: r for r in self.rounds}
+
+    def teamscores(self, team_ids=None, select_related=(), prefetch_related=()):
+        """Returns a list of confirmed `TeamScore` objects in the rounds, for
+        teams in `team_ids` (or all teams if it's None)."""
+        teamscores = TeamScore.objects.filter(
+            ballot_submission__confirmed=True,
+            debate_team__debate__round__in=self.rounds,
+        ).select_related('debate_team__team', 'debate_team__debate', *select_related)
+        if team_ids is not None:
+            teamscores = teamscores.filter(debate_team__team_id__in=team_ids)
+        if prefetch_related:
+            teamscores = teamscores.prefetch_related(*prefetch_related)
+
+        teamscores = list(teamscores)
+        for ts in teamscores:
+            debate = ts.debate_team.debate
+            debate.round = self.rounds_by_id[debate.round_id]
+        return teamscores
+
+    def team_results(self, team_ids=None, opponents=False):
+        """Returns a dict mapping team IDs to lists of `TeamScore` objects, one
+        for each round (in the same order as `rounds`). Elements are None for
+        rounds without a relevant `TeamScore`.
+
+        If `opponents` is True, each `DebateTeam` has its opponent populated
+        (see `draw.prefetch.populate_opponents()`), otherwise the teams in each
+        debate are prefetched."""
+        if opponents:
+            teamscores = self.teamscores(team_ids)
+            populate_opponents([ts.debate_team for ts in teamscores])
+        else:
+            teamscores = self.teamscores(team_ids, prefetch_related=(
+                Prefetch('debate_team__debate__debateteam_set', queryset=DebateTeam.objects.select_related('team')),))
+
+        results = {}
+        for ts in teamscores:
+            team_results = results.setdefault(ts.debate_team.team_id, [None] * len(self.rounds))
+            team_results[self.round_indices[ts.debate_team.debate.round_id]] = ts
+        return results
+
+    def speaker_scores(self, speaker_ids=None, positions=None):
+        """Returns a dict mapping speaker IDs to lists of scores, one for each
+        round (in the same order as `rounds`), not including ghost scores.
+        Elements are None for rounds without a score. If `positions` is given,
+        only scores in those positions are included."""
+        speaker_scores = SpeakerScore.objects.filter(
+            ballot_submission__confirmed=True,
+            debate_team__debate__round__in=self.rounds,
+            ghost=False,
+        )
+        if speaker_ids is not None:
+            speaker_scores = speaker_scores.filter(speaker_id__in=speaker_ids)
+        if positions is not None:
+            speaker_scores = speaker_scores.filter(position__in=positions)
+
+        scores = {}
+        for speaker_id, round_id, score in speaker_scores.values_list(
+                'speaker_id', 'debate_team__debate__round_id', 'score'):
+            speaker_results = scores.setdefault(speaker_id, [None] * len(self.rounds))
+            speaker_results[self.round_indices[round_id]] = score
+        return scores
+
+
+def add_team_round_results(standings, rounds, opponents=False, id_attr='instance_id'):
     """Sets, on each item `info` in `standings`, an attribute
     `info.round_results` to be a list of `TeamScore` objects, one for each round
     in `rounds` (in the same order), relating to the team associated with that
@@ -18,36 +93,14 @@ def add_team_round_results(standings, rounds, opponents=False, lookup=None, id_a
     If, for some team and round, there is no relevant `TeamScore`, then the
     corresponding element of `info.round_results` will be `None`.
 
-    If `lookup` is given, it should be a function that takes two arguments
-    `(standings, x)` and returns the element in `standings` relating to the
-    `Team` object `x`.  By default, it just uses `standings.get_standings(x)`.
+    `id_attr` is the attribute of each item in `standings` holding the ID of
+    its team.
     """
-
-    if lookup is None:
-        def lookup(standings, x):
-            return standings.get_standing(x)
-
     team_ids = [getattr(info, id_attr) for info in standings]
-    teamscores = TeamScore.objects.select_related(
-        'debate_team__team', 'debate_team__debate__round').filter(
-        ballot_submission__confirmed=True,
-        debate_team__debate__round__in=rounds,
-        debate_team__team_id__in=team_ids,
-    )
-
-    if opponents:
-        populate_opponents([ts.debate_team for ts in teamscores])
-    else:
-        teamscores = teamscores.prefetch_related(
-            Prefetch('debate_team__debate__debateteam_set', queryset=DebateTeam.objects.select_related('team')))
+    results = RoundScoreboard(rounds).team_results(team_ids, opponents=opponents)
 
     for info in standings:
-        info.round_results = [None] * len(rounds)
-
-    round_lookup = {r: i for i, r in enumerate(rounds)}
-    for ts in teamscores:
-        info = lookup(standings, ts.debate_team.team)
-        info.round_results[round_lookup[ts.debate_team.debate.round]] = ts
+        info.round_results = results.get(getattr(info, id_attr)) or [None] * len(rounds)
 
 
 def add_team_round_results_public(teams, rounds, opponents=False):
@@ -57,8 +110,7 @@ def add_team_round_results_public(teams, rounds, opponents=False):
       - `t.points`, the number of points that team has from the rounds in
         `rounds`.
     """
-    add_team_round_results(teams, rounds, opponents=opponents,
-        lookup=(lambda teams, x: [t for t in teams if t == x][0]), id_attr='id')
+    add_team_round_results(teams, rounds, opponents=opponents, id_attr='id')
     for team in teams:
         team.points = sum([(ts.points or 0) * ts.debate_team.debate.round.weight for ts in team.round_results if ts is not None])
 
@@ -71,21 +123,13 @@ def add_speaker_round_results(standings, rounds, tournament, replies=False):
     element will be `None`.
     """
 
-    speaker_ids = [info.instance_id for info in standings]
-    speaker_scores = SpeakerScore.objects.select_related('speaker',
-        'ballot_submission', 'debate_team__debate__round').filter(
-        ballot_submission__confirmed=True, debate_team__debate__round__in=rounds,
-        speaker_id__in=speaker_ids, ghost=False)
-
     if replies:
-        speaker_scores = speaker_scores.filter(position=tournament.reply_position)
+        positions = [tournament.reply_position]
     else:
-        speaker_scores = speaker_scores.filter(position__lte=tournament.last_substantive_position)
+        positions = range(1, tournament.last_substantive_position + 1)
 
-    for info in standings:
-        info.scores = [None] * len(rounds)
+    speaker_ids = [info.instance_id for info in standings]
+    scores = RoundScoreboard(rounds).speaker_scores(speaker_ids, positions=positions)
 
-    round_lookup = {r: i for i, r in enumerate(rounds)}
-    for ss in speaker_scores:
-        info = standings.get_standing(ss.speaker)
-        info.scores[round_lookup[ss.debate_team.debate.round]] = ss.score
+    for info in standings:
+        info.scores = scores.get(info.instance_id) or [None] * len(rounds)
@@ -171,38 +171,59 @@ class AverageIndividualScoreMetricAnnotator(TeamScoreQuerySetMetricAnnotator):
         return super().get_annotated_queryset(queryset, round)
 
 
+def get_opponents(queryset, standings, round=None):
+    """Returns a dict mapping the ID of each team in `standings` to a list of
+    the IDs of its opponents in preliminary rounds (up to and including `round`,
+    if given), with an opponent repeated if faced more than once.
+
+    The result is stored on `standings`, so that when several draw strength
+    metrics are used, they share a single opponents query."""
+
+    if getattr(standings, '_opponents', None) is not None:
+        return standings._opponents
+
+    logger.info("Running opponents query for draw strength:")
+
+    opponents_filter = ~Q(debateteam__debate__debateteam__team_id=F('id'))
+    opponents_filter &= Q(debateteam__debate__round__stage=Round.Stage.PRELIMINARY)
+    if round is not None:
+        opponents_filter &= Q(debateteam__debate__round__seq__lte=round.seq)
+    opponents_annotation = ArrayAgg('debateteam__debate__debateteam__team_id',
+            filter=opponents_filter)
+    logger.info("Opponents annotation: %s", str(opponents_annotation))
+
+    # Use a fresh queryset, as `queryset` may already have aggregations that would interfere
+    teams_with_opponents = queryset.model.objects.filter(
+        id__in=[info.instance_id for info in standings.infoview()],
+    ).annotate(opponent_ids=opponents_annotation).values_list('id', 'opponent_ids')
+
+    standings._opponents = {team_id: opponent_ids or [] for team_id, opponent_ids in teams_with_opponents}
+    return standings._opponents
+
+
 class BaseDrawStrengthMetricAnnotator(BaseMetricAnnotator):
 
     opponent_annotator = None
 
+    def get_opponent_metrics(self, model, opponents, round=None):
+        """Returns a dict mapping team IDs to the opponent metric, for every
+        team that appears as an opponent in `opponents`."""
+        opponent_ids = {opponent_id for opponent_ids in opponents.values() for opponent_id in opponent_ids}
+        annotator = self.opponent_annotator()
+        queryset = annotator.get_annotated_queryset(model.objects.filter(id__in=opponent_ids), round)
+        return dict(queryset.values_list('id', annotator.key))
+
     def annotate(self, queryset, standings, round=None):
-        if not queryset.exists():
+        if not standings.infos:
             return
 
-        logger.info("Running opponents query for draw strength:")
+        opponents = get_opponents(queryset, standings, round)
+        opp_metrics = self.get_opponent_metrics(queryset.model, opponents, round)
 
-        # Make a copy of teams queryset and annotate with opponents
-        opponents_filter = ~Q(debateteam__debate__debateteam__team_id=F('id'))
-        opponents_filter &= Q(debateteam__debate__round__stage=Round.Stage.PRELIMINARY)
-        if round is not None:
-            opponents_filter &= Q(debateteam__debate__round__seq__lte=round.seq)
-        opponents_annotation = ArrayAgg('debateteam__debate__debateteam__team_id',
-                filter=opponents_filter)
-        logger.info("Opponents annotation: %s", str(opponents_annotation))
-        teams_with_opponents = queryset.model.objects.annotate(opponent_ids=opponents_annotation)
-        opponents_by_team = {team.id: team.opponent_ids or [] for team in teams_with_opponents}
-
-        opp_metric_queryset = self.opponent_annotator().get_annotated_queryset(
-                queryset[0].tournament.team_set.all(), round)
-        opp_metric_queryset_teams = {team.id: team for team in opp_metric_queryset}
-
-        for team in queryset:
-            draw_strength = 0
-            for opponent_id in opponents_by_team[team.id]:
-                opp_metric = getattr(opp_metric_queryset_teams[opponent_id], self.opponent_annotator.key)
-                if opp_metric is not None: # opp_metric is None when no debates have happened
-                    draw_strength += opp_metric
-            standings.add_metric(team, self.key, draw_strength)
+        for info in standings.infoview():
+            # opp_metric is None when no debates have happened
+            draw_strength = sum(opp_metrics[opponent_id] or 0 for opponent_id in opponents[info.instance_id])
+            standings.add_metric(info.instance, self.key, draw_strength)
 
 
 class DrawStrengthByRankMetricAnnotator(BaseMetricAnnotator):
@@ -214,27 +235,15 @@ class DrawStrengthByRankMetricAnnotator(BaseMetricAnnotator):
     extra_only = True  # Cannot rank based on ranking
 
     def annotate(self, queryset, standings, round=None):
-        if not queryset.exists():
+        if not standings.infos:
             return
 
-        logger.info("Running opponents query for rank draw strength:")
-
-        # Make a copy of teams queryset and annotate with opponents
-        opponents_filter = ~Q(debateteam__debate__debateteam__team_id=F('id'))
-        opponents_filter &= Q(debateteam__debate__round__stage=Round.Stage.PRELIMINARY)
-        if round is not None:
-            opponents_filter &= Q(debateteam__debate__round__seq__lte=round.seq)
-        opponents_annotation = ArrayAgg('debateteam__debate__debateteam__team_id',
-                filter=opponents_filter)
-        logger.info("Opponents annotation: %s", str(opponents_annotation))
-        teams_with_opponents = queryset.model.objects.annotate(opponent_ids=opponents_annotation)
-        opponents_by_team = {team.id: team.opponent_ids or [] for team in teams_with_opponents}
-        teams_by_id = {team.id: team for team in teams_with_opponents}
+        opponents = get_opponents(queryset, standings, round)
+        ranks = {info.instance_id: info.get_ranking('rank') for info in standings.infoview()}
 
-        for team in queryset:
-            ranks = [standings.infos[teams_by_id[opponent_id]].rankings['rank'][0] for opponent_id in opponents_by_team[team.id]]
-            ranks_without_none = [rank for rank in ranks if rank is not None]
-            standings.add_metric(team, self.key, sum(ranks_without_none))
+        for info in standings.infoview():
+            opponent_ranks = [ranks.get(opponent_id) for opponent_id in opponents[info.instance_id]]
+            standings.add_metric(info.instance, self.key, sum(rank for rank in opponent_ranks if rank is not None))
 
 
 class DrawStrengthByWinsMetricAnnotator(BaseDrawStrengthMetricAnnotator):
@@ -372,39 +381,64 @@ class WhoBeatWhomMetricAnnotator(RepeatedMetricAnnotator):
     abbr_prefix = _("WBW")
     choice_name = _("who-beat-whom")
 
-    def get_team_scores(self, key, equal_teams, tsi, round):
-        equal_teams.remove(tsi)
-        other = equal_teams[0]
+    max_tied = 2  # groups of tied teams larger than this aren't compared
+
+    def is_comparable(self, group):
+        return len(group) >= 2 and (self.max_tied is None or len(group) <= self.max_tied)
+
+    def get_head_to_head_points(self, team_ids, round):
+        """Returns a dict mapping (team ID, opponent ID) tuples to the total
+        points that team has earned in debates against that opponent, for all
+        pairs of teams in `team_ids` that have met. Uses a single query."""
         ts = TeamScore.objects.filter(
             ballot_submission__confirmed=True,
-            debate_team__team=tsi.team,
-            debate_team__debate__debateteam__team=other.team,
+            debate_team__team_id__in=team_ids,
+            debate_team__debate__debateteam__team_id__in=team_ids,
             debate_team__debate__round__stage=Round.Stage.PRELIMINARY,
         )
 
         if round is not None:
             ts = ts.filter(debate_team__debate__round__seq__lte=round.seq)
 
-        ts = ts.aggregate(Sum('points'))
-        logger.info("who beat whom, %s %s vs %s %s: %s",
-            tsi.team.short_name, key(tsi), other.team.short_name, key(other),
-            ts["points__sum"])
-        return ts
+        ts = ts.values_list('debate_team__team_id', 'debate_team__debate__debateteam__team_id').annotate(Sum('points'))
+        return {(team_id, opponent_id): points or 0 for team_id, opponent_id, points in ts if team_id != opponent_id}
 
     def annotate(self, queryset, standings, round=None):
         key = metricgetter(self.keys)
 
-        def who_beat_whom(tsi):
-            equal_teams = [x for x in standings.infoview() if key(x) == key(tsi)]
-            if len(equal_teams) != 2:
-                return "n/a"  # fail fast if attempt to compare with an int
+        groups = {}
+        for tsi in standings.infoview():
+            groups.setdefault(key(tsi), []).append(tsi)
 
-            ts = self.get_team_scores(key, equal_teams, tsi, round)
-            return ts["points__sum"] or 0
+        untied_groups = [group for group in groups.values() if not self.is_comparable(group)]
+        tied_groups = [group for group in groups.values() if self.is_comparable(group)]
 
-        for tsi in standings.infoview():
-            wbw = who_beat_whom(tsi)
-            tsi.add_metric(self.key, wbw)
+        for group in untied_groups:
+            for tsi in group:
+                tsi.add_metric(self.key, "n/a")  # fail fast if attempt to compare with an int
+
+        team_ids = [tsi.instance_id for group in tied_groups for tsi in group]
+        points = self.get_head_to_head_points(team_ids, round) if team_ids else {}
+
+        for group in tied_groups:
+            for tsi in group:
+                wbw = sum(points.get((tsi.instance_id, other.instance_id), 0) for other in group if other is not tsi)
+                logger.info("who beat whom, %s %s vs %s: %s", tsi.team.short_name, key(tsi),
+                    ", ".join(other.team.short_name for other in group if other is not tsi), wbw)
+                tsi.add_metric(self.key, wbw)
+
+
+class WhoBeatWhomLeagueMetricAnnotator(WhoBeatWhomMetricAnnotator):
+    """Metric annotator for who-beat-whom among any number of tied teams, in
+    which each team's points against all other tied teams are added up as in a
+    mini-league."""
+
+    key_prefix = "wbwl"
+    name_prefix = _("Mini-league who-beat-whom")
+    abbr_prefix = _("WBWL")
+    choice_name = _("who-beat-whom (mini-league)")
+
+    max_tied = None
 
 
 # ==============================================================================
@@ -450,6 +484,7 @@ class TeamStandingsGenerator(BaseStandingsGenerator):
         "thirds"              : NumberOfThirdsMetricAnnotator,
         "num_iron"            : IronsMetricAnnotator,
         "wbw"                 : WhoBeatWhomMetricAnnotator,
+        "wbw_league"          : WhoBeatWhomLeagueMetricAnnotator,
     }
 
     ranking_annotator_classes = {
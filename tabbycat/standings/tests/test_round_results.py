@@ -0,0 +1,34 @@
+from django.test import TestCase
+
+from results.models import SpeakerScore, TeamScore
+from standings.round_results import RoundScoreboard
+from utils.tests import CompletedTournamentTestMixin
+
+
+class RoundScoreboardTests(CompletedTournamentTestMixin, TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.rounds = list(self.tournament.prelim_rounds())
+        self.scoreboard = RoundScoreboard(self.rounds)
+
+    def test_team_results(self):
+        results = self.scoreboard.team_results()
+        for ts in TeamScore.objects.filter(ballot_submission__confirmed=True,
+                debate_team__debate__round__in=self.rounds).select_related('debate_team__debate__round'):
+            index = self.rounds.index(ts.debate_team.debate.round)
+            self.assertEqual(results[ts.debate_team.team_id][index].id, ts.id)
+            self.assertEqual(results[ts.debate_team.team_id][index].debate_team.debate.round, self.rounds[index])
+
+    def test_speaker_scores(self):
+        scores = self.scoreboard.speaker_scores(positions=[1])
+        for ss in SpeakerScore.objects.filter(ballot_submission__confirmed=True, ghost=False, position=1,
+                debate_team__debate__round__in=self.rounds).select_related('debate_team__debate__round'):
+            index = self.rounds.index(ss.debate_team.debate.round)
+            self.assertEqual(scores[ss.speaker_id][index], ss.score)
+
+    def test_one_query_per_kind(self):
+        with self.assertNumQueries(1):
+            self.scoreboard.teamscores()
+        with self.assertNumQueries(1):
+            self.scoreboard.speaker_scores()
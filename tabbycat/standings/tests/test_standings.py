@@ -1,13 +1,16 @@
 import logging
 
+from django.contrib import admin
 from django.test import TestCase
 
 from adjallocation.models import DebateAdjudicator
 from draw.models import Debate, DebateTeam
 from draw.types import DebateSide
 from participants.models import Adjudicator, Institution, Speaker, Team
+from results.admin import BallotSubmissionAdmin, TeamScoreAdmin
 from results.models import BallotSubmission, SpeakerScore, TeamScore
 from tournaments.models import Round, Tournament
+from tournaments.utils import get_cache_version
 from utils.tests import suppress_logs
 from venues.models import Venue
 
@@ -142,6 +145,12 @@ class TestTrivialStandings(TestCase):
         # first metric, allowing wbw to be tested as a second metric (the normal use case)
         self._base_metric_test({'firsts': [0, 0], 'wbw': {'wbw1': [2, 0]}})
 
+    def test_wbw_league_tied(self):
+        self._base_metric_test({'firsts': [0, 0], 'wbw_league': {'wbwl1': [2, 0]}})
+
+    def test_wbw_league_not_tied(self):
+        self._base_metric_test({'points': [2, 0], 'wbw_league': {'wbwl1': ['n/a', 'n/a']}})
+
     def test_npullups(self):
         self._base_metric_test({'npullups': [2, 0]})
 
@@ -206,6 +215,48 @@ class TestTrivialStandings(TestCase):
         self.set_up_speaker_scores(2)
         self._base_metric_test({'wins': [2, 0], 'speaks_ind_avg': [101.5, 98.5]})
 
+    def test_cached_standings(self):
+        generator = TeamStandingsGenerator(('points', 'speaks_sum'), ('rank',), extra_metrics=('margin_sum',))
+        standings = self.get_standings(generator)
+        with self.assertNumQueries(1):  # only to fetch the teams
+            cached = self.get_standings(generator)
+        self.assertEqual([info.team for info in cached], [info.team for info in standings])
+        self.assertEqual(list(cached.metrics_info()), list(standings.metrics_info()))
+        for team in [self.team1, self.team2]:
+            self.assertEqual(cached.get_standing(team).metrics, standings.get_standing(team).metrics)
+            self.assertEqual(cached.get_standing(team).rankings, standings.get_standing(team).rankings)
+
+    def assertResultsVersionChanged(self, func):  # noqa: N802
+        version = get_cache_version(self.tournament, 'results')
+        with self.captureOnCommitCallbacks(execute=True):
+            func()
+        self.assertNotEqual(get_cache_version(self.tournament, 'results'), version)
+
+    def test_cache_invalidated_by_admin_edits(self):
+        teamscore_admin = TeamScoreAdmin(TeamScore, admin.site)
+        teamscore = TeamScore.objects.filter(debate_team__team=self.team2).first()
+        teamscore.points = 1
+        self.assertResultsVersionChanged(lambda: teamscore_admin.save_model(None, teamscore, None, True))
+        self.assertResultsVersionChanged(lambda: teamscore_admin.delete_model(None, teamscore))
+
+        ballotsub_admin = BallotSubmissionAdmin(BallotSubmission, admin.site)
+        self.assertResultsVersionChanged(lambda: ballotsub_admin.delete_queryset(None, BallotSubmission.objects.all()))
+
+    def test_cache_not_invalidated_by_score_saves(self):
+        # ballot entry bumps the version once, when the ballot submission is saved
+        teamscore = TeamScore.objects.filter(debate_team__team=self.team2).first()
+        version = get_cache_version(self.tournament, 'results')
+        with self.captureOnCommitCallbacks(execute=True):
+            teamscore.save()
+        self.assertEqual(get_cache_version(self.tournament, 'results'), version)
+
+    def test_cache_invalidated_by_participant_changes(self):
+        speaker = Speaker.objects.create(team=self.team1, name="Speaker")
+        speaker.team = self.team2
+        self.assertResultsVersionChanged(speaker.save)
+        self.team1.reference = "renamed"
+        self.assertResultsVersionChanged(self.team1.save)
+
 
 class IgnorableDebateMixin:
 
@@ -362,6 +413,27 @@ class TestBasicStandings(TestCase):
                     ranked_teams = [teams[x] for x in testdata["rankings"][metrics]]
                     self.assertEqual(ranked_teams, standings.get_instance_list())
 
+    def test_wbw_league_three_way_tie(self):
+        # A, C and D are tied on two points. A lost to C and didn't meet D, C
+        # and D beat each other once each, so the mini-league is C, D, A.
+        # Plain who-beat-whom doesn't compare groups of more than two.
+        tournament, teams = self.setup_testdata(self.testdata[1])
+        expected = {
+            ('points', 'wbw_league'): ({'A': 0, 'B': 'n/a', 'C': 2, 'D': 1}, ['C', 'D', 'A', 'B']),
+            ('points', 'wbw'): ({'A': 'n/a', 'B': 'n/a', 'C': 'n/a', 'D': 'n/a'}, None),
+        }
+        for metrics, (values, ranking) in expected.items():
+            with self.subTest(metrics=metrics):
+                generator = TeamStandingsGenerator(metrics, self.rankings)
+                with suppress_logs('standings.teams', logging.INFO), \
+                        suppress_logs('standings.metrics', logging.INFO):
+                    standings = generator.generate(tournament.team_set.all(), tournament=tournament)
+                key = standings.metric_keys[1]
+                for teamname, value in values.items():
+                    self.assertEqual(standings.get_standing(teams[teamname]).metrics[key], value)
+                if ranking is not None:
+                    self.assertEqual([teams[x] for x in ranking], standings.get_instance_list())
+
     # TODO check that WBW is correct when not in first metrics
     # TODO check that it doesn't break when not all metrics present
     # TODO check that it works for different rounds
@@ -137,6 +137,7 @@ class BaseStandingsView(RoundMixin, VueTableTemplateView):
 class PublicTabMixin(PublicTournamentPageMixin):
     """Mixin for views that should only be allowed when the tab is released publicly."""
     cache_timeout = settings.TAB_PAGES_CACHE_TIMEOUT
+    cache_versions = ('results', 'preferences')
 
     def get_page_subtitle(self):
         return None
@@ -563,6 +564,7 @@ class PublicCurrentTeamStandingsView(PublicTournamentPageMixin, VueTableTemplate
     page_title = gettext_lazy("Current Team Standings")
     page_emoji = '🌟'
     cache_timeout = settings.PUBLIC_SLOW_CACHE_TIMEOUT
+    cache_versions = ('results', 'preferences')
 
     def get_rounds(self):
         if not hasattr(self, '_rounds'):
@@ -645,6 +647,7 @@ class PublicAdjudicatorsTabView(PublicTabMixin, BaseFeedbackOverview):
     public_page_preference = 'adjudicators_tab_released'
     page_title = gettext_lazy('Feedback Overview')
     page_emoji = '🙅'
+    cache_versions = ()  # feedback doesn't change the results version
     for_public = False
     sort_key = 'name'
     sort_order = 'asc'
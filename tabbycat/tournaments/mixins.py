@@ -16,7 +16,7 @@ from django.views.generic.base import ContextMixin
 from django.views.generic.detail import SingleObjectMixin
 
 from adjallocation.models import DebateAdjudicator
-from breakqual.utils import calculate_live_thresholds
+from breakqual.utils import get_live_thresholds
 from draw.models import DebateTeam, MultipleDebateTeamsError, NoDebateTeamFoundError
 from draw.types import DebateSide
 from participants.models import Institution, Speaker
@@ -422,9 +422,10 @@ class DragAndDropMixin(RoundMixin):
         extra_info['highlights'] = {}
 
         bcs = self.tournament.breakcategory_set.all()
+        thresholds = get_live_thresholds(self.round)
         serialised_bcs = []
         for bc in bcs:
-            safe, dead = calculate_live_thresholds(bc, self.tournament, self.round)
+            safe, dead = thresholds.get(bc.id, (None, None))
             serialised_bc = {
                 'pk': bc.id,
                 'fields': {'name': bc.name, 'safe': safe, 'dead': dead},
@@ -5,6 +5,7 @@ from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from tournaments.models import Round, Tournament
+from tournaments.utils import bump_cache_version, bump_later_history_cache_versions
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +22,14 @@ def update_round_cache(sender, instance, **kwargs):
     cache.delete(cached_key)
     logger.debug("Cleared cache %s for %s" % (cached_key, instance))
 
+    # Round weights, stages and draws all affect standings, and draw statuses
+    # (and deleting rounds along with their debates) affect draws
+    bump_cache_version(instance.tournament, 'results')
+    bump_cache_version(instance.tournament, 'draw')
+
+    if kwargs['signal'] is post_delete:
+        bump_later_history_cache_versions(instance)  # its debates are gone too
+
     # Update the tournament cache as well if either this is the current round,
     # or the current round is None (this might mean the current round was deleted).
     current_round_id = getattr(instance.tournament.current_round, 'id', None)
@@ -1,9 +1,12 @@
 import logging
+import time
 
+from django.core.cache import cache
+from django.db import transaction
 from django.utils.encoding import force_str
 from django.utils.translation import gettext, gettext_lazy as _, pgettext_lazy
 
-from .models import Round
+from .models import Round, Tournament
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +77,65 @@ BP_SIDE_NAMES = {  # stop-gap before this system gets refactored
 }
 
 
+def _cache_version_key(instance, kind):
+    if instance is None:
+        return "%s_version" % kind
+    return "%s_%d_%s_version" % (instance._meta.model_name, instance.pk, kind)
+
+
+def get_cache_version(instance, kind):
+    """Returns a version number for the data of the given `kind` (e.g.
+    "results") relating to `instance`, a tournament or round (or None for data
+    not specific to any tournament), for use in cache keys. The version is
+    changed by `bump_cache_version()` whenever the data changes, so cached
+    entries keyed on it never need to expire.
+
+    Versions are seeded from the clock, so that if the version is evicted from
+    the cache, the new version is still greater than any old one."""
+    return cache.get_or_set(_cache_version_key(instance, kind), time.time_ns, None)
+
+
+def bump_cache_version(instance, kind):
+    """Changes the version returned by `get_cache_version()` once the current
+    transaction commits, so that anything recomputed after that sees the new
+    data."""
+    key = _cache_version_key(instance, kind)
+
+    def bump():
+        try:
+            cache.incr(key)
+        except ValueError:  # not in cache
+            cache.set(key, time.time_ns(), None)
+        logger.debug("Bumped cache version %s", key)
+
+    transaction.on_commit(bump)
+
+
+def bump_cache_version_where(kind, *args, **kwargs):
+    """Calls `bump_cache_version()` for every tournament matching the given
+    filter arguments. Signal receivers use this to find tournaments by ID,
+    since in cascading deletions, related objects might already be gone (in
+    which case there's nothing left to invalidate)."""
+    for tournament in Tournament.objects.filter(*args, **kwargs).distinct():
+        bump_cache_version(tournament, kind)
+
+
+def bump_draw_cache_version(round):
+    """Bumps the draw cache version for the round's tournament. Debates, debate
+    teams and debate adjudicators are written in bulk and by many rows at a
+    time, so they aren't watched by signal receivers (see `draw.signals`);
+    code that changes them calls this once it's done instead."""
+    bump_cache_version(round.tournament, 'draw')
+    bump_later_history_cache_versions(round)
+
+
+def bump_later_history_cache_versions(round):
+    """Bumps the history version of every round after `round`, since their
+    histories (see `adjallocation.conflicts.HistoryInfo`) include its debates."""
+    for later_round in Round.objects.filter(tournament_id=round.tournament_id, seq__gt=round.seq).only('id'):
+        bump_cache_version(later_round, 'history')
+
+
 def auto_make_rounds(tournament, num_rounds):
     """Makes the number of rounds specified. The first one is random and the
     rest are all power-paired. The last third of rounds (rounded down) are silent.
@@ -2,6 +2,8 @@ from django.contrib import admin
 from django.contrib.admin.options import get_content_type_for_model
 from django.utils.translation import gettext_lazy as _
 
+from tournaments.utils import bump_cache_version_where
+
 from .misc import get_ip_address
 
 """ General utilities for extending filters/lists in the admin area """
@@ -39,6 +41,35 @@ class ModelAdmin(admin.ModelAdmin):
         )
 
 
+class CacheVersionsAdminMixin:
+    """Bumps cache versions (see `tournaments.utils.get_cache_version()`) of
+    the tournaments affected by edits in the admin site. This is for models
+    that are written too often elsewhere to bump versions in signal receivers,
+    which would cost a query for every row saved or deleted.
+
+    `cache_versions` lists the kinds of version to bump, and
+    `tournament_lookup` is the lookup from `Tournament` to the model."""
+
+    cache_versions = ()
+    tournament_lookup = None
+
+    def bump_cache_versions(self, objects):
+        for kind in self.cache_versions:
+            bump_cache_version_where(kind, **{self.tournament_lookup + '__in': objects})
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        self.bump_cache_versions([obj])
+
+    def delete_model(self, request, obj):
+        self.bump_cache_versions([obj])  # while the tournament can still be found
+        super().delete_model(request, obj)
+
+    def delete_queryset(self, request, queryset):
+        self.bump_cache_versions(queryset)
+        super().delete_queryset(request, queryset)
+
+
 class TabbycatModelAdminFieldsMixin:
 
     @admin.display(description=_("Round"))
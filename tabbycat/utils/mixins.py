@@ -1,14 +1,18 @@
+import hashlib
 import logging
 import os
+import time
 from typing import Optional, TYPE_CHECKING
 
 from django.conf import settings
 from django.contrib.auth.mixins import UserPassesTestMixin
+from django.core.cache import cache
 from django.db import connection
-from django.utils.decorators import method_decorator
+from django.utils.cache import get_cache_key, has_vary_header
 from django.views.decorators.cache import cache_page
 from django.views.generic.base import ContextMixin
 
+from tournaments.utils import get_cache_version
 from users.permissions import has_permission
 
 if TYPE_CHECKING:
@@ -162,11 +166,94 @@ class WarnAboutLegacySendgridConfigVarsMixin(ContextMixin):
         return super().get_context_data(**kwargs)
 
 
+class PageBeingGeneratedError(Exception):
+    """Raised (and caught) by CacheMixin when another worker is already
+    generating the requested page."""
+    pass
+
+
 class CacheMixin:
-    """Mixin for views that cache the page and need to update quickly."""
+    """Mixin for views that cache the page and need to update quickly.
+
+    Views that set `cache_versions` to a list of kinds of tournament data (see
+    `tournaments.utils.get_cache_version()`) are instead cached under a key
+    that includes the current versions of that data. These pages are cached
+    for much longer, since they're regenerated as soon as that data changes.
+
+    Only one worker generates an uncached page at a time. Others requesting the
+    same page wait for it to be cached (up to `PUBLIC_CACHE_LOCK_TIMEOUT`
+    seconds, but never more than `cache_lock_max_wait`, after which they
+    generate it themselves), so that a burst of requests just after (say) a
+    draw is released doesn't generate the same page many times over. If the
+    page turns out not to be cacheable (e.g. it's an error or a redirect),
+    nobody waits for it for a while."""
 
     cache_timeout = settings.PUBLIC_FAST_CACHE_TIMEOUT
+    cache_versions = ()
+    cache_lock_poll_interval = 0.2
+    cache_lock_max_wait = 10  # well below the 30-second gunicorn and Heroku timeouts
+
+    def get_cache_key_prefix(self):
+        return "_".join("%s%d" % (kind, get_cache_version(self.tournament, kind)) for kind in self.cache_versions)
 
-    @method_decorator(cache_page(cache_timeout))
-    def dispatch(self, *args, **kwargs):
-        return super().dispatch(*args, **kwargs)
+    def dispatch(self, request, *args, **kwargs):
+        if self.cache_versions:
+            key_prefix = self.get_cache_key_prefix()
+            decorator = cache_page(settings.TAB_PAGES_CACHE_TIMEOUT, key_prefix=key_prefix)
+        else:
+            key_prefix = None
+            decorator = cache_page(self.cache_timeout)
+
+        lock_timeout = min(settings.PUBLIC_CACHE_LOCK_TIMEOUT, self.cache_lock_max_wait)
+        deadline = time.monotonic() + lock_timeout
+        lock_key = None
+        locked = False
+
+        def generate(request, *args, **kwargs):
+            # Only called by cache_page() if the page isn't in the cache
+            nonlocal lock_key, locked
+            if request.method in ('GET', 'HEAD') and time.monotonic() < deadline:
+                # Use the page's cache key if known, so that requests that are
+                # cached separately (e.g. by cookie) don't wait for each other
+                page_key = get_cache_key(request, key_prefix) or request.build_absolute_uri()
+                lock_key = "page_lock_%s" % hashlib.sha1(page_key.encode()).hexdigest()
+                if cache.get(lock_key) != 'uncacheable':
+                    locked = cache.add(lock_key, 'generating', lock_timeout)
+                    if not locked:
+                        raise PageBeingGeneratedError
+            return super(CacheMixin, self).dispatch(request, *args, **kwargs)
+
+        view = decorator(generate)
+        try:
+            while True:
+                try:
+                    response = view(request, *args, **kwargs)
+                    break
+                except PageBeingGeneratedError:
+                    time.sleep(self.cache_lock_poll_interval)
+        except Exception:
+            if locked:
+                cache.delete(lock_key)
+            raise
+
+        if locked:
+            if not self.is_cacheable(request, response):
+                # Requests waiting for this page would wait in vain, so let them
+                # (and others for a while) generate it themselves straight away
+                cache.set(lock_key, 'uncacheable', lock_timeout)
+            # cache_page() caches template responses after they're rendered, so
+            # release the lock only after that
+            elif getattr(response, 'is_rendered', True):
+                cache.delete(lock_key)
+            else:
+                response.add_post_render_callback(lambda response: cache.delete(lock_key))
+        return response
+
+    def is_cacheable(self, request, response):
+        """Returns whether `cache_page()` will cache the response, making the
+        same checks as `django.middleware.cache.UpdateCacheMiddleware`."""
+        if response.streaming or response.status_code not in (200, 304):
+            return False
+        if not request.COOKIES and response.cookies and has_vary_header(response, 'Cookie'):
+            return False
+        return 'private' not in response.get('Cache-Control', ())
@@ -11,6 +11,7 @@ from django.urls import reverse
 from selenium.webdriver.chrome.webdriver import WebDriver
 from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
 
+from adjfeedback.aggregates import rebuild_feedback_aggregates
 from draw.models import DebateTeam
 from participants.models import Adjudicator, Institution, Speaker, Team
 from tournaments.models import Tournament
@@ -53,6 +54,13 @@ class CompletedTournamentTestMixin:
     round_seq = None
     use_post = False
 
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Loading fixtures doesn't update feedback aggregates
+        for tournament in Tournament.objects.all():
+            rebuild_feedback_aggregates(tournament)
+
     def get_tournament(self):
         return Tournament.objects.first()
 
@@ -4,17 +4,19 @@ from django.contrib.contenttypes.admin import GenericTabularInline
 from gfklookupwidget.widgets import GfkLookupWidget
 
 from availability.admin import RoundAvailabilityInline
-from utils.admin import ModelAdmin
+from utils.admin import CacheVersionsAdminMixin, ModelAdmin
 
 from .models import Venue, VenueCategory, VenueConstraint
 
 
 @admin.register(Venue)
-class VenueAdmin(ModelAdmin):
+class VenueAdmin(CacheVersionsAdminMixin, ModelAdmin):
     list_display = ('display_name', 'priority', 'tournament', 'categories_list')
     list_filter = ('venuecategory', 'priority', 'tournament')
     search_fields = ('name',)
     inlines = (RoundAvailabilityInline,)
+    cache_versions = ('draw',)  # for deletions; saves are covered by draw.signals
+    tournament_lookup = 'round__debate__venue'
 
     def categories_list(self, obj):
         return ", ".join([c.name for c in obj.venuecategory_set.all()])
@@ -25,10 +27,12 @@ class VenueAdmin(ModelAdmin):
 
 
 @admin.register(VenueCategory)
-class VenueCategoryAdmin(ModelAdmin):
+class VenueCategoryAdmin(CacheVersionsAdminMixin, ModelAdmin):
     list_display = ('name', 'description', 'display_in_venue_name',
             'display_in_public_tooltip', 'venues_list')
     ordering = ('name',)
+    cache_versions = ('draw',)  # for deletions; saves are covered by draw.signals
+    tournament_lookup = 'round__debate__venue__venuecategory'
 
     def venues_list(self, obj):
         return ", ".join([v.name for v in obj.venues.all()])
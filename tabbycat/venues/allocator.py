@@ -3,6 +3,14 @@ import logging
 import random
 
 from django.db.models import Q
+from munkres import Munkres
+
+try:
+    import numpy as np
+    from scipy.optimize import linear_sum_assignment
+except ImportError:
+    np = None
+    linear_sum_assignment = None
 
 from draw.models import Debate
 from draw.types import DebateSide
@@ -13,7 +21,8 @@ logger = logging.getLogger(__name__)
 
 
 def allocate_venues(round, debates=None):
-    allocator = VenueAllocator()
+    klass = VENUE_ALLOCATORS[round.tournament.pref('venue_allocation_method')]
+    allocator = klass()
     allocator.allocate(round, debates)
 
 
@@ -64,7 +73,7 @@ class VenueAllocator:
         relating to the teams, adjudicators, and institutions of the debate."""
 
         all_constraints = {}
-        for vc in VenueConstraint.objects.filter_for_debates(debates).prefetch_related('subject'):
+        for vc in VenueConstraint.objects.filter_for_debates(debates).prefetch_related('subject', 'category__venues'):
             all_constraints.setdefault(vc.subject, []).append(vc)
 
         debate_constraints = []
@@ -175,3 +184,81 @@ class VenueAllocator:
         for debate, venue in debate_venues.items():
             debate.venue = venue
         Debate.objects.bulk_update(debate_venues.keys(), ['venue'])
+
+
+class HungarianVenueAllocator(VenueAllocator):
+    """Allocates venues by solving an assignment problem, in which the cost of
+    putting a debate in a venue is mostly the priority of the constraints that
+    it would leave unsatisfied, plus (as a tiebreaker) how much lower the
+    venue's priority is than the highest venue priority.
+
+    As in VenueAllocator, a subject's constraints are treated as alternatives:
+    satisfying a lower-priority constraint instead of the subject's
+    highest-priority one costs the difference between their priorities.
+    Unlike VenueAllocator, the allocation is optimal with respect to this cost,
+    though higher-priority constraints no longer take absolute precedence.
+    """
+
+    def allocate(self, round, debates=None):
+        if debates is None:
+            debates = round.debate_set_with_prefetches(speakers=False, institutions=True, filter_args=[~Q(debateteam__side=DebateSide.BYE)])
+        debates = list(debates)
+        random.shuffle(debates)  # so that ties aren't broken by debate ID
+        venues = list(round.active_venues.order_by('-priority'))
+
+        if len(debates) > len(venues):
+            logger.warning("%d debates but only %d venues", len(debates), len(venues))
+
+        debate_venues = {debate: None for debate in debates}
+        if debates and venues:
+            costs = self.build_cost_matrix(debates, venues)
+            for i, j in self.solve_assignment(costs):
+                debate_venues[debates[i]] = venues[j]
+
+        self.save_venues(debate_venues)
+
+    def build_cost_matrix(self, debates, venues):
+        debate_constraints = dict(self.collect_constraints(debates))
+
+        # collect_constraints() prefetches the venues in each category
+        category_venues = {vc.category_id: {venue.id for venue in vc.category.venues.all()}
+                           for constraints in debate_constraints.values() for vc in constraints}
+
+        # Weight constraints so that satisfying one more priority point
+        # always outweighs any difference in venue priorities
+        venue_costs = [venues[0].priority - venue.priority for venue in venues]
+        weight = max(venue_costs) * len(debates) + 1
+
+        costs = []
+        for debate in debates:
+            row = list(venue_costs)
+
+            subject_constraints = {}
+            for vc in debate_constraints.get(debate, []):  # already sorted by descending priority
+                subject_constraints.setdefault((vc.subject_content_type_id, vc.subject_id), []).append(vc)
+
+            for constraints in subject_constraints.values():
+                unsatisfied = max(constraints[0].priority, 1)
+                for j, venue in enumerate(venues):
+                    penalty = unsatisfied
+                    for vc in constraints:
+                        if venue.id in category_venues.get(vc.category_id, ()):
+                            penalty = min(unsatisfied, constraints[0].priority - vc.priority)
+                            break
+                    row[j] += penalty * weight
+
+            costs.append(row)
+
+        return costs
+
+    def solve_assignment(self, costs):
+        if linear_sum_assignment is not None:
+            rows, cols = linear_sum_assignment(np.array(costs))
+            return zip(rows, cols)
+        return Munkres().compute(costs)
+
+
+VENUE_ALLOCATORS = {
+    'greedy': VenueAllocator,
+    'hungarian': HungarianVenueAllocator,
+}
@@ -0,0 +1,77 @@
+import unittest
+from unittest import mock
+
+from django.test import TestCase
+
+from draw.types import DebateSide
+from utils.tests import CompletedTournamentTestMixin
+
+from ..allocator import allocate_venues, HungarianVenueAllocator, linear_sum_assignment
+from ..models import VenueCategory, VenueConstraint
+
+
+class TestHungarianVenueAllocator(CompletedTournamentTestMixin, TestCase):
+
+    round_seq = 4
+
+    def setUp(self):
+        super().setUp()
+        self.tournament.preferences['draw_rules__venue_allocation_method'] = 'hungarian'
+        self.debates = list(self.round.debate_set.exclude(debateteam__side=DebateSide.BYE).order_by('id'))
+        self.venues = list(self.round.active_venues.order_by('-priority', 'id'))
+        VenueConstraint.objects.all().delete()
+
+        # The two lowest-priority rooms, so that unconstrained allocation wouldn't use them
+        self.wide = VenueCategory.objects.create(name="Wide", tournament=self.tournament)
+        self.wide.venues.set(self.venues[-2:])
+        self.narrow = VenueCategory.objects.create(name="Narrow", tournament=self.tournament)
+        self.narrow.venues.set(self.venues[-1:])
+
+        # The first debate is happy with either room, the second needs the
+        # last one. Allocating in order of priority alone would give the first
+        # debate a free choice of both, so could leave the second unsatisfied.
+        self.flexible, self.picky = self.debates[:2]
+        self.add_constraint(self.flexible, self.wide, 2)
+        self.add_constraint(self.picky, self.narrow, 1)
+
+    def add_constraint(self, debate, category, priority):
+        VenueConstraint.objects.create(subject=debate.teams[0], category=category, priority=priority)
+
+    def check_allocation(self):
+        debates = list(self.round.debate_set.exclude(debateteam__side=DebateSide.BYE).select_related('venue'))
+        venues = [debate.venue for debate in debates if debate.venue is not None]
+        self.assertEqual(len(venues), min(len(debates), len(self.venues)))
+        self.assertEqual(len(set(venues)), len(venues))  # no room used twice
+
+        venues_by_debate = {debate.id: debate.venue for debate in debates}
+        self.assertEqual(venues_by_debate[self.picky.id], self.venues[-1])
+        self.assertEqual(venues_by_debate[self.flexible.id], self.venues[-2])
+
+    def test_constraints_satisfied(self):
+        for i in range(5):  # debates are shuffled, so try a few times
+            with self.subTest(attempt=i):
+                allocate_venues(self.round)
+                self.check_allocation()
+
+    def test_fallback_without_scipy(self):
+        with mock.patch('venues.allocator.linear_sum_assignment', None):
+            HungarianVenueAllocator().allocate(self.round)
+        self.check_allocation()
+
+
+class TestHungarianVenueSolveAssignment(unittest.TestCase):
+
+    costs = [[0, 1, 3, 21], [20, 1, 2, 3], [0, 21, 22, 23], [0, 1, 2, 3]]
+
+    def total_cost(self, indices):
+        return sum(self.costs[i][j] for i, j in indices)
+
+    def test_munkres(self):
+        with mock.patch('venues.allocator.linear_sum_assignment', None):
+            indices = list(HungarianVenueAllocator().solve_assignment(self.costs))
+        self.assertEqual(self.total_cost(indices), 6)
+
+    @unittest.skipIf(linear_sum_assignment is None, "SciPy not installed")
+    def test_linear_sum_assignment(self):
+        indices = list(HungarianVenueAllocator().solve_assignment(self.costs))
+        self.assertEqual(self.total_cost(indices), 6)